@@ -24,6 +24,8 @@ from .pype_commands import PypeCommands
               help=("Enable debug"))
 @click.option("--verbose", expose_value=False,
               help=("Change OpenPype log level (debug - critical or 0-50)"))
+@click.option("--profile-startup", is_flag=True, expose_value=False,
+              help=("Print time report of modules import and initialization"))
 def main(ctx):
     """Pype is main command serving as entry point to pipeline system.
 
@@ -427,6 +429,23 @@ def unpack_project(zipfile, root):
     PypeCommands().unpack_project(zipfile, root)
 
 
+@main.command()
+@click.option("--rollback", is_flag=True,
+              help="Rollback also transactions interrupted during commit")
+@click.option("--force", is_flag=True,
+              help="Recover also transactions of running processes")
+@click.option("--journal-dir", help="Directory with journals", default=None)
+def recover_file_transactions(rollback, force, journal_dir):
+    """Complete or rollback interrupted publishes of files.
+
+    Journaled file transactions interrupted e.g. by crash of publishing
+    process leave temporary and backup files next to published files.
+    Transactions interrupted during transfer are rolled back, transactions
+    interrupted during commit are completed unless '--rollback' is passed.
+    """
+    PypeCommands().recover_file_transactions(rollback, force, journal_dir)
+
+
 @main.command()
 def interactive():
     """Interative (Python like) console.
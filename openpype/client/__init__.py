@@ -11,16 +11,19 @@ from .entities import (
     get_asset_by_name,
     get_assets,
     get_archived_assets,
+    iter_assets,
     get_asset_ids_with_subsets,
 
     get_subset_by_id,
     get_subset_by_name,
     get_subsets,
+    iter_subsets,
     get_subset_families,
 
     get_version_by_id,
     get_version_by_name,
     get_versions,
+    iter_versions,
     get_hero_version_by_id,
     get_hero_version_by_subset_id,
     get_hero_versions,
@@ -41,9 +44,13 @@ from .entities import (
     get_representation_by_id,
     get_representation_by_name,
     get_representations,
+    iter_representations,
     get_representation_parents,
     get_representations_parents,
+    get_representations_contexts,
+    get_versions_contexts,
     get_archived_representations,
+    get_representation_files_by_content_hash,
 
     get_thumbnail,
     get_thumbnails,
@@ -52,6 +59,19 @@ from .entities import (
     get_workfile_info,
 )
 
+from .entity_cache import (
+    entity_cache,
+    enable_entity_cache,
+    disable_entity_cache,
+    invalidate_entity_cache,
+    get_entity_cache_stats,
+)
+
+from .snapshot import (
+    export_project_snapshot,
+    mark_project_snapshot_stale,
+)
+
 from .entity_links import (
     get_linked_asset_ids,
     get_linked_assets,
@@ -74,16 +94,19 @@ __all__ = (
     "get_asset_by_name",
     "get_assets",
     "get_archived_assets",
+    "iter_assets",
     "get_asset_ids_with_subsets",
 
     "get_subset_by_id",
     "get_subset_by_name",
     "get_subsets",
+    "iter_subsets",
     "get_subset_families",
 
     "get_version_by_id",
     "get_version_by_name",
     "get_versions",
+    "iter_versions",
     "get_hero_version_by_id",
     "get_hero_version_by_subset_id",
     "get_hero_versions",
@@ -104,9 +127,13 @@ __all__ = (
     "get_representation_by_id",
     "get_representation_by_name",
     "get_representations",
+    "iter_representations",
     "get_representation_parents",
     "get_representations_parents",
+    "get_representations_contexts",
+    "get_versions_contexts",
     "get_archived_representations",
+    "get_representation_files_by_content_hash",
 
     "get_thumbnail",
     "get_thumbnails",
@@ -114,6 +141,15 @@ __all__ = (
 
     "get_workfile_info",
 
+    "entity_cache",
+    "enable_entity_cache",
+    "disable_entity_cache",
+    "invalidate_entity_cache",
+    "get_entity_cache_stats",
+
+    "export_project_snapshot",
+    "mark_project_snapshot_stale",
+
     "get_linked_asset_ids",
     "get_linked_assets",
     "get_linked_representation_id",
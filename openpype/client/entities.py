@@ -14,9 +14,20 @@ import six
 from bson.objectid import ObjectId
 
 from .mongo import get_project_database, get_project_connection
+from .snapshot import get_project_read_connection
+from .entity_cache import cached_entity_query
 
 PatternType = type(re.compile(""))
 
+# Key on subset document with '_id' and 'name' of last version
+LAST_VERSION_KEY = "last_version"
+LAST_VERSION_CHUNK_SIZE = 1000
+# Maximum number of values in one '$in' filter of a query
+QUERY_CHUNK_SIZE = 10000
+# Keys of query filter that can be split into multiple queries
+#   - values must be single value fields so there are no duplicates
+CHUNKABLE_KEYS = ("_id", "parent", "name", "data.visualParent")
+
 
 def _prepare_fields(fields, required_fields=None):
     if not fields:
@@ -69,6 +80,68 @@ def convert_ids(in_ids):
     return list(_output)
 
 
+def _chunk_items(items, chunk_size):
+    """Split items into lists with maximum length of 'chunk_size'."""
+
+    items = list(items)
+    for idx in range(0, len(items), chunk_size):
+        yield items[idx:idx + chunk_size]
+
+
+def _find_entities(conn, query_filter, fields, batch_size=None):
+    """Find documents and split big id filters into multiple queries.
+
+    Filter with list of values bigger than 'QUERY_CHUNK_SIZE' would create
+    huge query document. Values of the biggest '$in' filter (of keys
+    in 'CHUNKABLE_KEYS') are split into chunks and queried separately.
+    Generator is returned in that case instead of cursor.
+
+    Args:
+        conn (pymongo.Collection): Project collection.
+        query_filter (Dict[str, Any]): Query filter.
+        fields (Union[Iterable[str], None]): Fields that should be returned.
+        batch_size (Optional[int]): Number of documents in one batch
+            received from server. Server default is used if not passed.
+
+    Returns:
+        Union[Cursor, Generator]: Iterable of documents.
+    """
+
+    projection = _prepare_fields(fields)
+    chunk_key = None
+    chunk_values = []
+    for key in CHUNKABLE_KEYS:
+        value = query_filter.get(key)
+        if not isinstance(value, dict) or "$in" not in value:
+            continue
+        if len(value["$in"]) > len(chunk_values):
+            chunk_key = key
+            chunk_values = value["$in"]
+
+    if len(chunk_values) <= QUERY_CHUNK_SIZE:
+        cursor = conn.find(query_filter, projection)
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        return cursor
+
+    return _iter_chunked_find(
+        conn, query_filter, projection, chunk_key, chunk_values, batch_size
+    )
+
+
+def _iter_chunked_find(
+    conn, query_filter, projection, chunk_key, chunk_values, batch_size
+):
+    for chunk in _chunk_items(chunk_values, QUERY_CHUNK_SIZE):
+        chunk_filter = dict(query_filter)
+        chunk_filter[chunk_key] = {"$in": chunk}
+        cursor = conn.find(chunk_filter, projection)
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        for doc in cursor:
+            yield doc
+
+
 def get_projects(active=True, inactive=False, fields=None):
     mongodb = get_project_database()
     for project_name in mongodb.collection_names():
@@ -81,6 +154,7 @@ def get_projects(active=True, inactive=False, fields=None):
             yield project_doc
 
 
+@cached_entity_query("project")
 def get_project(project_name, active=True, inactive=True, fields=None):
     # Skip if both are disabled
     if not active and not inactive:
@@ -105,7 +179,7 @@ def get_project(project_name, active=True, inactive=True, fields=None):
             {"data.active": False},
         ]
 
-    conn = get_project_connection(project_name)
+    conn = get_project_read_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
@@ -124,6 +198,7 @@ def get_whole_project(project_name):
     return conn.find({})
 
 
+@cached_entity_query("asset")
 def get_asset_by_id(project_name, asset_id, fields=None):
     """Receive asset data by it's id.
 
@@ -143,10 +218,11 @@ def get_asset_by_id(project_name, asset_id, fields=None):
         return None
 
     query_filter = {"type": "asset", "_id": asset_id}
-    conn = get_project_connection(project_name)
+    conn = get_project_read_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query("asset")
 def get_asset_by_name(project_name, asset_name, fields=None):
     """Receive asset data by it's name.
 
@@ -165,7 +241,7 @@ def get_asset_by_name(project_name, asset_name, fields=None):
         return None
 
     query_filter = {"type": "asset", "name": asset_name}
-    conn = get_project_connection(project_name)
+    conn = get_project_read_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
@@ -179,7 +255,8 @@ def _get_assets(
     parent_ids=None,
     standard=True,
     archived=False,
-    fields=None
+    fields=None,
+    batch_size=None
 ):
     """Assets for specified project by passed filters.
 
@@ -198,6 +275,8 @@ def _get_assets(
         archived (bool): Query archived assets (type 'archived_asset').
         fields (Iterable[str]): Fields that should be returned. All fields are
             returned if 'None' is passed.
+        batch_size (Optional[int]): Number of documents received from server
+            in one batch. Server default is used if not passed.
 
     Returns:
         Cursor: Query cursor as iterable which returns asset documents matching
@@ -235,9 +314,9 @@ def _get_assets(
             return []
         query_filter["data.visualParent"] = {"$in": parent_ids}
 
-    conn = get_project_connection(project_name)
+    conn = get_project_read_connection(project_name)
 
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find_entities(conn, query_filter, fields, batch_size)
 
 
 def get_assets(
@@ -246,7 +325,8 @@ def get_assets(
     asset_names=None,
     parent_ids=None,
     archived=False,
-    fields=None
+    fields=None,
+    batch_size=None
 ):
     """Assets for specified project by passed filters.
 
@@ -264,6 +344,8 @@ def get_assets(
         archived (bool): Add also archived assets.
         fields (Iterable[str]): Fields that should be returned. All fields are
             returned if 'None' is passed.
+        batch_size (Optional[int]): Number of documents received from server
+            in one batch. Server default is used if not passed.
 
     Returns:
         Cursor: Query cursor as iterable which returns asset documents matching
@@ -277,7 +359,8 @@ def get_assets(
         parent_ids,
         True,
         archived,
-        fields
+        fields,
+        batch_size
     )
 
 
@@ -286,7 +369,8 @@ def get_archived_assets(
     asset_ids=None,
     asset_names=None,
     parent_ids=None,
-    fields=None
+    fields=None,
+    batch_size=None
 ):
     """Archived assets for specified project by passed filters.
 
@@ -303,6 +387,8 @@ def get_archived_assets(
         parent_ids (Iterable[Union[str, ObjectId]]): Parent asset ids.
         fields (Iterable[str]): Fields that should be returned. All fields are
             returned if 'None' is passed.
+        batch_size (Optional[int]): Number of documents received from server
+            in one batch. Server default is used if not passed.
 
     Returns:
         Cursor: Query cursor as iterable which returns asset documents matching
@@ -310,7 +396,14 @@ def get_archived_assets(
     """
 
     return _get_assets(
-        project_name, asset_ids, asset_names, parent_ids, False, True, fields
+        project_name,
+        asset_ids,
+        asset_names,
+        parent_ids,
+        False,
+        True,
+        fields,
+        batch_size
     )
 
 
@@ -356,6 +449,7 @@ def get_asset_ids_with_subsets(project_name, asset_ids=None):
     return asset_ids_with_subsets
 
 
+@cached_entity_query("subset")
 def get_subset_by_id(project_name, subset_id, fields=None):
     """Single subset entity data by it's id.
 
@@ -379,6 +473,7 @@ def get_subset_by_id(project_name, subset_id, fields=None):
     return conn.find_one(query_filters, _prepare_fields(fields))
 
 
+@cached_entity_query("subset")
 def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
     """Single subset entity data by it's name and it's version id.
 
@@ -418,7 +513,8 @@ def get_subsets(
     asset_ids=None,
     names_by_asset_ids=None,
     archived=False,
-    fields=None
+    fields=None,
+    batch_size=None
 ):
     """Subset entities data from one project filtered by entered filters.
 
@@ -437,6 +533,8 @@ def get_subsets(
         archived (bool): Look for archived subsets too.
         fields (Iterable[str]): Fields that should be returned. All fields are
             returned if 'None' is passed.
+        batch_size (Optional[int]): Number of documents received from server
+            in one batch. Server default is used if not passed.
 
     Returns:
         Cursor: Iterable cursor yielding all matching subsets.
@@ -481,7 +579,7 @@ def get_subsets(
         query_filter["$or"] = or_query
 
     conn = get_project_connection(project_name)
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find_entities(conn, query_filter, fields, batch_size)
 
 
 def get_subset_families(project_name, subset_ids=None):
@@ -520,6 +618,7 @@ def get_subset_families(project_name, subset_ids=None):
     return set()
 
 
+@cached_entity_query("version")
 def get_version_by_id(project_name, version_id, fields=None):
     """Single version entity data by it's id.
 
@@ -546,6 +645,7 @@ def get_version_by_id(project_name, version_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query("version")
 def get_version_by_name(project_name, version, subset_id, fields=None):
     """Single version entity data by it's name and subset id.
 
@@ -648,7 +748,8 @@ def _get_versions(
     versions=None,
     standard=True,
     hero=False,
-    fields=None
+    fields=None,
+    batch_size=None
 ):
     version_types = []
     if standard:
@@ -688,7 +789,7 @@ def _get_versions(
 
     conn = get_project_connection(project_name)
 
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find_entities(conn, query_filter, fields, batch_size)
 
 
 def get_versions(
@@ -697,7 +798,8 @@ def get_versions(
     subset_ids=None,
     versions=None,
     hero=False,
-    fields=None
+    fields=None,
+    batch_size=None
 ):
     """Version entities data from one project filtered by entered filters.
 
@@ -714,6 +816,8 @@ def get_versions(
         hero (bool): Look also for hero versions.
         fields (Iterable[str]): Fields that should be returned. All fields are
             returned if 'None' is passed.
+        batch_size (Optional[int]): Number of documents received from server
+            in one batch. Server default is used if not passed.
 
     Returns:
         Cursor: Iterable cursor yielding all matching versions.
@@ -726,7 +830,8 @@ def get_versions(
         versions,
         standard=True,
         hero=hero,
-        fields=fields
+        fields=fields,
+        batch_size=batch_size
     )
 
 
@@ -952,6 +1057,7 @@ def get_approved_version_value(project_name, subset_id):
     return approved_version
 
 
+@cached_entity_query("hero_version")
 def get_hero_version_by_subset_id(project_name, subset_id, fields=None):
     """Hero version by subset id.
 
@@ -983,6 +1089,7 @@ def get_hero_version_by_subset_id(project_name, subset_id, fields=None):
     return None
 
 
+@cached_entity_query("hero_version")
 def get_hero_version_by_id(project_name, version_id, fields=None):
     """Hero version by it's id.
 
@@ -1017,7 +1124,8 @@ def get_hero_versions(
     project_name,
     subset_ids=None,
     version_ids=None,
-    fields=None
+    fields=None,
+    batch_size=None
 ):
     """Hero version entities data from one project filtered by entered filters.
 
@@ -1029,6 +1137,8 @@ def get_hero_versions(
             ignored if 'None' is passed.
         fields (Iterable[str]): Fields that should be returned. All fields are
             returned if 'None' is passed.
+        batch_size (Optional[int]): Number of documents received from server
+            in one batch. Server default is used if not passed.
 
     Returns:
         Cursor|list: Iterable yielding hero versions matching passed filters.
@@ -1040,7 +1150,8 @@ def get_hero_versions(
         version_ids,
         standard=False,
         hero=True,
-        fields=fields
+        fields=fields,
+        batch_size=batch_size
     )
 
 
@@ -1076,28 +1187,18 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
-def get_last_versions(project_name, subset_ids, fields=None):
-    """Latest versions for entered subset_ids.
+def _get_last_versions_by_aggregation(project_name, subset_ids, fields):
+    """Find last versions by sorting and grouping all versions of subsets.
 
     Args:
         project_name (str): Name of project where to look for queried entities.
-        subset_ids (Iterable[Union[str, ObjectId]]): List of subset ids.
-        fields (Iterable[str]): Fields that should be returned. All fields are
-            returned if 'None' is passed.
+        subset_ids (List[ObjectId]): List of subset ids.
+        fields (Union[List[str], None]): Fields that should be returned.
 
     Returns:
-        dict[ObjectId, int]: Key is subset id and value is last version name.
+        dict[ObjectId, Dict[str, Any]]: Last version document by subset id.
     """
 
-    subset_ids = convert_ids(subset_ids)
-    if not subset_ids:
-        return {}
-
-    if fields is not None:
-        fields = list(fields)
-        if not fields:
-            return {}
-
     # Avoid double query if only name and _id are requested
     name_needed = False
     limit_query = False
@@ -1161,6 +1262,105 @@ def get_last_versions(project_name, subset_ids, fields=None):
     }
 
 
+def _get_last_versions_by_pointers(project_name, subset_ids, fields):
+    """Find last versions using last version pointers stored on subsets.
+
+    Pointer is used as lower bound of version name so versions created
+    without pointer update are still found. Subsets without pointer, or where
+    no version with pointer name or higher exists (e.g. pointed version was
+    removed), are not in output.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        subset_ids (List[ObjectId]): List of subset ids.
+        fields (Union[List[str], None]): Fields that should be returned.
+
+    Returns:
+        dict[ObjectId, Dict[str, Any]]: Last version document by subset id.
+    """
+
+    conn = get_project_connection(project_name)
+    pointer_names_by_subset_id = {}
+    for chunk_ids in _chunk_items(subset_ids, LAST_VERSION_CHUNK_SIZE):
+        subset_docs = conn.find(
+            {
+                "type": "subset",
+                "_id": {"$in": chunk_ids},
+                LAST_VERSION_KEY: {"$ne": None}
+            },
+            {LAST_VERSION_KEY: True}
+        )
+        for subset_doc in subset_docs:
+            pointer = subset_doc[LAST_VERSION_KEY]
+            pointer_names_by_subset_id[subset_doc["_id"]] = pointer["name"]
+
+    if not pointer_names_by_subset_id:
+        return {}
+
+    projection = _prepare_fields(fields, ["parent", "name"])
+    output = {}
+    for chunk_items in _chunk_items(
+        pointer_names_by_subset_id.items(), LAST_VERSION_CHUNK_SIZE
+    ):
+        or_query = [
+            {"parent": subset_id, "name": {"$gte": name}}
+            for subset_id, name in chunk_items
+        ]
+        version_docs = conn.find(
+            {"type": "version", "$or": or_query}, projection
+        )
+        for version_doc in version_docs:
+            subset_id = version_doc["parent"]
+            current = output.get(subset_id)
+            if current is None or current["name"] < version_doc["name"]:
+                output[subset_id] = version_doc
+
+    if fields and "name" not in fields:
+        for version_doc in output.values():
+            version_doc.pop("name")
+    return output
+
+
+@cached_entity_query("version", multiple=True)
+def get_last_versions(project_name, subset_ids, fields=None):
+    """Latest versions for entered subset_ids.
+
+    Last version pointers stored on subset documents are used when
+    available (see 'openpype.client.operations.update_last_version_pointers').
+    Sorting of all versions is used for subsets without pointer.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        subset_ids (Iterable[Union[str, ObjectId]]): List of subset ids.
+        fields (Iterable[str]): Fields that should be returned. All fields are
+            returned if 'None' is passed.
+
+    Returns:
+        dict[ObjectId, int]: Key is subset id and value is last version name.
+    """
+
+    subset_ids = convert_ids(subset_ids)
+    if not subset_ids:
+        return {}
+
+    if fields is not None:
+        fields = list(fields)
+        if not fields:
+            return {}
+
+    output = _get_last_versions_by_pointers(project_name, subset_ids, fields)
+    missing_subset_ids = [
+        subset_id
+        for subset_id in subset_ids
+        if subset_id not in output
+    ]
+    if missing_subset_ids:
+        output.update(_get_last_versions_by_aggregation(
+            project_name, missing_subset_ids, fields
+        ))
+    return output
+
+
 def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     """Last version for passed subset id.
 
@@ -1225,6 +1425,7 @@ def get_last_version_by_subset_name(
     )
 
 
+@cached_entity_query("representation")
 def get_representation_by_id(project_name, representation_id, fields=None):
     """Representation entity data by it's id.
 
@@ -1255,6 +1456,7 @@ def get_representation_by_id(project_name, representation_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query("representation")
 def get_representation_by_name(
     project_name, representation_name, version_id, fields=None
 ):
@@ -1348,7 +1550,8 @@ def _get_representations(
     names_by_version_ids,
     standard,
     archived,
-    fields
+    fields,
+    batch_size=None
 ):
     default_output = []
     repre_types = []
@@ -1425,7 +1628,7 @@ def _get_representations(
 
     conn = get_project_connection(project_name)
 
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find_entities(conn, query_filter, fields, batch_size)
 
 
 def get_representations(
@@ -1437,7 +1640,8 @@ def get_representations(
     names_by_version_ids=None,
     archived=False,
     standard=True,
-    fields=None
+    fields=None,
+    batch_size=None
 ):
     """Representaion entities data from one project filtered by filters.
 
@@ -1458,6 +1662,8 @@ def get_representations(
         archived (bool): Output will also contain archived representations.
         fields (Iterable[str]): Fields that should be returned. All fields are
             returned if 'None' is passed.
+        batch_size (Optional[int]): Number of documents received from server
+            in one batch. Server default is used if not passed.
 
     Returns:
         Cursor: Iterable cursor yielding all matching representations.
@@ -1472,7 +1678,8 @@ def get_representations(
         names_by_version_ids=names_by_version_ids,
         standard=True,
         archived=archived,
-        fields=fields
+        fields=fields,
+        batch_size=batch_size
     )
 
 
@@ -1483,7 +1690,8 @@ def get_archived_representations(
     version_ids=None,
     context_filters=None,
     names_by_version_ids=None,
-    fields=None
+    fields=None,
+    batch_size=None
 ):
     """Archived representaion entities data from project with applied filters.
 
@@ -1503,6 +1711,8 @@ def get_archived_representations(
             using version ids and list of names under the version.
         fields (Iterable[str]): Fields that should be returned. All fields are
             returned if 'None' is passed.
+        batch_size (Optional[int]): Number of documents received from server
+            in one batch. Server default is used if not passed.
 
     Returns:
         Cursor: Iterable cursor yielding all matching representations.
@@ -1517,7 +1727,246 @@ def get_archived_representations(
         names_by_version_ids=names_by_version_ids,
         standard=False,
         archived=True,
-        fields=fields
+        fields=fields,
+        batch_size=batch_size
+    )
+
+
+def get_representation_files_by_content_hash(project_name, content_hashes):
+    """Rootless paths of representation files with content hash.
+
+    Content hash is stored to file info of representation files which were
+    published with content deduplication enabled.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        content_hashes (Iterable[str]): Content hashes of files.
+
+    Returns:
+        Dict[str, List[str]]: Rootless paths of files by content hash.
+    """
+
+    content_hashes = list(set(content_hashes))
+    if not content_hashes:
+        return {}
+
+    hash_filter = {"files.content_hash": {"$in": content_hashes}}
+    pipeline = [
+        {"$match": dict(hash_filter, type="representation")},
+        {"$project": {"files": True}},
+        {"$unwind": "$files"},
+        {"$match": hash_filter},
+        {"$project": {
+            "_id": False,
+            "content_hash": "$files.content_hash",
+            "path": "$files.path",
+        }},
+    ]
+    output = collections.defaultdict(list)
+    conn = get_project_connection(project_name)
+    for doc in conn.aggregate(pipeline):
+        paths = output[doc["content_hash"]]
+        if doc["path"] not in paths:
+            paths.append(doc["path"])
+    return dict(output)
+
+
+# Parents of representation in hierarchy order. Each item contains key in
+#   context and field used to find the parent
+_CONTEXT_LOOKUPS = (
+    ("version", "representation.parent"),
+    ("hero_source_version", "version.version_id"),
+    ("subset", "version.parent"),
+    ("asset", "subset.parent"),
+)
+_CONTEXT_PARENT_TYPES = ("version", "subset", "asset")
+CONTEXTS_CHUNK_SIZE = 1000
+
+
+def _entity_contexts_pipeline(
+    project_name, root_type, match_filter, parent_type, fields_by_type
+):
+    """Aggregation pipeline receiving entities with their parents.
+
+    Parents are looked up on server so the whole hierarchy is received in
+    single round trip.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], List[str]]: Aggregation pipeline
+            and keys of context in output documents.
+    """
+
+    pipeline = [
+        {"$match": match_filter},
+        {"$replaceRoot": {"newRoot": {root_type: "$$ROOT"}}},
+    ]
+    context_keys = [root_type]
+    max_idx = _CONTEXT_PARENT_TYPES.index(parent_type)
+    for context_key, local_field in _CONTEXT_LOOKUPS:
+        if context_key == root_type:
+            continue
+
+        if (
+            context_key in _CONTEXT_PARENT_TYPES
+            and _CONTEXT_PARENT_TYPES.index(context_key) > max_idx
+        ):
+            break
+
+        context_keys.append(context_key)
+        pipeline.extend((
+            {"$lookup": {
+                "from": project_name,
+                "localField": local_field,
+                "foreignField": "_id",
+                "as": context_key
+            }},
+            {"$unwind": {
+                "path": "${}".format(context_key),
+                "preserveNullAndEmptyArrays": True
+            }},
+        ))
+
+    projection = {"_id": False}
+    for context_key in context_keys:
+        entity_type = context_key
+        if context_key == "hero_source_version":
+            entity_type = "version"
+
+        fields = fields_by_type.get(entity_type)
+        if not fields:
+            projection[context_key] = True
+            continue
+
+        for field in _prepare_fields(fields):
+            projection["{}.{}".format(context_key, field)] = True
+    pipeline.append({"$project": projection})
+    return pipeline, context_keys
+
+
+def _get_entity_contexts(
+    project_name,
+    root_type,
+    entity_ids,
+    entity_types,
+    parent_type,
+    fields_by_type
+):
+    if parent_type not in _CONTEXT_PARENT_TYPES:
+        raise ValueError("Invalid parent type \"{}\"".format(parent_type))
+
+    entity_ids = convert_ids(entity_ids)
+    if not entity_ids:
+        return {}
+
+    if fields_by_type is None:
+        fields_by_type = {}
+
+    conn = get_project_connection(project_name)
+    output = {}
+    for chunk_ids in _chunk_items(entity_ids, CONTEXTS_CHUNK_SIZE):
+        match_filter = {
+            "type": {"$in": entity_types},
+            "_id": {"$in": chunk_ids}
+        }
+        pipeline, context_keys = _entity_contexts_pipeline(
+            project_name, root_type, match_filter, parent_type, fields_by_type
+        )
+        for item in conn.aggregate(pipeline):
+            context = {
+                context_key: item.get(context_key)
+                for context_key in context_keys
+            }
+            output[context[root_type]["_id"]] = context
+    return output
+
+
+def get_representations_contexts(
+    project_name,
+    representation_ids,
+    parent_type="asset",
+    fields_by_type=None,
+    archived=False
+):
+    """Representations with their parent entities.
+
+    Representation, version, subset and asset documents are received using
+    single aggregation per chunk of representation ids instead of query per
+    hierarchy level.
+
+    Source version of hero version is available under key
+    'hero_source_version'. Value is 'None' for standard versions.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        representation_ids (Iterable[Union[str, ObjectId]]): Representation
+            ids.
+        parent_type (str): Highest parent entity type which should be
+            received. Possible values are 'version', 'subset' and 'asset'.
+        fields_by_type (Dict[str, Iterable[str]]): Fields that should be
+            returned by entity type ('representation', 'version', 'subset',
+            'asset'). All fields are returned for entity type which is
+            not set.
+        archived (bool): Look also for archived representations.
+
+    Returns:
+        Dict[ObjectId, Dict[str, Union[Dict[str, Any], None]]]: Context by
+            representation id. Context contains documents of representation
+            and it's parents. Parent which was not found is set to 'None'.
+    """
+
+    repre_types = ["representation"]
+    if archived:
+        repre_types.append("archived_representation")
+
+    return _get_entity_contexts(
+        project_name,
+        "representation",
+        representation_ids,
+        repre_types,
+        parent_type,
+        fields_by_type
+    )
+
+
+def get_versions_contexts(
+    project_name,
+    version_ids,
+    parent_type="asset",
+    fields_by_type=None,
+    hero=True
+):
+    """Versions with their parent entities.
+
+    Same as 'get_representations_contexts' but starting from versions. Can be
+    used when representation documents are already available.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        version_ids (Iterable[Union[str, ObjectId]]): Version ids.
+        parent_type (str): Highest parent entity type which should be
+            received. Possible values are 'version', 'subset' and 'asset'.
+        fields_by_type (Dict[str, Iterable[str]]): Fields that should be
+            returned by entity type ('version', 'subset', 'asset'). All
+            fields are returned for entity type which is not set.
+        hero (bool): Look also for hero versions.
+
+    Returns:
+        Dict[ObjectId, Dict[str, Union[Dict[str, Any], None]]]: Context by
+            version id. Context contains documents of version and it's
+            parents. Parent which was not found is set to 'None'.
+    """
+
+    version_types = ["version"]
+    if hero:
+        version_types.append("hero_version")
+
+    return _get_entity_contexts(
+        project_name,
+        "version",
+        version_ids,
+        version_types,
+        parent_type,
+        fields_by_type
     )
 
 
@@ -1536,63 +1985,27 @@ def get_representations_parents(project_name, representations):
         dict[ObjectId, tuple]: Parents by representation id.
     """
 
-    repre_docs_by_version_id = collections.defaultdict(list)
-    version_docs_by_version_id = {}
-    version_docs_by_subset_id = collections.defaultdict(list)
-    subset_docs_by_subset_id = {}
-    subset_docs_by_asset_id = collections.defaultdict(list)
+    repre_ids_by_version_id = collections.defaultdict(list)
     output = {}
     for repre_doc in representations:
         repre_id = repre_doc["_id"]
         version_id = repre_doc["parent"]
         output[repre_id] = (None, None, None, None)
-        repre_docs_by_version_id[version_id].append(repre_doc)
+        repre_ids_by_version_id[version_id].append(repre_id)
 
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True
-    )
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        subset_id = version_doc["parent"]
-        version_docs_by_version_id[version_id] = version_doc
-        version_docs_by_subset_id[subset_id].append(version_doc)
-
-    subset_docs = get_subsets(
-        project_name, subset_ids=version_docs_by_subset_id.keys()
-    )
-    for subset_doc in subset_docs:
-        subset_id = subset_doc["_id"]
-        asset_id = subset_doc["parent"]
-        subset_docs_by_subset_id[subset_id] = subset_doc
-        subset_docs_by_asset_id[asset_id].append(subset_doc)
-
-    asset_docs = get_assets(
-        project_name, asset_ids=subset_docs_by_asset_id.keys()
+    contexts = get_versions_contexts(
+        project_name, repre_ids_by_version_id.keys()
     )
-    asset_docs_by_id = {
-        asset_doc["_id"]: asset_doc
-        for asset_doc in asset_docs
-    }
 
     project_doc = get_project(project_name)
 
-    for version_id, repre_docs in repre_docs_by_version_id.items():
-        asset_doc = None
-        subset_doc = None
-        version_doc = version_docs_by_version_id.get(version_id)
-        if version_doc:
-            subset_id = version_doc["parent"]
-            subset_doc = subset_docs_by_subset_id.get(subset_id)
-            if subset_doc:
-                asset_id = subset_doc["parent"]
-                asset_doc = asset_docs_by_id.get(asset_id)
-
-        for repre_doc in repre_docs:
-            repre_id = repre_doc["_id"]
+    for version_id, context in contexts.items():
+        for repre_id in repre_ids_by_version_id[version_id]:
             output[repre_id] = (
-                version_doc, subset_doc, asset_doc, project_doc
+                context["version"],
+                context["subset"],
+                context["asset"],
+                project_doc
             )
     return output
 
@@ -1622,6 +2035,38 @@ def get_representation_parents(project_name, representation):
     return parents_by_repre_id[repre_id]
 
 
+def iter_assets(*args, **kwargs):
+    """Same as 'get_assets' but always returns generator.
+
+    Documents are received from server in batches and are not kept in
+    memory, which is preferred for queries of many entities.
+    """
+
+    for asset_doc in get_assets(*args, **kwargs):
+        yield asset_doc
+
+
+def iter_subsets(*args, **kwargs):
+    """Same as 'get_subsets' but always returns generator."""
+
+    for subset_doc in get_subsets(*args, **kwargs):
+        yield subset_doc
+
+
+def iter_versions(*args, **kwargs):
+    """Same as 'get_versions' but always returns generator."""
+
+    for version_doc in get_versions(*args, **kwargs):
+        yield version_doc
+
+
+def iter_representations(*args, **kwargs):
+    """Same as 'get_representations' but always returns generator."""
+
+    for repre_doc in get_representations(*args, **kwargs):
+        yield repre_doc
+
+
 def get_thumbnail_id_from_source(project_name, src_type, src_id):
     """Receive thumbnail id from source entity.
 
@@ -1674,9 +2119,10 @@ def get_thumbnails(project_name, thumbnail_ids, fields=None):
         "_id": {"$in": thumbnail_ids}
     }
     conn = get_project_connection(project_name)
-    return conn.find(query_filter, _prepare_fields(fields))
+    return _find_entities(conn, query_filter, fields)
 
 
+@cached_entity_query("thumbnail")
 def get_thumbnail(project_name, thumbnail_id, fields=None):
     """Receive thumbnail entity data.
 
@@ -1698,6 +2144,7 @@ def get_thumbnail(project_name, thumbnail_id, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+@cached_entity_query("workfile")
 def get_workfile_info(
     project_name, asset_id, task_name, filename, fields=None
 ):
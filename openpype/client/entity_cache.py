@@ -0,0 +1,374 @@
+"""Opt-in cache of entity documents queried with 'openpype.client.entities'.
+
+Cache is disabled by default. It can be enabled for a block of code using
+'entity_cache' context manager or for whole process using
+'enable_entity_cache'. While cache is active query functions decorated
+with 'cached_entity_query' return cached documents for same arguments.
+
+Cached data of a project are invalidated when 'OperationsSession.commit'
+writes entities of the project. Writes made directly to mongo collection
+(out of operations) are not tracked so cache should be used only in places
+where that does not happen or where stale data are not an issue.
+
+Example:
+    ```python
+    from openpype.client import get_asset_by_name, entity_cache
+
+    with entity_cache() as cache:
+        get_asset_by_name(project_name, "sh010")
+        # Second call does not query database
+        get_asset_by_name(project_name, "sh010", fields=["data.parents"])
+        print(cache.get_stats())
+    ```
+"""
+
+import copy
+import threading
+import functools
+import contextlib
+import collections
+
+# Entity types which are stored under same entity type in cache
+_ENTITY_TYPE_ALIASES = {
+    "archived_asset": "asset",
+    "archived_subset": "subset",
+    "hero_version": "version",
+    "archived_representation": "representation",
+}
+_MISSING = object()
+
+
+def _normalize_entity_type(entity_type):
+    return _ENTITY_TYPE_ALIASES.get(entity_type, entity_type)
+
+
+def _get_field_value(doc, keys):
+    value = doc
+    for key in keys:
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def project_document(doc, fields):
+    """Reduce full document to passed fields.
+
+    Mimic mongo projection on a document which was queried with all fields.
+    Nested fields are defined by keys joined with dot (e.g. 'data.parents').
+
+    Args:
+        doc (Union[Dict[str, Any], None]): Full document.
+        fields (Union[Iterable[str], None]): Fields that should be kept. Copy
+            of whole document is returned if 'None' is passed.
+
+    Returns:
+        Union[Dict[str, Any], None]: Copy of document with passed fields.
+    """
+
+    if doc is None:
+        return None
+
+    if not fields:
+        return copy.deepcopy(doc)
+
+    fields = set(fields)
+    fields.add("_id")
+    output = {}
+    for field in fields:
+        keys = field.split(".")
+        value = _get_field_value(doc, keys)
+        if value is _MISSING:
+            continue
+
+        target = output
+        for key in keys[:-1]:
+            target = target.setdefault(key, {})
+        target[keys[-1]] = copy.deepcopy(value)
+    return output
+
+
+class EntityCache(object):
+    """Storage of cached query results.
+
+    Results are stored per project and per entity type which was queried so
+    writes of an entity type invalidate only affected results.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # {project_name: {entity_type: {cache_key: value}}}
+        self._data = collections.defaultdict(
+            lambda: collections.defaultdict(dict)
+        )
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, project_name, entity_type, key):
+        """Cached value or '_MISSING' if is not cached."""
+
+        with self._lock:
+            project_data = self._data.get(project_name)
+            if project_data is None:
+                return _MISSING
+            return project_data[entity_type].get(key, _MISSING)
+
+    def set(self, project_name, entity_type, key, value):
+        with self._lock:
+            self._data[project_name][entity_type][key] = value
+
+    def add_hit(self):
+        self._hits += 1
+
+    def add_miss(self):
+        self._misses += 1
+
+    def invalidate(self, project_name=None, entity_types=None):
+        """Invalidate cached results.
+
+        Args:
+            project_name (Optional[str]): Project which should be
+                invalidated. All projects are invalidated if not passed.
+            entity_types (Optional[Iterable[str]]): Entity types that were
+                changed. All entity types are invalidated if not passed.
+        """
+
+        with self._lock:
+            self._invalidations += 1
+            if project_name is None:
+                self._data.clear()
+                return
+
+            project_data = self._data.get(project_name)
+            if not project_data:
+                return
+
+            if entity_types is None:
+                self._data.pop(project_name, None)
+                return
+
+            for entity_type in entity_types:
+                project_data.pop(_normalize_entity_type(entity_type), None)
+
+    def clear(self):
+        """Clear cached data and reset statistics."""
+
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._invalidations = 0
+
+    def get_stats(self):
+        """Statistics of the cache.
+
+        Returns:
+            Dict[str, int]: Hits, misses and invalidations of cache. Hits
+                are queries that did not have to go to database.
+        """
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+        }
+
+
+class _CacheState(threading.local):
+    def __init__(self):
+        self.scoped_caches = []
+
+
+_process_cache = None
+_state = _CacheState()
+# All active caches (process cache and scoped caches of all threads)
+_active_caches = []
+_active_caches_lock = threading.Lock()
+
+
+def _register_cache(cache):
+    with _active_caches_lock:
+        _active_caches.append(cache)
+
+
+def _unregister_cache(cache):
+    with _active_caches_lock:
+        if cache in _active_caches:
+            _active_caches.remove(cache)
+
+
+def get_active_entity_cache():
+    """Cache which is used for queries in current thread.
+
+    Returns:
+        Union[EntityCache, None]: Cache object or None if cache is not
+            enabled.
+    """
+
+    if _state.scoped_caches:
+        return _state.scoped_caches[-1]
+    return _process_cache
+
+
+def enable_entity_cache():
+    """Enable process-wide entity cache.
+
+    Returns:
+        EntityCache: Process cache object.
+    """
+
+    global _process_cache
+    if _process_cache is None:
+        _process_cache = EntityCache()
+        _register_cache(_process_cache)
+    return _process_cache
+
+
+def disable_entity_cache():
+    """Disable process-wide entity cache and drop its data."""
+
+    global _process_cache
+    if _process_cache is not None:
+        _unregister_cache(_process_cache)
+        _process_cache = None
+
+
+def is_entity_cache_enabled():
+    return get_active_entity_cache() is not None
+
+
+@contextlib.contextmanager
+def entity_cache():
+    """Enable entity cache for a block of code in current thread.
+
+    Nested usage reuses cache of outer block. If process-wide cache is
+    enabled it is used instead of creating new one.
+
+    Yields:
+        EntityCache: Cache used in the block.
+    """
+
+    cache = get_active_entity_cache()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = EntityCache()
+    _register_cache(cache)
+    _state.scoped_caches.append(cache)
+    try:
+        yield cache
+    finally:
+        _state.scoped_caches.remove(cache)
+        _unregister_cache(cache)
+
+
+def invalidate_entity_cache(project_name=None, entity_types=None):
+    """Invalidate data in all active entity caches.
+
+    Called automatically by 'OperationsSession.commit'.
+
+    Args:
+        project_name (Optional[str]): Project which should be invalidated.
+            All projects are invalidated if not passed.
+        entity_types (Optional[Iterable[str]]): Entity types that were
+            changed. All entity types are invalidated if not passed.
+    """
+
+    with _active_caches_lock:
+        caches = list(_active_caches)
+
+    if entity_types is not None:
+        entity_types = set(entity_types)
+
+    for cache in caches:
+        cache.invalidate(project_name, entity_types)
+
+
+def get_entity_cache_stats():
+    """Statistics of cache active in current thread.
+
+    Returns:
+        Union[Dict[str, int], None]: Statistics or None if cache is
+            not active.
+    """
+
+    cache = get_active_entity_cache()
+    if cache is None:
+        return None
+    return cache.get_stats()
+
+
+def _hashable_value(value):
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (key, _hashable_value(item))
+            for key, item in value.items()
+        ))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        # Order of values in filters does not matter
+        items = [_hashable_value(item) for item in value]
+        try:
+            return frozenset(items)
+        except TypeError:
+            return tuple(items)
+    return value
+
+
+def cached_entity_query(entity_type, multiple=False):
+    """Decorator caching results of query function when cache is active.
+
+    Decorated function must have 'project_name' as first argument and
+    'fields' argument. Results are always queried with all fields and reduced
+    to requested 'fields' so queries with different fields are served from
+    the same cached documents.
+
+    Args:
+        entity_type (str): Entity type of queried documents. Changes of the
+            entity type invalidate cached results.
+        multiple (bool): Function returns dictionary with documents as values.
+    """
+
+    entity_type = _normalize_entity_type(entity_type)
+
+    def decorator(func):
+        code = func.__code__
+        arg_names = code.co_varnames[:code.co_argcount]
+        defaults = func.__defaults__ or ()
+        default_values = dict(zip(arg_names[-len(defaults):], defaults))
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_active_entity_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+
+            call_args = dict(default_values)
+            call_args.update(zip(arg_names, args))
+            call_args.update(kwargs)
+            project_name = call_args["project_name"]
+            fields = call_args.pop("fields", None)
+            try:
+                key = (func.__name__, _hashable_value(call_args))
+                hash(key)
+            except TypeError:
+                return func(*args, **kwargs)
+
+            result = cache.get(project_name, entity_type, key)
+            if result is _MISSING:
+                cache.add_miss()
+                call_args["fields"] = None
+                result = func(**call_args)
+                cache.set(project_name, entity_type, key, result)
+            else:
+                cache.add_hit()
+
+            if multiple:
+                return {
+                    item_key: project_document(doc, fields)
+                    for item_key, doc in result.items()
+                }
+            return project_document(result, fields)
+        return wrapper
+    return decorator
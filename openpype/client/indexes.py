@@ -0,0 +1,222 @@
+"""Indexes of project collections.
+
+Query functions in 'openpype.client.entities' filter documents mostly by
+'type' in combination with 'parent', 'name' or 'data.visualParent' and sync
+server aggregates on 'files.sites.name'. Publish deduplication looks up
+files by 'files.content_hash'. Indexes defined here cover those queries.
+They can be created with 'ensure_project_indexes' which is also called on
+project creation and with cli command
+'openpype_console module avalon ensure-indexes'.
+
+Note:
+    These functions are mongo specific and won't have equivalent
+        in OpenPype v4.
+"""
+
+import collections
+
+from bson.objectid import ObjectId
+from pymongo import ASCENDING
+
+from .mongo import get_project_connection
+
+# Index name -> index keys
+PROJECT_INDEXES = collections.OrderedDict((
+    # Children of entity by type, parent and name
+    # - subsets/versions/representations by parent, versions sorted by name
+    ("openpype_type_parent_name", [
+        ("type", ASCENDING),
+        ("parent", ASCENDING),
+        ("name", ASCENDING),
+    ]),
+    # Entity by type and name (assets by name)
+    ("openpype_type_name", [
+        ("type", ASCENDING),
+        ("name", ASCENDING),
+    ]),
+    # Asset hierarchy
+    ("openpype_type_visual_parent", [
+        ("type", ASCENDING),
+        ("data.visualParent", ASCENDING),
+    ]),
+    # Hero versions by source version
+    ("openpype_type_version_id", [
+        ("type", ASCENDING),
+        ("version_id", ASCENDING),
+    ]),
+    # Sync server site state of representation files
+    ("openpype_files_sites_name", [
+        ("files.sites.name", ASCENDING),
+    ]),
+    # Published files by content hash for deduplication
+    ("openpype_files_content_hash", [
+        ("files.content_hash", ASCENDING),
+    ]),
+))
+
+
+def _get_hot_queries():
+    """Query filters used most often by entity functions.
+
+    Filters use dummy values as they're used only to validate query plans.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Query filters by label.
+    """
+
+    dummy_id = ObjectId()
+    return collections.OrderedDict((
+        ("asset by name", {"type": "asset", "name": "__dummy__"}),
+        ("assets by parent", {
+            "type": "asset", "data.visualParent": {"$in": [dummy_id]}
+        }),
+        ("subset by name", {
+            "type": "subset", "name": "__dummy__", "parent": dummy_id
+        }),
+        ("subsets by parent", {
+            "type": "subset", "parent": {"$in": [dummy_id]}
+        }),
+        ("versions by parent", {
+            "type": "version", "parent": {"$in": [dummy_id]}
+        }),
+        ("representations by parent", {
+            "type": "representation", "parent": {"$in": [dummy_id]}
+        }),
+        ("representations by site", {
+            "type": "representation", "files.sites.name": "__dummy__"
+        }),
+        ("representations by content hash", {
+            "type": "representation",
+            "files.content_hash": {"$in": ["__dummy__"]}
+        }),
+    ))
+
+
+def _index_keys(index_info):
+    return [
+        (key, int(direction))
+        for key, direction in index_info["key"]
+    ]
+
+
+def get_project_indexes_state(project_name):
+    """Compare existing indexes of project collection with required indexes.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        Dict[str, List[str]]: Names of 'present', 'missing' and 'extra'
+            indexes. Existing index with different name but same keys as
+            required index is considered as present. Index of '_id' is
+            ignored.
+    """
+
+    collection = get_project_connection(project_name)
+    existing_by_keys = {}
+    for index_name, index_info in collection.index_information().items():
+        if index_name == "_id_":
+            continue
+        existing_by_keys[tuple(_index_keys(index_info))] = index_name
+
+    present = []
+    missing = []
+    for index_name, keys in PROJECT_INDEXES.items():
+        existing_name = existing_by_keys.pop(tuple(keys), None)
+        if existing_name is None:
+            missing.append(index_name)
+        else:
+            present.append(existing_name)
+
+    return {
+        "present": present,
+        "missing": missing,
+        "extra": list(existing_by_keys.values()),
+    }
+
+
+def get_unused_project_indexes(project_name):
+    """Indexes that were not used since mongo server start.
+
+    Uses '$indexStats' aggregation which may not be available for all users
+    or server types.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        List[str]: Names of indexes without any access.
+    """
+
+    collection = get_project_connection(project_name)
+    return [
+        item["name"]
+        for item in collection.aggregate([{"$indexStats": {}}])
+        if item["name"] != "_id_" and not item["accesses"]["ops"]
+    ]
+
+
+def ensure_project_indexes(project_name):
+    """Create missing indexes of project collection.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        List[str]: Names of created indexes.
+    """
+
+    missing = get_project_indexes_state(project_name)["missing"]
+    collection = get_project_connection(project_name)
+    for index_name in missing:
+        collection.create_index(
+            PROJECT_INDEXES[index_name],
+            name=index_name,
+            background=True
+        )
+    return missing
+
+
+def _parse_plan(plan):
+    stages = []
+    index_names = []
+    queue = collections.deque([plan])
+    while queue:
+        item = queue.popleft()
+        stage = item.get("stage")
+        if stage:
+            stages.append(stage)
+        index_name = item.get("indexName")
+        if index_name:
+            index_names.append(index_name)
+        if "inputStage" in item:
+            queue.append(item["inputStage"])
+        for input_stage in item.get("inputStages") or []:
+            queue.append(input_stage)
+    return stages, index_names
+
+
+def explain_hot_queries(project_name):
+    """Check query plans of most common queries.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Information about query plan by query
+            label. Contains 'stages' of winning plan, 'indexes' used by
+            the plan and 'uses_index' boolean.
+    """
+
+    collection = get_project_connection(project_name)
+    output = collections.OrderedDict()
+    for label, query_filter in _get_hot_queries().items():
+        explain = collection.find(query_filter).explain()
+        winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+        stages, index_names = _parse_plan(winning_plan)
+        output[label] = {
+            "stages": stages,
+            "indexes": index_names,
+            "uses_index": "COLLSCAN" not in stages,
+        }
+    return output
@@ -2,7 +2,9 @@ import os
 import sys
 import time
 import logging
+import threading
 import pymongo
+import pymongo.monitoring
 import certifi
 
 if sys.version_info[0] == 2:
@@ -120,43 +122,238 @@ def validate_mongo_connection(mongo_uri):
     client.close()
 
 
+def _get_env_int(key, default=None):
+    value = os.environ.get(key)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def get_mongo_client_kwargs():
+    """Connection pool options for mongo clients.
+
+    Options are defined by environment variables which are filled from
+    system settings of Avalon module ('AVALON_TIMEOUT' and
+    'OPENPYPE_MONGO_*' keys). Options that are not set are not passed to
+    client so pymongo defaults are used.
+
+    Returns:
+        Dict[str, int]: Keyword arguments for 'pymongo.MongoClient'.
+    """
+
+    timeout = _get_env_int("AVALON_TIMEOUT") or 1000
+    kwargs = {
+        "serverSelectionTimeoutMS": timeout
+    }
+    for env_key, kwarg_key in (
+        ("OPENPYPE_MONGO_MAX_POOL_SIZE", "maxPoolSize"),
+        ("OPENPYPE_MONGO_MIN_POOL_SIZE", "minPoolSize"),
+        ("OPENPYPE_MONGO_MAX_IDLE_TIME", "maxIdleTimeMS"),
+        ("OPENPYPE_MONGO_SOCKET_TIMEOUT", "socketTimeoutMS"),
+    ):
+        value = _get_env_int(env_key)
+        # Zero means "use pymongo default"
+        if value:
+            kwargs[kwarg_key] = value
+    return kwargs
+
+
+def get_health_check_ttl():
+    """Time in seconds for which is validated connection considered alive.
+
+    Value is defined by 'OPENPYPE_MONGO_HEALTH_CHECK_TTL' environment
+    variable. Zero means that connection is validated on each request of
+    the client.
+
+    Returns:
+        int: Seconds between connection validations.
+    """
+
+    ttl = _get_env_int("OPENPYPE_MONGO_HEALTH_CHECK_TTL")
+    if ttl is None or ttl < 0:
+        return 30
+    return ttl
+
+
+class MongoClientStats(object):
+    """Counters and health state of single mongo client.
+
+    Args:
+        mongo_url (str): Url of mongo server.
+    """
+
+    def __init__(self, mongo_url):
+        self.mongo_url = mongo_url
+        self.client = None
+        self.last_check = 0
+        self.needs_check = False
+
+        self.checks_done = 0
+        self.checks_skipped = 0
+        self.reconnects = 0
+        self.queries_issued = 0
+        self.queries_failed = 0
+
+    def set_client(self, client):
+        if self.client is not None:
+            self.reconnects += 1
+        self.client = client
+        self.mark_checked()
+
+    def mark_checked(self):
+        self.last_check = time.time()
+        self.needs_check = False
+
+    def is_check_needed(self, ttl):
+        if self.needs_check:
+            return True
+        return (time.time() - self.last_check) >= ttl
+
+    def to_data(self):
+        return {
+            "mongo_url": self.mongo_url,
+            "last_check": self.last_check,
+            "checks_done": self.checks_done,
+            "checks_skipped": self.checks_skipped,
+            "reconnects": self.reconnects,
+            "queries_issued": self.queries_issued,
+            "queries_failed": self.queries_failed,
+        }
+
+
+class _ClientCommandListener(pymongo.monitoring.CommandListener):
+    """Count commands sent by client and catch connection failures.
+
+    Failure of command caused by client side exception (e.g. network error)
+    marks client to be validated on next request of the client.
+    """
+
+    def __init__(self, stats):
+        self._stats = stats
+
+    def started(self, event):
+        self._stats.queries_issued += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        self._stats.queries_failed += 1
+        failure = event.failure
+        # Server errors contain server response, client side exceptions
+        #   are converted to dictionary with 'errtype' key
+        if isinstance(failure, dict) and "errtype" in failure:
+            self._stats.needs_check = True
+
+
 class OpenPypeMongoConnection:
     """Singleton MongoDB connection.
 
-    Keeps MongoDB connections by url.
+    Keeps MongoDB connections by url. Connection is validated only when
+    health check TTL ran out or when a command of the client failed
+    on client side (see 'get_health_check_ttl').
     """
 
     mongo_clients = {}
+    _clients_stats = {}
+    _lock = threading.RLock()
     log = logging.getLogger("OpenPypeMongoConnection")
 
     @staticmethod
     def get_default_mongo_url():
         return os.environ["OPENPYPE_MONGO"]
 
+    @classmethod
+    def _get_stats(cls, mongo_url):
+        stats = cls._clients_stats.get(mongo_url)
+        if stats is None:
+            stats = MongoClientStats(mongo_url)
+            cls._clients_stats[mongo_url] = stats
+        return stats
+
+    @staticmethod
+    def _validate_client(mongo_client):
+        mongo_client.server_info()
+        with mongo_client.start_session():
+            pass
+
     @classmethod
     def get_mongo_client(cls, mongo_url=None):
         if mongo_url is None:
             mongo_url = cls.get_default_mongo_url()
 
+        stats = cls._get_stats(mongo_url)
         connection = cls.mongo_clients.get(mongo_url)
-        if connection:
-            # Naive validation of existing connection
-            try:
-                connection.server_info()
-                with connection.start_session():
-                    pass
-            except Exception:
-                connection = None
-
-        if not connection:
-            cls.log.debug("Creating mongo connection to {}".format(mongo_url))
-            connection = cls.create_connection(mongo_url)
-            cls.mongo_clients[mongo_url] = connection
+        if connection is not None:
+            if not stats.is_check_needed(get_health_check_ttl()):
+                stats.checks_skipped += 1
+                return connection
+
+        with cls._lock:
+            connection = cls.mongo_clients.get(mongo_url)
+            if (
+                connection is not None
+                and stats.is_check_needed(get_health_check_ttl())
+            ):
+                # Naive validation of existing connection
+                stats.checks_done += 1
+                try:
+                    cls._validate_client(connection)
+                    stats.mark_checked()
+                except Exception:
+                    connection = None
+
+            if not connection:
+                cls.log.debug(
+                    "Creating mongo connection to {}".format(mongo_url)
+                )
+                connection = cls.create_connection(
+                    mongo_url, event_listeners=[_ClientCommandListener(stats)]
+                )
+                stats.set_client(connection)
+                cls.mongo_clients[mongo_url] = connection
 
         return connection
 
     @classmethod
-    def create_connection(cls, mongo_url, timeout=None, retry_attempts=None):
+    def invalidate_client(cls, mongo_url=None):
+        """Force validation of client on next request.
+
+        Args:
+            mongo_url (str): Url of mongo server. Default url is used
+                if not passed.
+        """
+
+        if mongo_url is None:
+            mongo_url = cls.get_default_mongo_url()
+        stats = cls._clients_stats.get(mongo_url)
+        if stats is not None:
+            stats.needs_check = True
+
+    @classmethod
+    def get_clients_stats(cls):
+        """Counters of created clients.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Counters of clients by mongo url.
+        """
+
+        return {
+            mongo_url: stats.to_data()
+            for mongo_url, stats in cls._clients_stats.items()
+        }
+
+    @classmethod
+    def create_connection(
+        cls,
+        mongo_url,
+        timeout=None,
+        retry_attempts=None,
+        event_listeners=None
+    ):
         parsed = urlparse(mongo_url)
         # Force validation of scheme
         if parsed.scheme not in ["mongodb", "mongodb+srv"]:
@@ -165,12 +362,13 @@ class OpenPypeMongoConnection:
                 " URI must begin with 'mongodb://' or 'mongodb+srv://'"
             ))
 
-        if timeout is None:
-            timeout = int(os.environ.get("AVALON_TIMEOUT") or 1000)
+        kwargs = get_mongo_client_kwargs()
+        if timeout is not None:
+            kwargs["serverSelectionTimeoutMS"] = timeout
+
+        if event_listeners:
+            kwargs["event_listeners"] = event_listeners
 
-        kwargs = {
-            "serverSelectionTimeoutMS": timeout
-        }
         if should_add_certificate_path_to_mongo_url(mongo_url):
             kwargs["ssl_ca_certs"] = certifi.where()
 
@@ -187,9 +385,7 @@ class OpenPypeMongoConnection:
         t1 = time.time()
         for attempt in range(1, retry_attempts + 1):
             try:
-                mongo_client.server_info()
-                with mongo_client.start_session():
-                    pass
+                cls._validate_client(mongo_client)
                 valid = True
                 break
 
@@ -1,4 +1,5 @@
 import re
+import time
 import uuid
 import copy
 import collections
@@ -7,9 +8,20 @@ from abc import ABCMeta, abstractmethod, abstractproperty
 import six
 from bson.objectid import ObjectId
 from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import AutoReconnect
 
 from .mongo import get_project_connection
-from .entities import get_project
+from .entities import (
+    LAST_VERSION_KEY,
+    LAST_VERSION_CHUNK_SIZE,
+    get_project,
+    convert_ids,
+    _chunk_items,
+    _get_last_versions_by_aggregation,
+)
+from .entity_cache import invalidate_entity_cache
+from .snapshot import mark_project_snapshot_stale
+from .indexes import ensure_project_indexes
 
 REMOVED_VALUE = object()
 
@@ -28,6 +40,12 @@ CURRENT_REPRESENTATION_SCHEMA = "openpype:representation-2.0"
 CURRENT_WORKFILE_INFO_SCHEMA = "openpype:workfile-1.0"
 CURRENT_THUMBNAIL_SCHEMA = "openpype:thumbnail-1.0"
 
+# Maximum number of mongo operations sent in one 'bulk_write'
+OPERATIONS_CHUNK_SIZE = 1000
+# How many times is chunk sent again on connection issues
+OPERATIONS_RETRY_ATTEMPTS = 3
+OPERATIONS_RETRY_DELAY = 0.5
+
 
 def _create_or_convert_to_mongo_id(mongo_id):
     if mongo_id is None:
@@ -581,6 +599,273 @@ class DeleteOperation(AbstractOperation):
         return output
 
 
+def update_last_version_pointers(project_name, subset_ids=None):
+    """Store id and name of last version on subset documents.
+
+    Pointers are used by 'get_last_versions' to avoid sorting of all versions
+    of subsets. They're updated automatically by 'OperationsSession.commit'
+    when versions are created, changed or removed. This function can be used
+    to backfill or repair pointers of existing subsets.
+
+    Args:
+        project_name (str): Project name.
+        subset_ids (Iterable[Union[str, ObjectId]]): Subset ids which should
+            be updated. All subsets of project are updated if not passed.
+
+    Returns:
+        int: Number of updated subsets.
+    """
+
+    collection = get_project_connection(project_name)
+    if subset_ids is None:
+        subset_ids = [
+            subset_doc["_id"]
+            for subset_doc in collection.find(
+                {"type": "subset"}, {"_id": True}
+            )
+        ]
+    else:
+        subset_ids = convert_ids(subset_ids)
+
+    updated = 0
+    try:
+        for chunk_ids in _chunk_items(subset_ids, LAST_VERSION_CHUNK_SIZE):
+            last_versions = _get_last_versions_by_aggregation(
+                project_name, chunk_ids, ["_id", "name"]
+            )
+            bulk_writes = []
+            for subset_id in chunk_ids:
+                pointer = None
+                version_doc = last_versions.get(subset_id)
+                if version_doc is not None:
+                    pointer = {
+                        "_id": version_doc["_id"],
+                        "name": version_doc["name"]
+                    }
+                bulk_writes.append(UpdateOne(
+                    {"_id": subset_id, "type": "subset"},
+                    {"$set": {LAST_VERSION_KEY: pointer}}
+                ))
+
+            if bulk_writes:
+                result = collection.bulk_write(bulk_writes, ordered=False)
+                updated += result.matched_count
+    finally:
+        # Pointers are written directly to collection so cached subset
+        #   documents would keep previous pointers
+        invalidate_entity_cache(project_name, ["subset"])
+    return updated
+
+
+def _update_keys_conflict(update_data, other_update_data):
+    """Keys of updates would touch same path with different depth.
+
+    Mongo does not allow to change e.g. 'data' and 'data.frameStart' in one
+    update so such updates can't be merged.
+    """
+
+    for key in update_data.keys():
+        for other_key in other_update_data.keys():
+            if key == other_key:
+                continue
+            if (
+                key.startswith(other_key + ".")
+                or other_key.startswith(key + ".")
+            ):
+                return True
+    return False
+
+
+def coalesce_operations(operations):
+    """Merge update operations of same entity into one update operation.
+
+    Update is merged into previous update of the same entity if there is no
+    create or delete operation of the entity between them and changed keys
+    don't conflict. Later values have priority. Passed operations are not
+    modified, merged update is a new 'UpdateOperation'.
+
+    Args:
+        operations (List[AbstractOperation]): Operations in order in which
+            they should happen.
+
+    Returns:
+        List[AbstractOperation]: Operations with merged updates.
+    """
+
+    output = []
+    # Index of update operation in output by entity id
+    update_idx_by_id = {}
+    for operation in operations:
+        key = (operation.project_name, operation.entity_id)
+        if not isinstance(operation, UpdateOperation):
+            update_idx_by_id.pop(key, None)
+            output.append(operation)
+            continue
+
+        idx = update_idx_by_id.get(key)
+        if idx is not None:
+            prev_operation = output[idx]
+            if not _update_keys_conflict(
+                prev_operation.update_data, operation.update_data
+            ):
+                update_data = dict(prev_operation.update_data)
+                update_data.update(operation.update_data)
+                output[idx] = UpdateOperation(
+                    operation.project_name,
+                    operation.entity_type,
+                    operation.entity_id,
+                    update_data
+                )
+                continue
+
+        update_idx_by_id[key] = len(output)
+        output.append(operation)
+    return output
+
+
+def _skip_applied_inserts(collection, chunk):
+    """Remove create operations of documents which already exist.
+
+    Args:
+        collection (pymongo.Collection): Collection of project.
+        chunk (List[Tuple[AbstractOperation, Any]]): Operations with
+            mongo operations.
+
+    Returns:
+        Tuple[List[Tuple[AbstractOperation, Any]], int]: Operations which
+            should be sent and number of skipped create operations.
+    """
+
+    create_ids = [
+        operation.entity_id
+        for operation, _ in chunk
+        if isinstance(operation, CreateOperation)
+    ]
+    if not create_ids:
+        return chunk, 0
+
+    existing_ids = {
+        doc["_id"]
+        for doc in collection.find({"_id": {"$in": create_ids}}, {"_id": 1})
+    }
+    if not existing_ids:
+        return chunk, 0
+
+    output = [
+        item
+        for item in chunk
+        if not (
+            isinstance(item[0], CreateOperation)
+            and item[0].entity_id in existing_ids
+        )
+    ]
+    return output, len(chunk) - len(output)
+
+
+def _bulk_write_chunk(collection, chunk, ordered, retry_attempts):
+    """Send bulk write to server and retry on connection issues.
+
+    Server may have applied part of the chunk before the connection failed.
+    Updates and deletes of the session are idempotent and are sent again.
+    Creates of documents which already exist are not sent again, so retry
+    does not fail on duplicated key.
+
+    Args:
+        collection (pymongo.Collection): Collection of project.
+        chunk (List[Tuple[AbstractOperation, Any]]): Operations with
+            mongo operations.
+        ordered (bool): Operations are processed in order.
+        retry_attempts (int): How many times is chunk sent again.
+
+    Returns:
+        Dict[str, int]: 'inserted', 'modified' and 'deleted' counts and
+            number of 'attempts'. Modified count of retried chunk does not
+            contain documents modified before the connection failed.
+    """
+
+    attempt = 0
+    skipped_inserts = 0
+    while True:
+        attempt += 1
+        try:
+            if attempt > 1:
+                chunk, skipped = _skip_applied_inserts(collection, chunk)
+                skipped_inserts += skipped
+
+            inserted = modified = deleted = 0
+            if chunk:
+                result = collection.bulk_write(
+                    [mongo_op for _, mongo_op in chunk], ordered=ordered
+                )
+                inserted = result.inserted_count
+                modified = result.modified_count
+                deleted = result.deleted_count
+
+            return {
+                "inserted": inserted + skipped_inserts,
+                "modified": modified,
+                "deleted": deleted,
+                "attempts": attempt,
+            }
+
+        except AutoReconnect:
+            if attempt > retry_attempts:
+                raise
+        time.sleep(OPERATIONS_RETRY_DELAY * attempt)
+
+
+def _get_last_version_subset_ids(project_name, operations):
+    """Subset ids which may have changed last version by operations.
+
+    Must be called before operations are committed, because parents of
+    removed versions can't be found afterwards.
+    """
+
+    subset_ids = set()
+    version_ids = set()
+    for operation in operations:
+        entity_type = operation.entity_type
+        if entity_type == "subset":
+            if (
+                isinstance(operation, UpdateOperation)
+                and LAST_VERSION_KEY in operation.update_data
+            ):
+                subset_ids.add(operation.entity_id)
+            continue
+
+        if entity_type != "version":
+            continue
+
+        if isinstance(operation, CreateOperation):
+            subset_ids.add(operation.get("parent"))
+
+        elif isinstance(operation, DeleteOperation):
+            version_ids.add(operation.entity_id)
+
+        else:
+            update_data = operation.update_data
+            if not any(
+                key in update_data
+                for key in ("name", "parent", "type")
+            ):
+                continue
+            version_ids.add(operation.entity_id)
+            parent_id = update_data.get("parent")
+            if parent_id is not REMOVED_VALUE:
+                subset_ids.add(parent_id)
+
+    if version_ids:
+        collection = get_project_connection(project_name)
+        for version_doc in collection.find(
+            {"_id": {"$in": list(version_ids)}},
+            {"parent": True}
+        ):
+            subset_ids.add(version_doc.get("parent"))
+
+    subset_ids.discard(None)
+    return subset_ids
+
+
 class OperationsSession(object):
     """Session storing operations that should happen in an order.
 
@@ -650,27 +935,81 @@ class OperationsSession(object):
             for operation in self._operations
         ]
 
-    def commit(self):
-        """Commit session operations."""
+    def commit(self, chunk_size=None, ordered=True, retry_attempts=None):
+        """Commit session operations.
+
+        Updates of the same entity are merged (see 'coalesce_operations') and
+        operations are sent in chunks of 'chunk_size' operations. Chunk is
+        sent again if connection to server failed, without creates which
+        were already applied.
+
+        Args:
+            chunk_size (Optional[int]): Maximum number of operations in one
+                bulk write. 'OPERATIONS_CHUNK_SIZE' is used if not passed.
+            ordered (bool): Operations in chunk are processed in order and
+                processing stops on first error. Unordered processing is
+                faster but operations must not depend on each other
+                (e.g. create and update of the same entity).
+            retry_attempts (Optional[int]): How many times is chunk sent again
+                on connection issues. 'OPERATIONS_RETRY_ATTEMPTS' is used if
+                not passed.
+
+        Returns:
+            List[Dict[str, Any]]: Information about each committed chunk.
+                Contains 'project_name', 'operations' count, 'inserted',
+                'modified' and 'deleted' counts, 'attempts' and 'duration'
+                in seconds.
+        """
 
         operations, self._operations = self._operations, []
         if not operations:
-            return
+            return []
+
+        if not chunk_size:
+            chunk_size = OPERATIONS_CHUNK_SIZE
+
+        if retry_attempts is None:
+            retry_attempts = OPERATIONS_RETRY_ATTEMPTS
 
         operations_by_project = collections.defaultdict(list)
-        for operation in operations:
+        for operation in coalesce_operations(operations):
             operations_by_project[operation.project_name].append(operation)
 
+        output = []
         for project_name, operations in operations_by_project.items():
+            last_version_subset_ids = _get_last_version_subset_ids(
+                project_name, operations
+            )
             bulk_writes = []
             for operation in operations:
                 mongo_op = operation.to_mongo_operation()
                 if mongo_op is not None:
-                    bulk_writes.append(mongo_op)
+                    bulk_writes.append((operation, mongo_op))
 
             if bulk_writes:
                 collection = get_project_connection(project_name)
-                collection.bulk_write(bulk_writes)
+                try:
+                    for chunk in _chunk_items(bulk_writes, chunk_size):
+                        start = time.time()
+                        chunk_info = _bulk_write_chunk(
+                            collection, chunk, ordered, retry_attempts
+                        )
+                        chunk_info["project_name"] = project_name
+                        chunk_info["operations"] = len(chunk)
+                        chunk_info["duration"] = time.time() - start
+                        output.append(chunk_info)
+                finally:
+                    mark_project_snapshot_stale(project_name)
+                    invalidate_entity_cache(
+                        project_name,
+                        {operation.entity_type for operation in operations}
+                    )
+
+            if last_version_subset_ids:
+                update_last_version_pointers(
+                    project_name, last_version_subset_ids
+                )
+        return output
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'CreateOperation'.
@@ -764,6 +1103,9 @@ def create_project(project_name, project_code, library_project=False):
     )
     op_session.commit()
 
+    # Create indexes used by entity queries while collection is empty
+    ensure_project_indexes(project_name)
+
     # Load ProjectSettings for the project and save it to store all attributes
     #   and Anatomy
     try:
@@ -0,0 +1,636 @@
+"""Read-only snapshot of project documents stored in local SQLite file.
+
+Farm and offline nodes are usually querying the same project and asset
+documents over and over to build context of a job. Project can be exported
+into snapshot file with 'export_project_snapshot' (or with cli command
+'openpype_console module avalon export-snapshot') and path to the file set
+to 'OPENPYPE_PROJECT_SNAPSHOT' environment variable. Query functions of
+project and assets in 'openpype.client.entities' then read documents
+from the snapshot instead of mongo.
+
+Snapshot contains only documents which don't change during a job (project
+with anatomy and assets). Subsets, versions, representations and other
+documents which are created by publishing are always queried from mongo.
+Once entities of the project are changed by the process (with
+'OperationsSession' or 'AvalonMongoDB') the snapshot is not used anymore so
+the process does not read stale data it wrote itself.
+
+Note:
+    Snapshot does not handle all possible mongo queries. Only query
+        operators used in 'openpype.client.entities' are supported.
+"""
+
+import os
+import re
+import sqlite3
+import datetime
+import threading
+
+import six
+from bson.objectid import ObjectId
+from bson.json_util import (
+    loads,
+    dumps,
+    CANONICAL_JSON_OPTIONS
+)
+
+from .mongo import get_project_connection
+from .entity_cache import project_document
+
+SNAPSHOT_ENV_KEY = "OPENPYPE_PROJECT_SNAPSHOT"
+SNAPSHOT_FORMAT_VERSION = 1
+# Types of documents stored in snapshot
+SNAPSHOT_DOCUMENT_TYPES = ("project", "asset", "archived_asset")
+
+PatternType = type(re.compile(""))
+
+# Query keys stored in columns of documents table for faster lookup
+_INDEXED_COLUMNS = {
+    "_id": "id",
+    "type": "type",
+    "parent": "parent",
+    "name": "name",
+    "data.visualParent": "visual_parent",
+}
+# Maximum number of values of 'IN' sql condition
+_SQL_CHUNK_SIZE = 500
+_MISSING = object()
+
+
+def _column_value(value):
+    if value is None:
+        return None
+    if isinstance(value, (ObjectId, six.string_types, int, float)):
+        return str(value)
+    return _MISSING
+
+
+def _get_doc_value(doc, keys):
+    value = doc
+    for key in keys:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def export_project_snapshot(project_name, output_path):
+    """Export project and asset documents of project into snapshot file.
+
+    Args:
+        project_name (str): Name of project.
+        output_path (str): Path to output file. Existing file is replaced.
+
+    Returns:
+        int: Number of exported documents.
+    """
+
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    # Export to temp file so readers never see partially written snapshot
+    tmp_path = output_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    collection = get_project_connection(project_name)
+    connection = sqlite3.connect(tmp_path)
+    count = 0
+    try:
+        connection.execute(
+            "CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        connection.execute((
+            "CREATE TABLE documents ("
+            "id TEXT PRIMARY KEY, type TEXT, parent TEXT, name TEXT,"
+            " visual_parent TEXT, doc TEXT)"
+        ))
+        rows = []
+        query_filter = {"type": {"$in": list(SNAPSHOT_DOCUMENT_TYPES)}}
+        for doc in collection.find(query_filter):
+            row = []
+            for key in ("_id", "type", "parent", "name", "data.visualParent"):
+                value = _column_value(_get_doc_value(doc, key.split(".")))
+                if value is _MISSING:
+                    value = None
+                row.append(value)
+            row.append(dumps(doc, json_options=CANONICAL_JSON_OPTIONS))
+            rows.append(row)
+            count += 1
+            if len(rows) >= _SQL_CHUNK_SIZE:
+                connection.executemany(
+                    "INSERT INTO documents VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+                rows = []
+
+        if rows:
+            connection.executemany(
+                "INSERT INTO documents VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+        connection.execute(
+            "CREATE INDEX documents_type_parent ON documents (type, parent)"
+        )
+        connection.execute(
+            "CREATE INDEX documents_type_name ON documents (type, name)"
+        )
+        connection.execute(
+            "CREATE INDEX documents_visual_parent"
+            " ON documents (type, visual_parent)"
+        )
+        connection.executemany(
+            "INSERT INTO metadata VALUES (?, ?)",
+            [
+                ("project_name", project_name),
+                ("format_version", str(SNAPSHOT_FORMAT_VERSION)),
+                ("created", datetime.datetime.now().isoformat()),
+                ("count", str(count)),
+            ]
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    os.rename(tmp_path, output_path)
+    return count
+
+
+def _compare(value, expected, operator):
+    try:
+        if operator == "$gt":
+            return value > expected
+        if operator == "$gte":
+            return value >= expected
+        if operator == "$lt":
+            return value < expected
+        return value <= expected
+    except TypeError:
+        return False
+
+
+def _value_equals(value, expected):
+    if isinstance(expected, PatternType):
+        return (
+            isinstance(value, six.string_types)
+            and expected.search(value) is not None
+        )
+    if value == expected:
+        return True
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+    return False
+
+
+def _get_values(doc, keys):
+    """Values of field in document expanded through lists.
+
+    Returns:
+        List[Any]: Found values. Empty list if field is not available.
+    """
+
+    values = [doc]
+    for key in keys:
+        next_values = []
+        for value in values:
+            if isinstance(value, dict):
+                if key in value:
+                    next_values.append(value[key])
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict) and key in item:
+                        next_values.append(item[key])
+        values = next_values
+    return values
+
+
+def _match_operator(values, operator, expected, condition):
+    if operator == "$exists":
+        return bool(values) == bool(expected)
+
+    if operator == "$eq":
+        return any(_value_equals(value, expected) for value in values)
+
+    if operator == "$ne":
+        if expected is None and not values:
+            return False
+        return not any(_value_equals(value, expected) for value in values)
+
+    if operator == "$in":
+        if not values:
+            return None in expected
+        return any(
+            _value_equals(value, item)
+            for value in values
+            for item in expected
+        )
+
+    if operator == "$nin":
+        return not _match_operator(values, "$in", expected, condition)
+
+    if operator in ("$gt", "$gte", "$lt", "$lte"):
+        return any(_compare(value, expected, operator) for value in values)
+
+    if operator == "$regex":
+        if not isinstance(expected, PatternType):
+            flags = 0
+            if "i" in condition.get("$options", ""):
+                flags = re.IGNORECASE
+            expected = re.compile(expected, flags)
+        return any(_value_equals(value, expected) for value in values)
+
+    if operator == "$options":
+        return True
+
+    raise ValueError(
+        "Query operator \"{}\" is not supported by snapshot".format(operator)
+    )
+
+
+def _match_condition(values, condition):
+    if (
+        isinstance(condition, dict)
+        and condition
+        and all(key.startswith("$") for key in condition.keys())
+    ):
+        return all(
+            _match_operator(values, operator, expected, condition)
+            for operator, expected in condition.items()
+        )
+
+    if condition is None and not values:
+        return True
+    return any(_value_equals(value, condition) for value in values)
+
+
+def match_document(doc, query_filter):
+    """Check if document matches mongo query filter.
+
+    Args:
+        doc (Dict[str, Any]): Document.
+        query_filter (Dict[str, Any]): Mongo query filter.
+
+    Returns:
+        bool: Document matches the filter.
+    """
+
+    for key, condition in query_filter.items():
+        if key == "$or":
+            if not any(match_document(doc, item) for item in condition):
+                return False
+
+        elif key == "$and":
+            if not all(match_document(doc, item) for item in condition):
+                return False
+
+        elif key == "$nor":
+            if any(match_document(doc, item) for item in condition):
+                return False
+
+        elif key.startswith("$"):
+            raise ValueError(
+                "Query operator \"{}\" is not supported by snapshot".format(
+                    key
+                )
+            )
+
+        elif not _match_condition(_get_values(doc, key.split(".")), condition):
+            return False
+    return True
+
+
+def _projection_fields(projection):
+    if not projection:
+        return None
+    if isinstance(projection, dict):
+        return [key for key, value in projection.items() if value]
+    return list(projection)
+
+
+class SnapshotCursor(object):
+    """Iterable of documents matching query filter in snapshot.
+
+    Mimics pymongo cursor methods used with results of query functions.
+    """
+
+    def __init__(self, snapshot, query_filter, projection):
+        self._snapshot = snapshot
+        self._query_filter = query_filter or {}
+        self._fields = _projection_fields(projection)
+        self._sort = []
+        self._limit = 0
+        self._skip = 0
+        self._iterator = None
+
+    def batch_size(self, batch_size):
+        return self
+
+    def sort(self, key_or_list, direction=1):
+        if isinstance(key_or_list, six.string_types):
+            key_or_list = [(key_or_list, direction)]
+        self._sort = list(key_or_list)
+        return self
+
+    def limit(self, limit):
+        self._limit = limit
+        return self
+
+    def skip(self, skip):
+        self._skip = skip
+        return self
+
+    def _iter_docs(self):
+        docs = self._snapshot.find_documents(self._query_filter)
+        if self._sort:
+            docs = list(docs)
+            for key, direction in reversed(self._sort):
+                keys = key.split(".")
+                docs.sort(
+                    key=lambda doc: _SortKey(_get_doc_value(doc, keys)),
+                    reverse=direction < 0
+                )
+
+        skipped = 0
+        returned = 0
+        for doc in docs:
+            if skipped < self._skip:
+                skipped += 1
+                continue
+            if self._limit and returned >= self._limit:
+                break
+            returned += 1
+            if self._fields:
+                doc = project_document(doc, self._fields)
+            yield doc
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._iterator is None:
+            self._iterator = self._iter_docs()
+        return next(self._iterator)
+
+    # Python 2 support
+    next = __next__
+
+
+class _SortKey(object):
+    """Sort key which can compare values of different types."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        if self.value is None:
+            return other.value is not None
+        if other.value is None:
+            return False
+        try:
+            return self.value < other.value
+        except TypeError:
+            return str(self.value) < str(other.value)
+
+
+class ProjectSnapshot(object):
+    """Access to documents in snapshot file.
+
+    Args:
+        path (str): Path to snapshot file.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._metadata = dict(
+            self._connection.execute("SELECT key, value FROM metadata")
+        )
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def project_name(self):
+        return self._metadata.get("project_name")
+
+    @property
+    def metadata(self):
+        return dict(self._metadata)
+
+    def _execute(self, query, values):
+        with self._lock:
+            return self._connection.execute(query, values).fetchall()
+
+    def _sql_conditions(self, query_filter):
+        """Prepare sql conditions from indexed keys of query filter.
+
+        Conditions only narrow down documents which are matched against
+        whole query filter afterwards.
+
+        Returns:
+            Tuple[List[str], List[Any], Union[Tuple[str, List[str]], None]]:
+                Conditions, their values and column with list of values that
+                must be split into chunks.
+        """
+
+        conditions = []
+        values = []
+        chunked = None
+        for key, column in _INDEXED_COLUMNS.items():
+            condition = query_filter.get(key, _MISSING)
+            if condition is _MISSING:
+                continue
+
+            if isinstance(condition, dict):
+                if list(condition.keys()) != ["$in"]:
+                    continue
+                column_values = [
+                    _column_value(item)
+                    for item in condition["$in"]
+                ]
+                if _MISSING in column_values or None in column_values:
+                    continue
+                column_values = list(set(column_values))
+                if not column_values:
+                    return None, None, None
+
+                if len(column_values) > _SQL_CHUNK_SIZE:
+                    if chunked is None:
+                        chunked = (column, column_values)
+                    continue
+
+                conditions.append("{} IN ({})".format(
+                    column, ", ".join("?" for _ in column_values)
+                ))
+                values.extend(column_values)
+                continue
+
+            value = _column_value(condition)
+            if value is _MISSING:
+                continue
+            if value is None:
+                conditions.append("{} IS NULL".format(column))
+            else:
+                conditions.append("{} = ?".format(column))
+                values.append(value)
+        return conditions, values, chunked
+
+    def find_documents(self, query_filter):
+        """Documents matching query filter.
+
+        Args:
+            query_filter (Dict[str, Any]): Mongo query filter.
+
+        Returns:
+            Iterable[Dict[str, Any]]: Matching documents.
+        """
+
+        conditions, values, chunked = self._sql_conditions(query_filter)
+        if conditions is None:
+            return
+
+        queries = []
+        if chunked is None:
+            queries.append((conditions, values))
+        else:
+            column, column_values = chunked
+            for idx in range(0, len(column_values), _SQL_CHUNK_SIZE):
+                chunk = column_values[idx:idx + _SQL_CHUNK_SIZE]
+                chunk_conditions = list(conditions)
+                chunk_conditions.append("{} IN ({})".format(
+                    column, ", ".join("?" for _ in chunk)
+                ))
+                queries.append((chunk_conditions, values + chunk))
+
+        for query_conditions, query_values in queries:
+            query = "SELECT doc FROM documents"
+            if query_conditions:
+                query += " WHERE " + " AND ".join(query_conditions)
+            query += " ORDER BY rowid"
+            for row in self._execute(query, query_values):
+                doc = loads(row[0], json_options=CANONICAL_JSON_OPTIONS)
+                if match_document(doc, query_filter):
+                    yield doc
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class SnapshotCollection(object):
+    """Read-only replacement of project collection backed by snapshot.
+
+    Aggregations are not evaluated on snapshot but sent to mongo.
+
+    Args:
+        snapshot (ProjectSnapshot): Snapshot of the project.
+    """
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    @property
+    def name(self):
+        return self._snapshot.project_name
+
+    def find(self, filter=None, projection=None):
+        return SnapshotCursor(self._snapshot, filter, projection)
+
+    def find_one(self, filter=None, projection=None):
+        for doc in self.find(filter, projection).limit(1):
+            return doc
+        return None
+
+    def aggregate(self, pipeline, *args, **kwargs):
+        collection = get_project_connection(self._snapshot.project_name)
+        return collection.aggregate(pipeline, *args, **kwargs)
+
+
+_snapshot_lock = threading.Lock()
+# Loaded snapshot by path
+_snapshots = {}
+# Projects changed by current process
+_stale_projects = set()
+
+
+def _get_snapshot(path):
+    with _snapshot_lock:
+        snapshot = _snapshots.get(path)
+        if snapshot is None:
+            snapshot = ProjectSnapshot(path)
+            _snapshots[path] = snapshot
+    return snapshot
+
+
+def get_project_snapshot(project_name):
+    """Snapshot of project if is available and can be used.
+
+    Snapshot is available if 'OPENPYPE_PROJECT_SNAPSHOT' points to existing
+    snapshot file of the project and the project was not changed by current
+    process.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        Union[ProjectSnapshot, None]: Snapshot of project.
+    """
+
+    path = os.environ.get(SNAPSHOT_ENV_KEY)
+    if (
+        not path
+        or project_name in _stale_projects
+        or not os.path.exists(path)
+    ):
+        return None
+
+    snapshot = _get_snapshot(path)
+    if snapshot.project_name != project_name:
+        return None
+    return snapshot
+
+
+def mark_project_snapshot_stale(project_name=None):
+    """Stop using snapshot of project because data in mongo were changed.
+
+    Args:
+        project_name (Optional[str]): Name of changed project. Snapshots
+            of all projects are marked as stale if not passed.
+    """
+
+    path = os.environ.get(SNAPSHOT_ENV_KEY)
+    if not path:
+        return
+
+    if project_name is None:
+        if os.path.exists(path):
+            project_name = _get_snapshot(path).project_name
+
+    if project_name:
+        _stale_projects.add(project_name)
+
+
+def get_project_read_connection(project_name):
+    """Collection used to read project and asset documents of project.
+
+    Returns snapshot collection if snapshot of project is available otherwise
+    mongo collection is returned. Snapshot contains only documents of types
+    in 'SNAPSHOT_DOCUMENT_TYPES', so the collection must not be used to
+    query other documents.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        Union[SnapshotCollection, pymongo.Collection]: Collection to read
+            documents from.
+    """
+
+    snapshot = get_project_snapshot(project_name)
+    if snapshot is not None:
+        return SnapshotCollection(snapshot)
+    return get_project_connection(project_name)
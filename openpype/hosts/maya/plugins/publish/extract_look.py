@@ -68,6 +68,38 @@ def find_paths_by_hash(texture_hash):
     return legacy_io.distinct(key, {"type": "version"})
 
 
+def find_paths_by_hashes(texture_hashes):
+    """Find paths of multiple texture hashes in single query.
+
+    Args:
+        texture_hashes (Iterable[str]): Hashes of textures.
+
+    Return:
+        dict: Paths to textures by hash.
+
+    """
+    texture_hashes = set(texture_hashes)
+    output = {texture_hash: [] for texture_hash in texture_hashes}
+    if not texture_hashes:
+        return output
+
+    keys = [
+        "data.sourceHashes.{0}".format(texture_hash)
+        for texture_hash in texture_hashes
+    ]
+    query = {
+        "type": "version",
+        "$or": [{key: {"$exists": True}} for key in keys]
+    }
+    for version_doc in legacy_io.find(query, {key: True for key in keys}):
+        source_hashes = version_doc.get("data", {}).get("sourceHashes", {})
+        for texture_hash, path in source_hashes.items():
+            paths = output.get(texture_hash)
+            if paths is not None and path not in paths:
+                paths.append(path)
+    return output
+
+
 def maketx(source, destination, args, logger):
     """Make `.tx` using `maketx` with some default settings.
 
@@ -364,6 +396,16 @@ class ExtractLook(publish.Extractor):
         else:
             force_copy = instance.data.get("forceCopy", False)
 
+        # Find already published textures in single query
+        hash_args = []
+        if do_maketx:
+            hash_args.append("maketx")
+        texture_hashes = {
+            filepath: source_hash(filepath, *hash_args)
+            for filepath in files_metadata
+        }
+        existing_by_hash = find_paths_by_hashes(texture_hashes.values())
+
         for filepath in files_metadata:
 
             linearize = False
@@ -380,7 +422,9 @@ class ExtractLook(publish.Extractor):
                 do_maketx,
                 staging=staging_dir,
                 linearize=linearize,
-                force=force_copy
+                force=force_copy,
+                texture_hash=texture_hashes[filepath],
+                existing=existing_by_hash[texture_hashes[filepath]]
             )
             destination = self.resource_destination(instance,
                                                     source,
@@ -482,7 +526,16 @@ class ExtractLook(publish.Extractor):
             resources_dir, basename + ext
         )
 
-    def _process_texture(self, filepath, do_maketx, staging, linearize, force):
+    def _process_texture(
+        self,
+        filepath,
+        do_maketx,
+        staging,
+        linearize,
+        force,
+        texture_hash=None,
+        existing=None
+    ):
         """Process a single texture file on disk for publishing.
         This will:
             1. Check whether it's already published, if so it will do hardlink
@@ -491,19 +544,23 @@ class ExtractLook(publish.Extractor):
         Args:
             filepath (str): The source file path to process.
             do_maketx (bool): Whether to produce a .tx file
+            texture_hash (str): Already computed hash of the texture.
+            existing (list): Already found published paths of the texture.
         Returns:
         """
 
         fname, ext = os.path.splitext(os.path.basename(filepath))
 
-        args = []
-        if do_maketx:
-            args.append("maketx")
-        texture_hash = source_hash(filepath, *args)
+        if texture_hash is None:
+            args = []
+            if do_maketx:
+                args.append("maketx")
+            texture_hash = source_hash(filepath, *args)
 
         # If source has been published before with the same settings,
         # then don't reprocess but hardlink from the original
-        existing = find_paths_by_hash(texture_hash)
+        if existing is None:
+            existing = find_paths_by_hash(texture_hash)
         if existing and not force:
             self.log.info("Found hash in database, preparing hardlink..")
             source = next((p for p in existing if os.path.exists(p)), None)
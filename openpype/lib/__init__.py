@@ -102,7 +102,9 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    CompiledProfiles,
+    get_compiled_profiles,
 )
 
 from .transcoding import (
@@ -189,12 +191,19 @@ from .plugin_tools import (
     filter_pyblish_plugins,
     set_plugin_attributes_from_settings,
     source_hash,
+    source_hash_from_stat,
+)
+
+from .content_hash import (
+    get_content_hash,
+    get_content_hashes,
 )
 
 from .path_tools import (
     format_file_size,
     collect_frames,
     create_hard_link,
+    get_files_stats,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
@@ -334,6 +343,8 @@ __all__ = [
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "CompiledProfiles",
+    "get_compiled_profiles",
 
     "TaskNotSetError",
     "get_subset_name",
@@ -341,10 +352,15 @@ __all__ = [
     "filter_pyblish_plugins",
     "set_plugin_attributes_from_settings",
     "source_hash",
+    "source_hash_from_stat",
+
+    "get_content_hash",
+    "get_content_hashes",
 
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "get_files_stats",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
@@ -0,0 +1,132 @@
+"""Content hashes of files.
+
+Unlike 'source_hash' which identifies file by name, modification time and
+size, content hash is computed from content of file. Files with identical
+content have the same hash regardless their name or location, which is
+used to deduplicate published files.
+
+Files are read in chunks. Files bigger than 'CONTENT_HASH_SEGMENT_SIZE' are
+split into segments hashed in parallel and hash of the file is hash of
+segment digests, so the hash does not depend on number of threads.
+"""
+
+import os
+import hashlib
+import binascii
+
+# Size of chunk read from file at once
+CONTENT_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+# Size of segments of big files hashed in parallel
+CONTENT_HASH_SEGMENT_SIZE = 64 * 1024 * 1024
+DEFAULT_CONTENT_HASH_ALGORITHM = "blake2b"
+# Algorithms available with 'xxhash' module
+XXHASH_ALGORITHMS = ("xxh3_64", "xxh3_128", "xxh64", "xxh128")
+
+
+def _get_hasher(algorithm):
+    if algorithm in XXHASH_ALGORITHMS:
+        import xxhash
+
+        return getattr(xxhash, algorithm)()
+    return hashlib.new(algorithm)
+
+
+def _get_executor_class():
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:
+        ThreadPoolExecutor = None
+    return ThreadPoolExecutor
+
+
+def _hash_segment(path, algorithm, offset, size):
+    hasher = _get_hasher(algorithm)
+    with open(path, "rb") as stream:
+        stream.seek(offset)
+        remaining = size
+        while remaining > 0:
+            chunk = stream.read(min(CONTENT_HASH_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            hasher.update(chunk)
+            remaining -= len(chunk)
+    return hasher.digest()
+
+
+def get_content_hash(path, algorithm=None, max_workers=4):
+    """Hash of file content.
+
+    Args:
+        path (str): Path to file.
+        algorithm (Optional[str]): Name of algorithm from 'hashlib' or from
+            'XXHASH_ALGORITHMS' if 'xxhash' module is available.
+            'DEFAULT_CONTENT_HASH_ALGORITHM' is used if not passed.
+        max_workers (Optional[int]): Maximum number of threads hashing
+            segments of big file.
+
+    Returns:
+        str: Hash in format "<algorithm>:<hex digest>".
+    """
+
+    if algorithm is None:
+        algorithm = DEFAULT_CONTENT_HASH_ALGORITHM
+
+    size = os.path.getsize(path)
+    if size <= CONTENT_HASH_SEGMENT_SIZE:
+        digest = _hash_segment(path, algorithm, 0, size)
+
+    else:
+        offsets = range(0, size, CONTENT_HASH_SEGMENT_SIZE)
+        executor_class = _get_executor_class()
+        if executor_class is None or max_workers < 2:
+            digests = [
+                _hash_segment(
+                    path, algorithm, offset, CONTENT_HASH_SEGMENT_SIZE
+                )
+                for offset in offsets
+            ]
+        else:
+            with executor_class(max_workers) as executor:
+                digests = list(executor.map(
+                    lambda offset: _hash_segment(
+                        path, algorithm, offset, CONTENT_HASH_SEGMENT_SIZE
+                    ),
+                    offsets
+                ))
+
+        hasher = _get_hasher(algorithm)
+        for segment_digest in digests:
+            hasher.update(segment_digest)
+        digest = hasher.digest()
+
+    return "{}:{}".format(
+        algorithm, binascii.hexlify(digest).decode("ascii")
+    )
+
+
+def get_content_hashes(paths, algorithm=None, max_workers=4):
+    """Hashes of content of multiple files computed in parallel.
+
+    Args:
+        paths (Iterable[str]): Paths to files.
+        algorithm (Optional[str]): Name of hash algorithm.
+        max_workers (Optional[int]): Maximum number of threads.
+
+    Returns:
+        Dict[str, str]: Content hash by path.
+    """
+
+    paths = list(set(paths))
+    executor_class = _get_executor_class()
+    if executor_class is None or max_workers < 2 or len(paths) < 2:
+        return {
+            path: get_content_hash(path, algorithm, max_workers)
+            for path in paths
+        }
+
+    with executor_class(min(max_workers, len(paths))) as executor:
+        hashes = executor.map(
+            lambda path: get_content_hash(path, algorithm, max_workers),
+            paths
+        )
+        return dict(zip(paths, hashes))
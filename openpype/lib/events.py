@@ -2,10 +2,15 @@
 import os
 import re
 import copy
+import time
 import inspect
 import logging
 import weakref
+import threading
+import collections
 from uuid import uuid4
+
+from six.moves import queue
 try:
     from weakref import WeakMethod
 except Exception:
@@ -40,14 +45,18 @@ class EventCallback(object):
     Args:
         topic(str): Topic which will be listened.
         func(func): Callback to a topic.
+        event_system (Optional[EventSystem]): Event system where callback
+            is registered. Callback is removed from the system when is
+            deregistered or the function is garbage collected.
 
     Raises:
         TypeError: When passed function is not a callable object.
     """
 
-    def __init__(self, topic, func):
+    def __init__(self, topic, func, event_system=None):
         self._log = None
         self._topic = topic
+        self._event_system = event_system
         # Replace '*' with any character regex and escape rest of text
         #   - when callback is registered for '*' topic it will receive all
         #       events
@@ -66,9 +75,9 @@ class EventCallback(object):
         # Convert callback into references
         #   - deleted functions won't cause crashes
         if inspect.ismethod(func):
-            func_ref = WeakMethod(func)
+            func_ref = WeakMethod(func, self._on_func_collected)
         elif callable(func):
-            func_ref = weakref.ref(func)
+            func_ref = weakref.ref(func, self._on_func_collected)
         else:
             raise TypeError((
                 "Registered callback is not callable. \"{}\""
@@ -128,6 +137,11 @@ class EventCallback(object):
             self.__class__.__name__, self._func_name, self._func_path
         )
 
+    @property
+    def topic(self):
+        """Topic to which is callback registered."""
+        return self._topic
+
     @property
     def log(self):
         if self._log is None:
@@ -159,6 +173,15 @@ class EventCallback(object):
         """Calling this funcion will cause that callback will be removed."""
         # Fake reference
         self._ref_valid = False
+        if self._event_system is not None:
+            self._event_system._remove_callbacks([self])
+
+    def _on_func_collected(self, _ref):
+        # Called by garbage collector so only mark the callback as invalid
+        #   and let event system remove it on next emit
+        self._ref_valid = False
+        if self._event_system is not None:
+            self._event_system._mark_collected_callbacks()
 
     def topic_matches(self, topic):
         """Check if event topic matches callback's topic."""
@@ -318,11 +341,49 @@ class EventSystem(object):
     so it is possible to create mutltiple independent systems that have their
     topics and callbacks.
 
+    Callbacks registered to exact topic are stored by topic and callbacks
+    with wildcard by the part of topic before first '*'. Callbacks matching
+    a topic are resolved once and cached until callbacks change. Callbacks
+    are always triggered in order of registration. Deregistered callbacks
+    are removed immediately, callbacks with garbage collected function on
+    next emit.
+
+    Events can be dispatched asynchronously in a worker thread, then
+    'emit_event' only adds event to queue. Use 'wait_for_events' to wait
+    until all queued events are processed.
+
+    Latency of events, time from emit until all callbacks were processed,
+    is collected by topic and available using 'get_metrics'.
 
+    Args:
+        async_dispatch (bool): Process events in a worker thread.
     """
 
-    def __init__(self):
+    # Maximum number of cached resolved topics
+    resolved_cache_size = 1024
+
+    def __init__(self, async_dispatch=False):
         self._registered_callbacks = []
+        self._callbacks_order = {}
+        self._next_order = 0
+        self._callbacks_by_topic = collections.defaultdict(list)
+        self._wildcard_callbacks_by_prefix = collections.defaultdict(list)
+        self._wildcard_prefix_lengths = []
+        self._resolved_callbacks = {}
+        self._has_collected_callbacks = False
+        self._lock = threading.RLock()
+
+        self._metrics = {}
+        self._metrics_lock = threading.Lock()
+
+        self._async_dispatch = async_dispatch
+        self._queue = queue.Queue()
+        self._worker = None
+
+    @property
+    def async_dispatch(self):
+        """Events are processed in a worker thread."""
+        return self._async_dispatch
 
     def add_callback(self, topic, callback):
         """Register callback in event system.
@@ -337,10 +398,90 @@ class EventSystem(object):
                 stop listening.
         """
 
-        callback = EventCallback(topic, callback)
-        self._registered_callbacks.append(callback)
+        callback = EventCallback(topic, callback, self)
+        with self._lock:
+            self._registered_callbacks.append(callback)
+            self._callbacks_order[callback] = self._next_order
+            self._next_order += 1
+            if "*" in topic:
+                prefix = topic.split("*", 1)[0]
+                self._wildcard_callbacks_by_prefix[prefix].append(callback)
+                if len(prefix) not in self._wildcard_prefix_lengths:
+                    self._wildcard_prefix_lengths.append(len(prefix))
+                    self._wildcard_prefix_lengths.sort()
+            else:
+                self._callbacks_by_topic[topic].append(callback)
+            self._resolved_callbacks = {}
         return callback
 
+    def _remove_callbacks(self, callbacks):
+        with self._lock:
+            for callback in callbacks:
+                if callback not in self._callbacks_order:
+                    continue
+                self._registered_callbacks.remove(callback)
+                self._callbacks_order.pop(callback)
+                topic = callback.topic
+                if "*" in topic:
+                    prefix = topic.split("*", 1)[0]
+                    by_prefix = self._wildcard_callbacks_by_prefix
+                    by_prefix[prefix].remove(callback)
+                    if not by_prefix[prefix]:
+                        by_prefix.pop(prefix)
+                        self._wildcard_prefix_lengths = sorted({
+                            len(item) for item in by_prefix.keys()
+                        })
+                else:
+                    self._callbacks_by_topic[topic].remove(callback)
+                    if not self._callbacks_by_topic[topic]:
+                        self._callbacks_by_topic.pop(topic)
+            self._resolved_callbacks = {}
+
+    def _mark_collected_callbacks(self):
+        self._has_collected_callbacks = True
+
+    def _remove_collected_callbacks(self):
+        self._has_collected_callbacks = False
+        with self._lock:
+            self._remove_callbacks([
+                callback
+                for callback in self._registered_callbacks
+                if not callback.is_ref_valid
+            ])
+
+    def _get_topic_callbacks(self, topic):
+        """Callbacks matching topic in order of registration.
+
+        Args:
+            topic (str): Event topic.
+
+        Returns:
+            Tuple[EventCallback, ...]: Matching callbacks.
+        """
+
+        callbacks = self._resolved_callbacks.get(topic)
+        if callbacks is not None:
+            return callbacks
+
+        with self._lock:
+            matching = list(self._callbacks_by_topic.get(topic, []))
+            for prefix_length in self._wildcard_prefix_lengths:
+                if prefix_length > len(topic):
+                    break
+                prefix_callbacks = self._wildcard_callbacks_by_prefix.get(
+                    topic[:prefix_length]
+                )
+                for callback in prefix_callbacks or []:
+                    if callback.topic_matches(topic):
+                        matching.append(callback)
+
+            matching.sort(key=self._callbacks_order.__getitem__)
+            callbacks = tuple(matching)
+            if len(self._resolved_callbacks) >= self.resolved_cache_size:
+                self._resolved_callbacks = {}
+            self._resolved_callbacks[topic] = callbacks
+        return callbacks
+
     def create_event(self, topic, data, source):
         """Create new event which is bound to event system.
 
@@ -376,18 +517,118 @@ class EventSystem(object):
     def emit_event(self, event):
         """Emit event object.
 
+        Event is only added to queue if asynchronous dispatch is enabled.
+
         Args:
             event (Event): Prepared event with topic and data.
         """
 
+        if not self._async_dispatch:
+            self._dispatch_event(event, time.time())
+            return
+
+        if self._worker is None or not self._worker.is_alive():
+            self._start_worker()
+        self._queue.put((event, time.time()))
+
+    def _dispatch_event(self, event, emit_time):
+        if self._has_collected_callbacks:
+            self._remove_collected_callbacks()
+
         invalid_callbacks = []
-        for callback in self._registered_callbacks:
+        for callback in self._get_topic_callbacks(event.topic):
             callback.process_event(event)
             if not callback.is_ref_valid:
                 invalid_callbacks.append(callback)
 
-        for callback in invalid_callbacks:
-            self._registered_callbacks.remove(callback)
+        if invalid_callbacks:
+            self._remove_callbacks(invalid_callbacks)
+
+        self._add_metric(event.topic, time.time() - emit_time)
+
+    def _start_worker(self):
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            worker = threading.Thread(
+                target=self._worker_loop, name="EventSystemWorker"
+            )
+            worker.daemon = True
+            self._worker = worker
+            worker.start()
+
+    def _worker_loop(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                event, emit_time = item
+                self._dispatch_event(event, emit_time)
+
+            except Exception:
+                logging.getLogger(self.__class__.__name__).warning(
+                    "Failed to dispatch event", exc_info=True
+                )
+
+            finally:
+                self._queue.task_done()
+
+    def wait_for_events(self):
+        """Wait until all queued events are processed.
+
+        Must not be called from event callback when asynchronous dispatch
+        is enabled.
+        """
+
+        if self._async_dispatch:
+            self._queue.join()
+
+    def stop(self):
+        """Process queued events and stop worker thread."""
+        worker = self._worker
+        if worker is None or not worker.is_alive():
+            return
+        self._queue.put(None)
+        worker.join()
+        self._worker = None
+
+    def _add_metric(self, topic, latency):
+        with self._metrics_lock:
+            metric = self._metrics.get(topic)
+            if metric is None:
+                metric = self._metrics[topic] = [0, 0.0, 0.0]
+            metric[0] += 1
+            metric[1] += latency
+            if latency > metric[2]:
+                metric[2] = latency
+
+    def get_metrics(self):
+        """Latency of events by topic.
+
+        Latency is time from emit of event until all callbacks were
+        processed, including time in queue.
+
+        Returns:
+            Dict[str, Dict[str, Union[int, float]]]: Count of events, total,
+                average and maximum latency in seconds by topic.
+        """
+
+        with self._metrics_lock:
+            return {
+                topic: {
+                    "count": count,
+                    "total": total,
+                    "average": total / count,
+                    "max": max_latency,
+                }
+                for topic, (count, total, max_latency) in self._metrics.items()
+            }
+
+    def reset_metrics(self):
+        """Clear collected latency metrics."""
+        with self._metrics_lock:
+            self._metrics = {}
 
 
 class GlobalEventSystem:
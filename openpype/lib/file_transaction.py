@@ -2,16 +2,567 @@ import os
 import logging
 import sys
 import errno
+import json
+import shutil
+import socket
+import threading
+import time
+import uuid
 import six
 
 from openpype.lib import create_hard_link
 
+try:
+    from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+except ImportError:
+    # Python 2 without 'futures' backport transfers files serially
+    ThreadPoolExecutor = None
+
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
     from speedcopy import copyfile
 else:
     from shutil import copyfile
 
+# Default maximum number of threads transferring files
+DEFAULT_MAX_WORKERS = 8
+# Size of chunk copied by kernel between progress reports
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+# 'ioctl' request to clone file on Linux filesystems with reflink support
+FICLONE = 0x40049409
+# Errors of kernel copy functions when fallback should be used
+_FALLBACK_ERRNOS = {
+    getattr(errno, name)
+    for name in (
+        "EXDEV", "ENOSYS", "EINVAL", "EOPNOTSUPP", "ENOTSUP", "ENOTTY",
+        "EBADF", "EPERM", "ETXTBSY",
+    )
+    if hasattr(errno, name)
+}
+
+
+def _reflink_file(src_fd, dst_fd):
+    """Clone file content using reflink.
+
+    Returns:
+        bool: File was cloned.
+    """
+
+    try:
+        import fcntl
+
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    except (ImportError, IOError, OSError):
+        return False
+    return True
+
+
+def _kernel_copy(src_fd, dst_fd, size, progress_callback=None):
+    """Copy content of file using kernel side copy functions.
+
+    Uses 'copy_file_range' or 'sendfile' when available.
+
+    Returns:
+        bool: File content was copied.
+    """
+
+    copy_func = getattr(os, "copy_file_range", None)
+    if copy_func is None:
+        copy_func = getattr(os, "sendfile", None)
+        if copy_func is None:
+            return False
+
+        def copy_func(_src_fd, _dst_fd, count, _sendfile=copy_func):
+            return _sendfile(_dst_fd, _src_fd, None, count)
+
+    copied = 0
+    while True:
+        try:
+            chunk_copied = copy_func(src_fd, dst_fd, COPY_CHUNK_SIZE)
+        except OSError as exc:
+            if copied == 0 and exc.errno in _FALLBACK_ERRNOS:
+                return False
+            raise
+
+        if chunk_copied == 0:
+            break
+        copied += chunk_copied
+        if progress_callback is not None:
+            progress_callback(chunk_copied)
+
+    if copied < size:
+        raise IOError(
+            errno.EIO,
+            "Copied {} bytes of {} bytes".format(copied, size),
+        )
+    return True
+
+
+def fast_copyfile(src, dst, progress_callback=None):
+    """Copy content of file with kernel side copy if possible.
+
+    On Linux is file cloned using reflink if filesystem supports it,
+    otherwise is content copied using 'copy_file_range' or 'sendfile'.
+    Other platforms use 'copyfile' ('speedcopy' on Windows).
+
+    Args:
+        src (str): Source path.
+        dst (str): Destination path.
+        progress_callback (Optional[Callable[[int], None]]): Called with
+            number of copied bytes.
+    """
+
+    size = os.path.getsize(src)
+    if not sys.platform.startswith("linux"):
+        copyfile(src, dst)
+        if progress_callback is not None:
+            progress_callback(size)
+        return
+
+    with open(src, "rb") as src_stream:
+        with open(dst, "wb") as dst_stream:
+            src_fd = src_stream.fileno()
+            dst_fd = dst_stream.fileno()
+            if size and _reflink_file(src_fd, dst_fd):
+                if progress_callback is not None:
+                    progress_callback(size)
+                return
+
+            if size and _kernel_copy(
+                src_fd, dst_fd, size, progress_callback
+            ):
+                return
+
+            src_stream.seek(0)
+            dst_stream.seek(0)
+            dst_stream.truncate()
+            shutil.copyfileobj(src_stream, dst_stream)
+            if progress_callback is not None:
+                progress_callback(size)
+
+
+class TransferProgress(object):
+    """Progress of file transfer in FileTransaction.
+
+    Attributes:
+        src (str): Source path of file which changed progress.
+        dst (str): Destination path of file which changed progress.
+        file_bytes (int): Transferred bytes of the file.
+        file_size (int): Size of the file.
+        done_bytes (int): Transferred bytes of all files.
+        total_bytes (int): Size of all files.
+        done_files (int): Count of transferred files.
+        total_files (int): Count of all files.
+    """
+
+    def __init__(
+        self,
+        src,
+        dst,
+        file_bytes,
+        file_size,
+        done_bytes,
+        total_bytes,
+        done_files,
+        total_files
+    ):
+        self.src = src
+        self.dst = dst
+        self.file_bytes = file_bytes
+        self.file_size = file_size
+        self.done_bytes = done_bytes
+        self.total_bytes = total_bytes
+        self.done_files = done_files
+        self.total_files = total_files
+
+    @property
+    def file_finished(self):
+        return self.file_bytes >= self.file_size
+
+    def to_data(self):
+        return {
+            "src": self.src,
+            "dst": self.dst,
+            "file_bytes": self.file_bytes,
+            "file_size": self.file_size,
+            "done_bytes": self.done_bytes,
+            "total_bytes": self.total_bytes,
+            "done_files": self.done_files,
+            "total_files": self.total_files,
+        }
+
+
+def get_file_transactions_journal_dir():
+    """Directory where journals of file transactions are stored."""
+    import appdirs
+
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "file_transactions"
+    )
+
+
+def _fsync_file(path):
+    with open(path, "rb") as stream:
+        os.fsync(stream.fileno())
+
+
+def _fsync_dir(dirpath):
+    # Directories can't be opened on Windows, renames are journaled by NTFS
+    if os.name == "nt":
+        return
+    fd = os.open(dirpath, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _is_process_running(pid):
+    """Is process with pid running.
+
+    Returns 'True' if it can't be determined.
+    """
+
+    if not pid or pid < 0:
+        return False
+
+    try:
+        import psutil
+
+        return psutil.pid_exists(pid)
+    except ImportError:
+        pass
+
+    if os.name == "nt":
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except OSError as exc:
+        return exc.errno == errno.EPERM
+    return True
+
+
+class TransactionJournal(object):
+    """On disk journal of journaled file transaction.
+
+    Journal contains entries of transferred files with source, destination,
+    temporary path next to destination and backup path of existing
+    destination file. Files are transferred to temporary paths in
+    'transferring' state. All temporary files are renamed to destinations
+    in 'committing' state, existing destination files are renamed to backup
+    paths first.
+
+    State of each entry is resolved from files on disk, so interrupted
+    transaction can be completed or rolled back from the journal.
+
+    Args:
+        path (str): Path to journal file.
+        transaction_id (str): Unique id of transaction.
+        entries (List[Dict[str, Union[str, None]]]): Transferred files.
+        state (str): State of transaction.
+        pid (Optional[int]): Id of process which created the transaction.
+        hostname (Optional[str]): Machine where transaction was created.
+        created (Optional[float]): Time when transaction was created.
+        fsync (Optional[bool]): Flush journal to disk on save.
+    """
+
+    STATE_TRANSFERRING = "transferring"
+    STATE_COMMITTING = "committing"
+
+    def __init__(
+        self,
+        path,
+        transaction_id,
+        entries,
+        state=STATE_TRANSFERRING,
+        pid=None,
+        hostname=None,
+        created=None,
+        fsync=False
+    ):
+        if pid is None:
+            pid = os.getpid()
+        if hostname is None:
+            hostname = socket.gethostname()
+        if created is None:
+            created = time.time()
+
+        self.path = path
+        self.transaction_id = transaction_id
+        self.entries = entries
+        self.state = state
+        self.pid = pid
+        self.hostname = hostname
+        self.created = created
+        self.fsync = fsync
+
+    @classmethod
+    def create(cls, transfers, journal_dir=None, fsync=False):
+        """Create journal for transfers.
+
+        Args:
+            transfers (Iterable[Tuple[str, str]]): Source and destination
+                paths.
+            journal_dir (Optional[str]): Directory where journal is stored.
+                Output of 'get_file_transactions_journal_dir' is used if
+                not passed.
+            fsync (Optional[bool]): Flush journal to disk on save.
+
+        Returns:
+            TransactionJournal: Journal which is not saved yet.
+        """
+
+        if journal_dir is None:
+            journal_dir = get_file_transactions_journal_dir()
+        transaction_id = uuid.uuid4().hex
+        suffix = transaction_id[:8]
+        entries = []
+        for src, dst in transfers:
+            backup = None
+            if os.path.exists(dst):
+                backup = "{}.{}.bak".format(dst, suffix)
+            entries.append({
+                "src": src,
+                "dst": dst,
+                "tmp": "{}.{}.tmp".format(dst, suffix),
+                "backup": backup,
+            })
+
+        path = os.path.join(journal_dir, transaction_id + ".json")
+        return cls(path, transaction_id, entries, fsync=fsync)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r") as stream:
+            data = json.load(stream)
+        return cls(
+            path,
+            data["id"],
+            data["entries"],
+            data["state"],
+            data.get("pid"),
+            data.get("hostname"),
+            data.get("created")
+        )
+
+    def to_data(self):
+        return {
+            "id": self.transaction_id,
+            "state": self.state,
+            "pid": self.pid,
+            "hostname": self.hostname,
+            "created": self.created,
+            "entries": self.entries,
+        }
+
+    def save(self):
+        """Store journal to disk atomically."""
+        dirpath = os.path.dirname(self.path)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        tmp_path = "{}.{}.tmp".format(self.path, os.getpid())
+        with open(tmp_path, "w") as stream:
+            json.dump(self.to_data(), stream)
+            if self.fsync:
+                stream.flush()
+                os.fsync(stream.fileno())
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        os.rename(tmp_path, self.path)
+        if self.fsync:
+            _fsync_dir(dirpath)
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def is_owner_running(self):
+        """Process which created the transaction may be still running."""
+        if self.hostname != socket.gethostname():
+            return True
+        return _is_process_running(self.pid)
+
+    def commit(self, log=None):
+        """Rename temporary files to destinations.
+
+        Can be called repeatedly, already committed entries are skipped.
+        """
+
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+
+        if self.state != self.STATE_COMMITTING:
+            self.state = self.STATE_COMMITTING
+            self.save()
+
+        dirpaths = set()
+        for entry in self.entries:
+            tmp = entry["tmp"]
+            dst = entry["dst"]
+            backup = entry["backup"]
+            if not os.path.exists(tmp):
+                continue
+
+            if (
+                backup
+                and os.path.exists(dst)
+                and not os.path.exists(backup)
+            ):
+                log.debug("Backup existing file: {} -> {}".format(
+                    dst, backup))
+                os.rename(dst, backup)
+
+            os.rename(tmp, dst)
+            dirpaths.add(os.path.dirname(dst))
+
+        if self.fsync:
+            for dirpath in dirpaths:
+                _fsync_dir(dirpath)
+
+    def remove_backups(self, log=None):
+        """Remove backups of replaced files.
+
+        Returns:
+            int: Number of errors.
+        """
+
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+
+        errors = 0
+        for entry in self.entries:
+            backup = entry["backup"]
+            if not backup or not os.path.exists(backup):
+                continue
+            try:
+                os.remove(backup)
+            except OSError:
+                errors += 1
+                log.error(
+                    "Failed to remove backup file: {}".format(backup),
+                    exc_info=True)
+        return errors
+
+    def rollback(self, log=None):
+        """Remove transferred files and restore backups.
+
+        Returns:
+            int: Number of errors.
+        """
+
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+
+        errors = 0
+        committing = self.state == self.STATE_COMMITTING
+        for entry in self.entries:
+            tmp = entry["tmp"]
+            dst = entry["dst"]
+            backup = entry["backup"]
+            try:
+                if os.path.exists(tmp):
+                    # Destination was not replaced yet
+                    os.remove(tmp)
+                    if (
+                        backup
+                        and os.path.exists(backup)
+                        and not os.path.exists(dst)
+                    ):
+                        os.rename(backup, dst)
+
+                elif backup:
+                    if os.path.exists(backup):
+                        if os.path.exists(dst):
+                            os.remove(dst)
+                        os.rename(backup, dst)
+
+                elif committing and os.path.exists(dst):
+                    os.remove(dst)
+
+            except OSError:
+                errors += 1
+                log.error(
+                    "Failed to rollback file: {}".format(dst),
+                    exc_info=True)
+        return errors
+
+
+def recover_file_transactions(
+    journal_dir=None, rollback=False, force=False, log=None
+):
+    """Complete or rollback interrupted journaled file transactions.
+
+    Transactions interrupted during transfer are always rolled back.
+    Transactions interrupted during commit are completed, or rolled back
+    if 'rollback' is enabled. Transactions of processes which are still
+    running are skipped unless 'force' is enabled.
+
+    Args:
+        journal_dir (Optional[str]): Directory with journals. Output of
+            'get_file_transactions_journal_dir' is used if not passed.
+        rollback (Optional[bool]): Rollback also committing transactions.
+        force (Optional[bool]): Recover transactions of running processes.
+        log (Optional[logging.Logger]): Logger.
+
+    Returns:
+        List[str]: Paths to recovered journals.
+    """
+
+    if log is None:
+        log = logging.getLogger("FileTransaction")
+
+    if journal_dir is None:
+        journal_dir = get_file_transactions_journal_dir()
+
+    if not os.path.exists(journal_dir):
+        return []
+
+    recovered = []
+    for filename in sorted(os.listdir(journal_dir)):
+        if not filename.endswith(".json"):
+            continue
+        path = os.path.join(journal_dir, filename)
+        try:
+            journal = TransactionJournal.load(path)
+        except (IOError, OSError, ValueError, KeyError):
+            log.warning(
+                "Failed to read transaction journal: {}".format(path),
+                exc_info=True)
+            continue
+
+        if not force and journal.is_owner_running():
+            log.info((
+                "Skipping transaction {} of running process {} on {}"
+            ).format(journal.transaction_id, journal.pid, journal.hostname))
+            continue
+
+        if (
+            rollback
+            or journal.state == TransactionJournal.STATE_TRANSFERRING
+        ):
+            log.info("Rolling back transaction {} ({} files)".format(
+                journal.transaction_id, len(journal.entries)))
+            errors = journal.rollback(log)
+        else:
+            log.info("Completing transaction {} ({} files)".format(
+                journal.transaction_id, len(journal.entries)))
+            journal.commit(log)
+            errors = journal.remove_backups(log)
+
+        if errors:
+            log.error(
+                "{} errors occurred during recovery of {}".format(
+                    errors, journal.transaction_id))
+            continue
+
+        journal.remove()
+        recovered.append(path)
+    return recovered
+
 
 class FileTransaction(object):
     """File transaction with rollback options.
@@ -39,17 +590,68 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Files are transferred in a pool of threads. Number of threads can be
+    defined per destination root, e.g. lower for slow storage. When any
+    transfer fails, running transfers are finished, not started are
+    cancelled and the error is raised. Partially copied file is marked as
+    transferred so rollback removes it.
+
+    In journaled mode are files transferred to temporary files next to
+    destinations and renamed to destinations when all transfers finished.
+    Transferred files are recorded in journal on disk so transaction
+    interrupted by crash can be completed or rolled back with
+    'recover_file_transactions'. Journal is removed in 'finalize' or
+    'rollback'.
+
+    Args:
+        log (Optional[logging.Logger]): Logger.
+        max_workers (Optional[int]): Maximum number of threads
+            transferring files. 'DEFAULT_MAX_WORKERS' is used if not passed.
+        workers_by_root (Optional[Dict[str, int]]): Maximum number of
+            threads by destination root path. Longest matching root is used.
+        progress_callback (Optional[Callable[[TransferProgress], None]]):
+            Called when transfer of a file progressed. Can be called from
+            different threads.
+        journal (Optional[bool]): Use journaled mode.
+        journal_dir (Optional[str]): Directory where journal is stored.
+        fsync (Optional[bool]): Flush transferred files and journal to disk
+            before commit. Slower but safe against power loss.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
+    # Hardlink and copy if hardlink can't be created (e.g. other device)
+    MODE_HARDLINK_OR_COPY = 2
 
-    def __init__(self, log=None):
+    def __init__(
+        self,
+        log=None,
+        max_workers=None,
+        workers_by_root=None,
+        progress_callback=None,
+        journal=False,
+        journal_dir=None,
+        fsync=False
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if max_workers is None:
+            max_workers = DEFAULT_MAX_WORKERS
+        self._max_workers = max(1, max_workers)
+        self._workers_by_root = {
+            os.path.normcase(os.path.normpath(root)): workers
+            for root, workers in (workers_by_root or {}).items()
+        }
+        self._progress_callback = progress_callback
+        self._use_journal = journal
+        self._journal_dir = journal_dir
+        self._fsync = fsync
+        self._journal = None
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -60,13 +662,24 @@ class FileTransaction(object):
         # Backup file location mapping to original locations
         self._backup_to_original = {}
 
+        # Stat of transferred files by destination path
+        self._transferred_stats = {}
+
+        # Progress of transfers
+        self._lock = threading.Lock()
+        self._done_bytes = 0
+        self._total_bytes = 0
+        self._done_files = 0
+        self._total_files = 0
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_HARDLINK_OR_COPY): Transfer
+                mode.
         """
 
         opts = {"mode": mode}
@@ -89,7 +702,42 @@ class FileTransaction(object):
 
         self._transfers[dst] = (src, opts)
 
+    @property
+    def queued_transfers(self):
+        """Queued transfers.
+
+        Returns:
+            List[Tuple[str, str, int]]: Source, destination and mode.
+        """
+
+        return [
+            (src, dst, opts["mode"])
+            for dst, (src, opts) in self._transfers.items()
+        ]
+
+    def update_transfer(self, dst, src, mode=MODE_COPY):
+        """Change source and mode of queued transfer.
+
+        Used to replace source with file with identical content.
+
+        Args:
+            dst (str): Destination path of queued transfer.
+            src (str): New source path.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_HARDLINK_OR_COPY): Transfer
+                mode.
+        """
+
+        dst = os.path.normpath(os.path.abspath(dst))
+        if dst not in self._transfers:
+            raise KeyError("Transfer to \"{}\" is not queued".format(dst))
+        src = os.path.normpath(os.path.abspath(src))
+        self._transfers[dst] = (src, {"mode": mode})
+
     def process(self):
+        if self._use_journal:
+            self._process_journaled()
+            return
+
         # Backup any existing files
         for dst, (src, _) in self._transfers.items():
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
@@ -106,6 +754,40 @@ class FileTransaction(object):
             os.rename(dst, backup)
 
         # Copy the files to transfer
+        transfers = self._get_transfers()
+        self._transfer_files([
+            (src, dst, dst, opts, size)
+            for src, dst, opts, size in transfers
+        ])
+
+    def _process_journaled(self):
+        transfers = self._get_transfers()
+        if not transfers:
+            return
+
+        journal = TransactionJournal.create(
+            [(src, dst) for src, dst, _, _ in transfers],
+            self._journal_dir,
+            self._fsync
+        )
+        journal.save()
+        self._journal = journal
+        self.log.debug("Transaction journal: {}".format(journal.path))
+
+        entries_by_dst = {entry["dst"]: entry for entry in journal.entries}
+        self._transfer_files([
+            (src, dst, entries_by_dst[dst]["tmp"], opts, size)
+            for src, dst, opts, size in transfers
+        ])
+
+        journal.commit(self.log)
+        self._transferred = [entry["dst"] for entry in journal.entries]
+        for entry in journal.entries:
+            if entry["backup"]:
+                self._backup_to_original[entry["backup"]] = entry["dst"]
+
+    def _get_transfers(self):
+        transfers = []
         for dst, (src, opts) in self._transfers.items():
             path_same = self._same_paths(src, dst)
             if path_same:
@@ -114,19 +796,162 @@ class FileTransaction(object):
                         src, dst))
                 continue
 
-            self._create_folder_for_file(dst)
+            if opts["mode"] == self.MODE_HARDLINK:
+                size = 0
+            else:
+                size = os.path.getsize(src)
+            transfers.append((src, dst, opts, size))
+        return transfers
+
+    def _transfer_files(self, transfers):
+        """Transfer files in threads.
+
+        Args:
+            transfers (List[Tuple[str, str, str, dict, int]]): Source,
+                destination, path where file is transferred, options and
+                size of file.
+        """
+
+        self._done_bytes = 0
+        self._done_files = 0
+        self._total_bytes = sum(item[4] for item in transfers)
+        self._total_files = len(transfers)
+
+        # Create folders once instead of trying to create them for each file
+        for dirpath in {os.path.dirname(item[2]) for item in transfers}:
+            if not os.path.isdir(dirpath):
+                self._create_folder(dirpath)
+
+        transfers_by_workers = {}
+        for transfer in transfers:
+            workers = self._get_dst_workers(transfer[1])
+            transfers_by_workers.setdefault(workers, []).append(transfer)
+
+        if ThreadPoolExecutor is None:
+            for transfer in transfers:
+                self._process_transfer(*transfer)
+            return
+
+        # Each group of workers has own pool so slow storage does not
+        #   block transfers to other storages
+        executors = []
+        futures = []
+        try:
+            for workers, group_transfers in transfers_by_workers.items():
+                executor = ThreadPoolExecutor(
+                    max_workers=min(workers, len(group_transfers))
+                )
+                executors.append(executor)
+                for transfer in group_transfers:
+                    futures.append(
+                        executor.submit(self._process_transfer, *transfer)
+                    )
+
+            wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                future.cancel()
+            wait(futures)
+
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+
+        for future in futures:
+            if not future.cancelled() and future.exception() is not None:
+                raise future.exception()
+
+    def _get_dst_workers(self, dst):
+        """Maximum number of threads for destination path."""
+        normalized = os.path.normcase(dst)
+        matching_root = None
+        for root in self._workers_by_root.keys():
+            if (
+                normalized.startswith(root.rstrip(os.sep) + os.sep)
+                and (matching_root is None or len(root) > len(matching_root))
+            ):
+                matching_root = root
+
+        if matching_root is None:
+            return self._max_workers
+        return max(1, self._workers_by_root[matching_root])
 
+    def _process_transfer(self, src, dst, target, opts, size):
+        try:
             if opts["mode"] == self.MODE_COPY:
                 self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
+                progress = _FileProgress(self, src, dst, size)
+                fast_copyfile(src, target, progress)
+                if self._fsync:
+                    _fsync_file(target)
+
             elif opts["mode"] == self.MODE_HARDLINK:
                 self.log.debug("Hardlinking file ... {} -> {}".format(
                     src, dst))
-                create_hard_link(src, dst)
+                create_hard_link(src, target)
+                self._add_progress(src, dst, 0, 0, size, True)
+
+            elif opts["mode"] == self.MODE_HARDLINK_OR_COPY:
+                try:
+                    create_hard_link(src, target)
+                    self.log.debug("Hardlinked file ... {} -> {}".format(
+                        src, dst))
+                    self._add_progress(src, dst, size, size, size, True)
+                except (OSError, NotImplementedError):
+                    self.log.debug("Copying file ... {} -> {}".format(
+                        src, dst))
+                    progress = _FileProgress(self, src, dst, size)
+                    fast_copyfile(src, target, progress)
+                    if self._fsync:
+                        _fsync_file(target)
+
+        except Exception:
+            # Make sure partially transferred file is removed on rollback
+            if os.path.exists(target):
+                with self._lock:
+                    self._transferred.append(target)
+            raise
 
-            self._transferred.append(dst)
+        # Stat is collected in worker thread to avoid serial stat calls
+        #   of destinations after transfer (rename does not change it)
+        stat = os.stat(target)
+        with self._lock:
+            self._transferred.append(target)
+            self._transferred_stats[dst] = stat
+
+    def _add_progress(self, src, dst, chunk_size, file_bytes, size, done):
+        with self._lock:
+            self._done_bytes += chunk_size
+            if done:
+                self._done_files += 1
+            progress = TransferProgress(
+                src,
+                dst,
+                file_bytes,
+                size,
+                self._done_bytes,
+                self._total_bytes,
+                self._done_files,
+                self._total_files
+            )
+
+        if self._progress_callback is None:
+            return
+
+        try:
+            self._progress_callback(progress)
+        except Exception:
+            self.log.warning(
+                "Failed to process transfer progress callback",
+                exc_info=True
+            )
 
     def finalize(self):
+        if self._journal is not None:
+            self._journal.remove_backups(self.log)
+            self._journal.remove()
+            self._journal = None
+            return
+
         # Delete any backed up files
         for backup in self._backup_to_original.keys():
             try:
@@ -137,6 +962,21 @@ class FileTransaction(object):
                     exc_info=True)
 
     def rollback(self):
+        if self._journal is not None:
+            errors = self._journal.rollback(self.log)
+            if not errors:
+                self._journal.remove()
+                self._journal = None
+            self._transferred = []
+            self._transferred_stats = {}
+            self._backup_to_original = {}
+            if errors:
+                self.log.error(
+                    "{} errors occurred during rollback.".format(errors),
+                    exc_info=True)
+                six.reraise(*sys.exc_info())
+            return
+
         errors = 0
         # Rollback any transferred files
         for path in self._transferred:
@@ -170,13 +1010,22 @@ class FileTransaction(object):
         """Return the processed transfers destination paths"""
         return list(self._transferred)
 
+    @property
+    def transferred_stats(self):
+        """Stat of transferred files by normalized destination path.
+
+        Returns:
+            Dict[str, os.stat_result]: Stat of files after transfer.
+        """
+
+        return dict(self._transferred_stats)
+
     @property
     def backups(self):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
-    def _create_folder_for_file(self, path):
-        dirname = os.path.dirname(path)
+    def _create_folder(self, dirname):
         try:
             os.makedirs(dirname)
         except OSError as e:
@@ -192,3 +1041,25 @@ class FileTransaction(object):
             return os.path.samefile(src, dst)
 
         return src == dst
+
+
+class _FileProgress(object):
+    """Progress of single file copy reported to FileTransaction."""
+
+    def __init__(self, file_transaction, src, dst, size):
+        self._file_transaction = file_transaction
+        self._src = src
+        self._dst = dst
+        self._size = size
+        self._file_bytes = 0
+
+    def __call__(self, chunk_size):
+        self._file_bytes += chunk_size
+        self._file_transaction._add_progress(
+            self._src,
+            self._dst,
+            chunk_size,
+            self._file_bytes,
+            self._size,
+            self._file_bytes >= self._size
+        )
@@ -10,6 +10,39 @@ KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+# Maximum number of parsed templates kept in cache
+PARSED_TEMPLATES_CACHE_SIZE = 4096
+
+
+# Split keys to subdict keys by key with modifiers
+_split_keys_cache = {}
+
+
+def _split_key(key):
+    """Split formatting key to subdict keys.
+
+    Example:
+        "project[name]" -> ("project", "name")
+        "version:0>3" -> ("version", )
+
+    Args:
+        key (str): Key used in template.
+
+    Returns:
+        Tuple[str]: Keys of nested dictionaries.
+    """
+
+    key_subdict = _split_keys_cache.get(key)
+    if key_subdict is None:
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+        if len(_split_keys_cache) >= PARSED_TEMPLATES_CACHE_SIZE:
+            _split_keys_cache.clear()
+        _split_keys_cache[key] = key_subdict
+    return key_subdict
 
 
 def merge_dict(main_dict, enhance_dict):
@@ -89,6 +122,35 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        self._parts = self.compile(template)
+
+    # Parsed template parts by template string
+    _parsed_templates = {}
+
+    @classmethod
+    def compile(cls, template):
+        """Parse template into parts.
+
+        Parsed parts are cached by template string and shared between
+        objects. Parts are not changed during formatting.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            List[Union[str, FormattingPart, OptionalPart]]: Parsed parts.
+        """
+
+        parts = cls._parsed_templates.get(template)
+        if parts is None:
+            parts = cls._parse_template(template)
+            if len(cls._parsed_templates) >= PARSED_TEMPLATES_CACHE_SIZE:
+                cls._parsed_templates.clear()
+            cls._parsed_templates[template] = parts
+        return parts
+
+    @classmethod
+    def _parse_template(cls, template):
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -107,19 +169,18 @@ class StringTemplate(object):
                 new_parts.append(part)
                 continue
 
-            substr = ""
-            for char in part:
+            last_idx = 0
+            for idx, char in enumerate(part):
                 if char not in ("<", ">"):
-                    substr += char
-                else:
-                    if substr:
-                        new_parts.append(substr)
-                    new_parts.append(char)
-                    substr = ""
-            if substr:
-                new_parts.append(substr)
+                    continue
+                if idx > last_idx:
+                    new_parts.append(part[last_idx:idx])
+                new_parts.append(char)
+                last_idx = idx + 1
+            if last_idx < len(part):
+                new_parts.append(part[last_idx:])
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -157,7 +218,63 @@ class StringTemplate(object):
                 result.add_output(part)
             else:
                 part.format(data, result)
+        return self._create_result(result)
+
+    def format_many(self, data, varying_key, values):
+        """Format template multiple times with different value of a key.
+
+        Parts of template which don't use the key are formatted only once.
+        Useful for formatting of file paths of a sequence.
+
+        Example:
+            ```python
+            template.format_many(data, "frame", range(1001, 1101))
+            ```
 
+        Args:
+            data (dict): Containing keys to be filled into template.
+            varying_key (str): First level key in data which changes.
+            values (Iterable[Any]): Values of the key.
+
+        Returns:
+            List[TemplateResult]: Result for each value.
+        """
+
+        # Consecutive parts not using the key are formatted only once
+        segments = []
+        static_result = None
+        for part in self._parts:
+            if (
+                not isinstance(part, six.string_types)
+                and part.uses_key(varying_key)
+            ):
+                static_result = None
+                segments.append(part)
+                continue
+
+            if static_result is None:
+                static_result = TemplatePartResult()
+                segments.append(static_result)
+
+            if isinstance(part, six.string_types):
+                static_result.add_output(part)
+            else:
+                part.format(data, static_result)
+
+        output = []
+        value_data = dict(data)
+        for value in values:
+            value_data[varying_key] = value
+            result = TemplatePartResult()
+            for segment in segments:
+                if isinstance(segment, TemplatePartResult):
+                    result.update(segment)
+                else:
+                    segment.format(value_data, result)
+            output.append(self._create_result(result))
+        return output
+
+    def _create_result(self, result):
         invalid_types = result.invalid_types
         invalid_types.update(result.invalid_optional_types)
         invalid_types = result.split_keys_to_subdicts(invalid_types)
@@ -571,6 +688,21 @@ class TemplatePartResult:
                 str(type(other)), self.__class__.__name__)
             )
 
+    def update(self, other):
+        """Add all data from other result as if were formatted into this.
+
+        Args:
+            other (TemplatePartResult): Result of formatted parts.
+        """
+
+        self._output += other.output
+        self._missing_keys |= other.missing_keys
+        self._missing_optional_keys |= other.missing_optional_keys
+        self._invalid_types.update(other.invalid_types)
+        self._invalid_optional_types.update(other.invalid_optional_types)
+        self._used_values.update(other.used_values)
+        self._realy_used_values.update(other.realy_used_values)
+
     @property
     def solved(self):
         if self.optional:
@@ -620,13 +752,10 @@ class TemplatePartResult:
     def split_keys_to_subdicts(values):
         output = {}
         for key, value in values.items():
-            key_padding = list(KEY_PADDING_PATTERN.findall(key))
-            if key_padding:
-                key = key_padding[0]
-            key_subdict = list(SUB_DICT_PATTERN.findall(key))
+            key_subdict = _split_key(key)
             data = output
-            last_key = key_subdict.pop(-1)
-            for subkey in key_subdict:
+            last_key = key_subdict[-1]
+            for subkey in key_subdict[:-1]:
                 if subkey not in data:
                     data[subkey] = {}
                 data = data[subkey]
@@ -690,10 +819,40 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Precompute key paths
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+
+        # Template used to format found value directly
+        #   - available only if key is clean path of keys
+        value_template = None
+        modifiers = key[len(existence_check):]
+        if (
+            key_subdict
+            and existence_check == key_subdict[0] + "".join(
+                "[{}]".format(sub_key) for sub_key in key_subdict[1:]
+            )
+            and (not modifiers or modifiers[0] in (":", "!"))
+        ):
+            value_template = "{0" + modifiers + "}"
+
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = key_subdict
+        self._value_template = value_template
+
     @property
     def template(self):
         return self._template
 
+    def uses_key(self, key):
+        """Part is filled using value of first level key."""
+        return bool(self._key_subdict) and self._key_subdict[0] == key
+
     def __repr__(self):
         return "<Format:{}>".format(self._template)
 
@@ -718,17 +877,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -770,17 +926,20 @@ class FormattingPart:
             return result
 
         if self.validate_value_type(value):
-            fill_data = {}
-            first_value = True
-            for used_key in reversed(used_keys):
-                if first_value:
-                    first_value = False
-                    fill_data[used_key] = value
-                else:
-                    _fill_data = {used_key: fill_data}
-                    fill_data = _fill_data
+            if self._value_template is not None:
+                formatted_value = self._value_template.format(value)
+            else:
+                fill_data = {}
+                first_value = True
+                for used_key in reversed(used_keys):
+                    if first_value:
+                        first_value = False
+                        fill_data[used_key] = value
+                    else:
+                        _fill_data = {used_key: fill_data}
+                        fill_data = _fill_data
 
-            formatted_value = self.template.format(**fill_data)
+                formatted_value = self.template.format(**fill_data)
             result.add_realy_used_value(key, formatted_value)
             result.add_used_value(existence_check, formatted_value)
             result.add_output(formatted_value)
@@ -809,6 +968,14 @@ class OptionalPart:
     def parts(self):
         return self._parts
 
+    def uses_key(self, key):
+        """Any part is filled using value of first level key."""
+        return any(
+            part.uses_key(key)
+            for part in self._parts
+            if not isinstance(part, six.string_types)
+        )
+
     def __str__(self):
         return "<{}>".format("".join([str(p) for p in self._parts]))
 
@@ -112,6 +112,86 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+# Number of files stat in one thread task
+_STAT_CHUNK_SIZE = 64
+
+
+def _scandir_stats(dirpath, filenames):
+    output = {}
+    for entry in os.scandir(dirpath):
+        if entry.name in filenames:
+            output[os.path.join(dirpath, entry.name)] = entry.stat()
+    return output
+
+
+def _paths_stats(paths):
+    output = {}
+    for path in paths:
+        try:
+            output[path] = os.stat(path)
+        except OSError:
+            pass
+    return output
+
+
+def get_files_stats(paths, max_workers=8):
+    """Collect stat of multiple files at once.
+
+    Paths are grouped by directory. On Windows is each directory listed
+    once with 'os.scandir' which returns stat of files with the listing.
+    On other platforms are files stat in chunks. Directories and chunks are
+    processed in parallel threads to hide latency of network storage.
+
+    Args:
+        paths (Iterable[str]): Paths to files.
+        max_workers (Optional[int]): Maximum number of threads.
+
+    Returns:
+        Dict[str, os.stat_result]: Stat by path. Paths which don't exist
+            are not in output.
+    """
+
+    filenames_by_dir = {}
+    for path in paths:
+        dirpath, filename = os.path.split(path)
+        filenames_by_dir.setdefault(dirpath, set()).add(filename)
+
+    tasks = []
+    for dirpath, filenames in filenames_by_dir.items():
+        if platform.system().lower() == "windows" and hasattr(os, "scandir"):
+            tasks.append((_scandir_stats, (dirpath, filenames)))
+            continue
+
+        dir_paths = [
+            os.path.join(dirpath, filename)
+            for filename in sorted(filenames)
+        ]
+        for idx in range(0, len(dir_paths), _STAT_CHUNK_SIZE):
+            tasks.append(
+                (_paths_stats, (dir_paths[idx:idx + _STAT_CHUNK_SIZE], ))
+            )
+
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:
+        ThreadPoolExecutor = None
+
+    output = {}
+    if len(tasks) < 2 or ThreadPoolExecutor is None or max_workers < 2:
+        for func, args in tasks:
+            output.update(func(*args))
+        return output
+
+    with ThreadPoolExecutor(min(max_workers, len(tasks))) as executor:
+        futures = [
+            executor.submit(func, *args)
+            for func, args in tasks
+        ]
+        for future in futures:
+            output.update(future.result())
+    return output
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
@@ -332,8 +332,19 @@ def source_hash(filepath, *args):
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
     """
+    return source_hash_from_stat(filepath, os.stat(filepath), *args)
+
+
+def source_hash_from_stat(filepath, stat, *args):
+    """Generate the same identifier as 'source_hash' from known stat.
+
+    Args:
+        filepath (str): The source file path.
+        stat (os.stat_result): Stat of the file.
+    """
+
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
+    time = str(stat.st_mtime)
+    size = str(stat.st_size)
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
@@ -3,6 +3,29 @@ import logging
 
 log = logging.getLogger(__name__)
 
+# Maximum number of cached compiled regexes and compiled profiles
+CACHE_SIZE = 1024
+
+_compiled_regexes = {}
+_compiled_profiles = {}
+
+
+def _compile_regex(pattern):
+    """Compile regex with cache of compiled regexes."""
+    try:
+        return _compiled_regexes[pattern]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable pattern, 're.compile' will raise 'TypeError'
+        return re.compile(pattern)
+
+    regex = re.compile(pattern)
+    if len(_compiled_regexes) >= CACHE_SIZE:
+        _compiled_regexes.clear()
+    _compiled_regexes[pattern] = regex
+    return regex
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -14,7 +37,7 @@ def compile_list_of_regexes(in_list):
         if not item:
             continue
         try:
-            regexes.append(re.compile(item))
+            regexes.append(_compile_regex(item))
         except TypeError:
             print((
                 "Invalid type \"{}\" value \"{}\"."
@@ -135,7 +158,8 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     matter).
 
     Args:
-        profiles_data (list): Profile definitions as dictionaries.
+        profiles_data (Union[list, CompiledProfiles]): Profile definitions
+            as dictionaries or compiled profiles.
         key_values (dict): Mapping of Key <-> Value. Key is checked if is
             available in profile and if Value is matching it's values.
         keys_order (list, tuple): Order of keys from `key_values` which matters
@@ -146,6 +170,9 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
         dict/None: Return most matching profile or None if none of profiles
             match at least one criteria.
     """
+    if isinstance(profiles_data, CompiledProfiles):
+        return profiles_data.filter(key_values, keys_order, logger)
+
     if not profiles_data:
         return None
 
@@ -186,8 +213,8 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             if match == -1:
                 profile_value = profile.get(key) or []
                 logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
+                    "\"%s\" not found in \"%s\": %s",
+                    value, key, profile_value
                 )
                 profile_points = -1
                 break
@@ -225,3 +252,243 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             "Profile selected: {}".format(profile)
         )
     return profile
+
+
+class CompiledProfiles(object):
+    """Profiles prepared for repeated filtering.
+
+    Profiles filtering gives the same result as 'filter_profiles' with the
+    same arguments. Exact match values are indexed, regexes are compiled
+    only once and result of each query is cached. Profiles must not be
+    modified after compilation.
+
+    Example:
+        ```python
+        compiled = CompiledProfiles(profiles)
+        profile = compiled.filter({"families": "render", "hosts": "nuke"})
+        ```
+
+    Args:
+        profiles_data (list): Profile definitions as dictionaries.
+    """
+
+    def __init__(self, profiles_data):
+        self.profiles_data = profiles_data
+        self._profiles = list(profiles_data or [])
+        self._results_cache = {}
+        # Filters by key
+        # - indexes of profiles which have filter for the key
+        self._filtered_idxs = {}
+        # - indexes of profiles by exact match values
+        self._idxs_by_value = {}
+        # - patterns of profiles with regex values by profile index
+        self._patterns = {}
+        for idx, profile in enumerate(self._profiles):
+            for key, value in profile.items():
+                self._index_filter(idx, key, value)
+
+    def __len__(self):
+        return len(self._profiles)
+
+    def __bool__(self):
+        return bool(self._profiles)
+
+    __nonzero__ = __bool__
+
+    def _index_filter(self, idx, key, in_list):
+        # Same conditions as 'validate_value_by_regexes'
+        if not in_list:
+            return
+
+        if not isinstance(in_list, (list, tuple, set)):
+            in_list = [in_list]
+
+        if "*" in in_list:
+            return
+
+        self._filtered_idxs.setdefault(key, set()).add(idx)
+        idxs_by_value = self._idxs_by_value.setdefault(key, {})
+        patterns = []
+        for item in in_list:
+            if not item:
+                continue
+
+            if not isinstance(item, str) or re.escape(item) != item:
+                patterns.append(item)
+            else:
+                idxs_by_value.setdefault(item, set()).add(idx)
+
+        if patterns:
+            self._patterns.setdefault(key, {})[idx] = patterns
+
+    def _pattern_matches(self, patterns, value):
+        for regex in compile_list_of_regexes(patterns):
+            if hasattr(regex, "fullmatch"):
+                result = regex.fullmatch(value)
+            else:
+                result = fullmatch(regex, value)
+            if result:
+                return True
+        return False
+
+    def _find_matching(self, key_values, keys_order, logger):
+        """Find matching profiles with the highest score.
+
+        Returns:
+            List[Tuple[int, List[bool]]]: Index and scores of profiles.
+        """
+
+        candidates = set(range(len(self._profiles)))
+        for key in keys_order:
+            filtered_idxs = self._filtered_idxs.get(key)
+            if not filtered_idxs:
+                continue
+
+            value = key_values[key]
+            # Profiles with filter for the key which does not match value
+            excluded = filtered_idxs & candidates
+            if value and not isinstance(value, str):
+                # Value which can't be looked up in index
+                excluded = {
+                    idx
+                    for idx in excluded
+                    if validate_value_by_regexes(
+                        value, self._profiles[idx].get(key)
+                    ) == -1
+                }
+
+            elif value:
+                excluded -= self._idxs_by_value[key].get(value, set())
+                patterns_by_idx = self._patterns.get(key) or {}
+                for idx in sorted(excluded):
+                    patterns = patterns_by_idx.get(idx)
+                    if patterns and self._pattern_matches(patterns, value):
+                        excluded.discard(idx)
+
+            if excluded and logger.isEnabledFor(logging.DEBUG):
+                for idx in sorted(excluded):
+                    logger.debug(
+                        "\"%s\" not found in \"%s\": %s",
+                        value, key, self._profiles[idx].get(key) or []
+                    )
+            candidates -= excluded
+
+        matching_profiles = []
+        highest_profile_points = -1
+        for idx in sorted(candidates):
+            profile_scores = [
+                idx in self._filtered_idxs.get(key, ())
+                for key in keys_order
+            ]
+            profile_points = sum(profile_scores)
+            if profile_points < highest_profile_points:
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+            matching_profiles.append((idx, profile_scores))
+        return matching_profiles
+
+    def filter(self, key_values, keys_order=None, logger=None):
+        """Filter profiles by entered key -> values.
+
+        Arguments and result are the same as in 'filter_profiles'.
+        """
+
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        if not keys_order:
+            keys_order = tuple(key_values.keys())
+        else:
+            _keys_order = list(keys_order)
+            # Make all keys from `key_values` are passed
+            for key in key_values.keys():
+                if key not in _keys_order:
+                    _keys_order.append(key)
+            keys_order = tuple(_keys_order)
+
+        log_parts = " | ".join([
+            "{}: \"{}\"".format(*item)
+            for item in key_values.items()
+        ])
+        logger.info("Looking for matching profile for: %s", log_parts)
+
+        cache_key = tuple((key, key_values[key]) for key in keys_order)
+        try:
+            matching_profiles = self._results_cache.get(cache_key)
+        except TypeError:
+            # Unhashable values
+            cache_key = None
+            matching_profiles = None
+
+        if matching_profiles is None:
+            matching_profiles = self._find_matching(
+                key_values, keys_order, logger
+            )
+            if cache_key is not None:
+                if len(self._results_cache) >= CACHE_SIZE:
+                    self._results_cache.clear()
+                self._results_cache[cache_key] = matching_profiles
+
+        if not matching_profiles:
+            logger.info(
+                "None of profiles match your setup. %s", log_parts
+            )
+            return None
+
+        if len(matching_profiles) > 1:
+            logger.info(
+                "More than one profile match your setup. %s", log_parts
+            )
+
+        profile = _profile_exclusion(
+            [
+                (self._profiles[idx], scores)
+                for idx, scores in matching_profiles
+            ],
+            logger
+        )
+        if profile:
+            logger.info("Profile selected: %s", profile)
+        return profile
+
+
+def get_compiled_profiles(profiles_data):
+    """Get compiled profiles shared for the same read-only profiles object.
+
+    Only read-only profiles from settings (see 'get_project_settings' with
+    'read_only=True') are compiled and cached by identity of the object,
+    which is kept in cache until cache is full. Read-only settings are the
+    same object until settings change and can't be modified in place.
+    Other profiles are returned as they are and are filtered without
+    compilation by 'filter_profiles'.
+
+    Args:
+        profiles_data (list): Profile definitions as dictionaries.
+
+    Returns:
+        Union[CompiledProfiles, list]: Compiled profiles or passed profiles.
+    """
+
+    from openpype.settings.cache import ReadOnlyList
+
+    if (
+        isinstance(profiles_data, CompiledProfiles)
+        or not isinstance(profiles_data, ReadOnlyList)
+    ):
+        return profiles_data
+
+    cached = _compiled_profiles.get(id(profiles_data))
+    if cached is not None and cached.profiles_data is profiles_data:
+        return cached
+
+    compiled = CompiledProfiles(profiles_data)
+    if len(_compiled_profiles) >= CACHE_SIZE:
+        _compiled_profiles.clear()
+    _compiled_profiles[id(profiles_data)] = compiled
+    return compiled
@@ -18,9 +18,9 @@ class WeakMethod:
     a way that allows a bound method's object to be GCed, while
     providing the same interface as a normal weak reference. """
 
-    def __init__(self, fn):
+    def __init__(self, fn, callback=None):
         try:
-            self._obj = weakref.ref(fn.im_self)
+            self._obj = weakref.ref(fn.im_self, callback)
             self._meth = fn.im_func
         except AttributeError:
             # It's not a bound method
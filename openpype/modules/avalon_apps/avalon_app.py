@@ -1,5 +1,7 @@
 import os
 
+import click
+
 from openpype.modules import OpenPypeModule, ITrayModule
 
 
@@ -21,8 +23,24 @@ class AvalonModule(OpenPypeModule, ITrayModule):
         if not avalon_mongo_timeout:
             avalon_mongo_timeout = avalon_settings["AVALON_TIMEOUT"]
 
+        # Mongo connection pool and health check options
+        mongo_connection_options = {}
+        for key in (
+            "OPENPYPE_MONGO_HEALTH_CHECK_TTL",
+            "OPENPYPE_MONGO_MAX_POOL_SIZE",
+            "OPENPYPE_MONGO_MIN_POOL_SIZE",
+            "OPENPYPE_MONGO_MAX_IDLE_TIME",
+            "OPENPYPE_MONGO_SOCKET_TIMEOUT",
+        ):
+            value = os.environ.get(key)
+            if not value:
+                value = avalon_settings.get(key)
+            if value is not None:
+                mongo_connection_options[key] = value
+
         self.thumbnail_root = thumbnail_root
         self.avalon_mongo_timeout = avalon_mongo_timeout
+        self.mongo_connection_options = mongo_connection_options
 
         # Tray attributes
         self._library_loader_imported = None
@@ -31,13 +49,17 @@ class AvalonModule(OpenPypeModule, ITrayModule):
 
     def get_global_environments(self):
         """Avalon global environments for pype implementation."""
-        return {
+        output = {
             # TODO thumbnails root should be multiplafrom
             # - thumbnails root
             "AVALON_THUMBNAIL_ROOT": self.thumbnail_root,
             # - mongo timeout in ms
             "AVALON_TIMEOUT": str(self.avalon_mongo_timeout),
         }
+        # - mongo connection pool and health check options
+        for key, value in self.mongo_connection_options.items():
+            output[key] = str(value)
+        return output
 
     def tray_init(self):
         # Add library tool
@@ -100,9 +122,128 @@ class AvalonModule(OpenPypeModule, ITrayModule):
         # for Windows
         self._library_loader_window.activateWindow()
 
+    def cli(self, click_group):
+        click_group.add_command(cli_main)
+
     # Webserver module implementation
     def webserver_initialization(self, server_manager):
         """Add routes for webserver."""
         if self.tray_initialized:
             from .rest_api import AvalonRestApiResource
             self.rest_api_obj = AvalonRestApiResource(self, server_manager)
+
+
+@click.group(AvalonModule.name, help="Avalon database related commands.")
+def cli_main():
+    pass
+
+
+@cli_main.command("ensure-indexes")
+@click.option(
+    "-p", "--project", "project_names", multiple=True,
+    help="Project name. All projects are processed if not passed."
+)
+@click.option(
+    "--verify-only", is_flag=True,
+    help="Only report state of indexes without creating missing indexes."
+)
+@click.option(
+    "--explain", is_flag=True,
+    help="Validate query plans of most common entity queries."
+)
+def ensure_indexes(project_names, verify_only, explain):
+    """Create and verify indexes of project collections."""
+
+    from openpype.client import get_projects
+    from openpype.client.indexes import (
+        get_project_indexes_state,
+        get_unused_project_indexes,
+        ensure_project_indexes,
+        explain_hot_queries,
+    )
+
+    if not project_names:
+        project_names = [
+            project_doc["name"]
+            for project_doc in get_projects(inactive=True, fields=["name"])
+        ]
+
+    for project_name in project_names:
+        print("Project \"{}\"".format(project_name))
+        if not verify_only:
+            created = ensure_project_indexes(project_name)
+            if created:
+                print("  Created indexes: {}".format(", ".join(created)))
+
+        state = get_project_indexes_state(project_name)
+        for key in ("present", "missing", "extra"):
+            print("  {} indexes: {}".format(
+                key.capitalize(), ", ".join(state[key]) or "-"
+            ))
+
+        try:
+            unused = get_unused_project_indexes(project_name)
+            print("  Unused indexes: {}".format(", ".join(unused) or "-"))
+        except Exception as exc:
+            print("  Unused indexes: Couldn't receive index stats ({})".format(
+                str(exc)
+            ))
+
+        if not explain:
+            continue
+
+        print("  Query plans:")
+        for label, plan_info in explain_hot_queries(project_name).items():
+            print("    {}: {} ({})".format(
+                label,
+                "OK" if plan_info["uses_index"] else "COLLECTION SCAN",
+                " > ".join(plan_info["stages"])
+            ))
+
+
+@cli_main.command("update-last-versions")
+@click.option(
+    "-p", "--project", "project_names", multiple=True,
+    help="Project name. All projects are processed if not passed."
+)
+def update_last_versions(project_names):
+    """Backfill or repair last version pointers on subsets."""
+
+    from openpype.client import get_projects
+    from openpype.client.operations import update_last_version_pointers
+
+    if not project_names:
+        project_names = [
+            project_doc["name"]
+            for project_doc in get_projects(inactive=True, fields=["name"])
+        ]
+
+    for project_name in project_names:
+        updated = update_last_version_pointers(project_name)
+        print("Project \"{}\": Updated {} subsets".format(
+            project_name, updated
+        ))
+
+
+@cli_main.command("export-snapshot")
+@click.option(
+    "-p", "--project", "project_name", required=True,
+    help="Name of project to export."
+)
+@click.option(
+    "-o", "--output", "output_path", required=True,
+    help="Path to output snapshot file."
+)
+def export_snapshot(project_name, output_path):
+    """Export read-only snapshot of project and asset documents.
+
+    Set path to the snapshot to 'OPENPYPE_PROJECT_SNAPSHOT' environment
+    variable to read the project and asset documents from the file.
+    """
+
+    from openpype.client.snapshot import export_project_snapshot
+
+    count = export_project_snapshot(project_name, output_path)
+    print("Exported {} documents of project \"{}\" to \"{}\"".format(
+        count, project_name, output_path
+    ))
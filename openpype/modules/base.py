@@ -4,8 +4,10 @@ import os
 import sys
 import json
 import time
+import atexit
 import inspect
 import logging
+import functools
 import platform
 import threading
 import collections
@@ -53,6 +55,8 @@ IGNORED_DEFAULT_FILENAMES = (
     "example_addons",
     "default_modules",
 )
+# Version of modules manifest structure
+MODULES_MANIFEST_VERSION = 1
 
 
 # Inherit from `object` for Python 2 hosts
@@ -71,12 +75,17 @@ class _ModuleClass(object):
         # Where modules and interfaces are stored
         super(_ModuleClass, self).__setattr__("__attributes__", dict())
         super(_ModuleClass, self).__setattr__("__defaults__", set())
+        # Loaders of modules which are imported on first access
+        super(_ModuleClass, self).__setattr__("__lazy__", dict())
 
         super(_ModuleClass, self).__setattr__("_log", None)
 
     def __getattr__(self, attr_name):
+        if attr_name in self.__lazy__:
+            self.load_lazy(attr_name)
+
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
             raise AttributeError("'{}' has not attribute '{}'".format(
                 self.name, attr_name
@@ -87,8 +96,50 @@ class _ModuleClass(object):
         for module in self.values():
             yield module
 
+    def set_lazy(self, attr_name, loader):
+        """Set loader which is called on first access to the attribute.
+
+        Loader is expected to store the value using 'setattr'.
+
+        Args:
+            attr_name (str): Name of attribute.
+            loader (Callable[[], None]): Function loading the value.
+        """
+
+        self.__lazy__[attr_name] = loader
+
+    def get_lazy_names(self):
+        """Names of attributes which were not loaded yet."""
+        return list(self.__lazy__.keys())
+
+    def get_loaded_values(self):
+        """Values of attributes without loading lazy attributes."""
+        return list(self.__attributes__.values())
+
+    def load_lazy(self, attr_name=None):
+        """Load lazy attribute or all lazy attributes.
+
+        Args:
+            attr_name (Optional[str]): Name of attribute to load. All
+                lazy attributes are loaded if not passed.
+        """
+
+        if attr_name is None:
+            attr_names = list(self.__lazy__.keys())
+        else:
+            attr_names = [attr_name]
+
+        for name in attr_names:
+            loader = self.__lazy__.pop(name, None)
+            if loader is not None:
+                loader()
+
     def __setattr__(self, attr_name, value):
-        if attr_name in self.__attributes__:
+        # Import system sets already loaded lazy module again
+        if (
+            attr_name in self.__attributes__
+            and self.__attributes__[attr_name] is not value
+        ):
             self.log.warning(
                 "Duplicated name \"{}\" in {}. Overriding.".format(
                     self.name, attr_name
@@ -111,18 +162,74 @@ class _ModuleClass(object):
         return self._log
 
     def get(self, key, default=None):
+        if key in self.__lazy__:
+            self.load_lazy(key)
         return self.__attributes__.get(key, default)
 
     def keys(self):
+        self.load_lazy()
         return self.__attributes__.keys()
 
     def values(self):
+        self.load_lazy()
         return self.__attributes__.values()
 
     def items(self):
+        self.load_lazy()
         return self.__attributes__.items()
 
 
+class _LazyModulesFinder(object):
+    """Import hook which loads lazy modules of 'openpype_modules'.
+
+    Makes possible to use 'import openpype_modules.<name>' when modules
+    were loaded lazily. Python 3 only.
+    """
+
+    modules_key = "openpype_modules"
+
+    def find_spec(self, fullname, path=None, target=None):
+        parts = fullname.split(".")
+        if len(parts) < 2 or parts[0] != self.modules_key:
+            return None
+
+        openpype_modules = sys.modules.get(self.modules_key)
+        if (
+            not isinstance(openpype_modules, _ModuleClass)
+            or parts[1] not in openpype_modules.get_lazy_names()
+        ):
+            return None
+
+        openpype_modules.load_lazy(parts[1])
+        if len(parts) > 2 or fullname not in sys.modules:
+            # Submodules are imported by standard import system
+            return None
+
+        import importlib.util
+
+        # Module is passed to loader and removed from 'sys.modules'
+        #   - import system would otherwise use original spec of the module
+        #       found in 'sys.modules' and execute the module again
+        return importlib.util.spec_from_loader(
+            fullname, _LoadedModuleLoader(sys.modules.pop(fullname))
+        )
+
+
+class _LoadedModuleLoader(object):
+    """Loader returning module which is already loaded."""
+
+    def __init__(self, module):
+        self._module = module
+        self._spec = getattr(module, "__spec__", None)
+
+    def create_module(self, spec):
+        return self._module
+
+    def exec_module(self, module):
+        # Keep original spec of the module
+        module.__spec__ = self._spec
+
+
 class _InterfacesClass(_ModuleClass):
     """Fake module class for storing OpenPype interfaces.
 
@@ -133,7 +240,7 @@ class _InterfacesClass(_ModuleClass):
 
     def __getattr__(self, attr_name):
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
 
             raise AttributeError((
@@ -157,6 +264,11 @@ class _LoadCache:
     modules_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    # Import durations, source paths and manifest items of modules by name
+    import_times = {}
+    module_sources = {}
+    manifest_items = {}
+    manifest = None
 
 
 def get_default_modules_dir():
@@ -265,7 +377,7 @@ def _load_interfaces():
         setattr(openpype_interfaces, attr_name, attr)
 
 
-def load_modules(force=False):
+def load_modules(force=False, lazy=False):
     """Load OpenPype modules as python modules.
 
     Modules does not load only classes (like in Interfaces) because there must
@@ -277,9 +389,15 @@ def load_modules(force=False):
     Function makes sure that `load_interfaces` was triggered. Modules import
     has specific order which can't be changed.
 
+    Lazy loaded modules are imported on first access to them on
+    'openpype_modules' or on import of 'openpype_modules.<name>'. Iteration
+    over 'openpype_modules' imports all of them. Lazy loading is available
+    only in Python 3.
+
     Args:
         force(bool): Force to load modules even if are already loaded.
             This won't update already loaded and used (cached) modules.
+        lazy(bool): Import modules on first access.
     """
 
     if _LoadCache.modules_loaded and not force:
@@ -291,7 +409,7 @@ def load_modules(force=False):
 
     if not _LoadCache.modules_lock.locked():
         with _LoadCache.modules_lock:
-            _load_modules()
+            _load_modules(lazy and six.PY3)
             _LoadCache.modules_loaded = True
     else:
         # If lock is locked wait until is finished
@@ -299,7 +417,7 @@ def load_modules(force=False):
             time.sleep(0.1)
 
 
-def _load_modules():
+def _load_modules(lazy=False):
     # Key under which will be modules imported in `sys.modules`
     modules_key = "openpype_modules"
 
@@ -308,6 +426,35 @@ def _load_modules():
 
     log = Logger.get_logger("ModulesLoader")
 
+    if lazy and not any(
+        isinstance(finder, _LazyModulesFinder)
+        for finder in sys.meta_path
+    ):
+        sys.meta_path.append(_LazyModulesFinder())
+
+    for source in _get_module_sources(log):
+        basename, fullpath = source[:2]
+        _LoadCache.module_sources[basename] = fullpath
+        if lazy:
+            openpype_modules.set_lazy(
+                basename,
+                functools.partial(
+                    _import_module_source, openpype_modules, source, log
+                )
+            )
+        else:
+            _import_module_source(openpype_modules, source, log)
+
+
+def _get_module_sources(log):
+    """Find sources of OpenPype modules without importing them.
+
+    Returns:
+        List[Tuple[str, str, str, bool, bool]]: Module name, full path,
+            parent directory, is in current directory and is in hosts
+            directory.
+    """
+
     # Look for OpenPype modules in paths defined with `get_module_dirs`
     #   - dynamically imported OpenPype modules and addons
     module_dirs = get_module_dirs()
@@ -318,6 +465,7 @@ def _load_modules():
     module_dirs.insert(0, hosts_dir)
     module_dirs.insert(0, current_dir)
 
+    output = []
     processed_paths = set()
     for dirpath in module_dirs:
         # Skip already processed paths
@@ -361,50 +509,267 @@ def _load_modules():
             elif ext not in (".py", ):
                 continue
 
-            # TODO add more logic how to define if folder is module or not
-            # - check manifest and content of manifest
-            try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "openpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(openpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "openpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
-                        )
-                        sys.modules[new_import_str] = default_module
-                        setattr(openpype_modules, basename, default_module)
-
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
-
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dirpath, filename, modules_key)
+            output.append((
+                basename,
+                fullpath,
+                dirpath,
+                is_in_current_dir,
+                is_in_host_dir
+            ))
+    return output
 
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
+
+def _import_module_source(openpype_modules, source, log):
+    """Import module from source found by '_get_module_sources'."""
+
+    basename, fullpath, dirpath, is_in_current_dir, is_in_host_dir = source
+    modules_key = openpype_modules.name
+    filename = os.path.basename(fullpath)
+    start_time = time.time()
+    # TODO add more logic how to define if folder is module or not
+    # - check manifest and content of manifest
+    try:
+        # Don't import dynamically current directory modules
+        if is_in_current_dir:
+            import_str = "openpype.modules.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            default_module = __import__(import_str, fromlist=("", ))
+            sys.modules[new_import_str] = default_module
+            setattr(openpype_modules, basename, default_module)
+
+        elif is_in_host_dir:
+            import_str = "openpype.hosts.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            # Until all hosts are converted to be able use them as
+            #   modules is this error check needed
+            try:
+                default_module = __import__(
+                    import_str, fromlist=("", )
+                )
+                sys.modules[new_import_str] = default_module
+                setattr(openpype_modules, basename, default_module)
 
             except Exception:
-                if is_in_current_dir:
-                    msg = "Failed to import default module '{}'.".format(
-                        basename
-                    )
-                else:
-                    msg = "Failed to import module '{}'.".format(fullpath)
-                log.error(msg, exc_info=True)
+                log.warning(
+                    "Failed to import host folder {}".format(basename),
+                    exc_info=True
+                )
+
+        elif os.path.isdir(fullpath):
+            import_module_from_dirpath(dirpath, filename, modules_key)
+
+        else:
+            module = import_filepath(fullpath)
+            setattr(openpype_modules, basename, module)
+
+    except Exception:
+        if is_in_current_dir:
+            msg = "Failed to import default module '{}'.".format(
+                basename
+            )
+        else:
+            msg = "Failed to import module '{}'.".format(fullpath)
+        log.error(msg, exc_info=True)
+
+    _LoadCache.import_times[basename] = time.time() - start_time
+
+
+def get_modules_manifest_path():
+    """Path to manifest of OpenPype modules classes."""
+
+    import appdirs
+
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "modules_manifest.json"
+    )
+
+
+def _get_module_source_stamp(fullpath):
+    """Modification times and sizes of python files of module source."""
+
+    if os.path.isdir(fullpath):
+        filepaths = [
+            os.path.join(fullpath, filename)
+            for filename in sorted(os.listdir(fullpath))
+            if filename.endswith(".py")
+        ]
+    else:
+        filepaths = [fullpath]
+
+    stamp = []
+    for filepath in filepaths:
+        stat = os.stat(filepath)
+        stamp.append(
+            [os.path.basename(filepath), stat.st_mtime, stat.st_size]
+        )
+    return stamp
+
+
+def _load_modules_manifest():
+    try:
+        with open(get_modules_manifest_path(), "r") as stream:
+            data = json.load(stream)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != MODULES_MANIFEST_VERSION
+    ):
+        return {}
+    return data["items"]
+
+
+def _save_modules_manifest(manifest):
+    manifest_path = get_modules_manifest_path()
+    try:
+        manifest_dir = os.path.dirname(manifest_path)
+        if not os.path.exists(manifest_dir):
+            os.makedirs(manifest_dir)
+        tmp_path = "{}.{}.tmp".format(manifest_path, os.getpid())
+        with open(tmp_path, "w") as stream:
+            json.dump(
+                {"version": MODULES_MANIFEST_VERSION, "items": manifest},
+                stream
+            )
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        os.rename(tmp_path, manifest_path)
+
+    except (IOError, OSError):
+        Logger.get_logger("ModulesLoader").debug(
+            "Failed to store modules manifest \"{}\"".format(manifest_path),
+            exc_info=True
+        )
+
+
+def _get_python_module_manifest(python_module, stamp):
+    """Manifest item of python module with OpenPype modules.
+
+    Name of OpenPype module is 'None' if is not defined as class attribute.
+    """
+
+    modules = []
+    for module_class in _get_module_classes(python_module):
+        module_name = getattr(module_class, "name", None)
+        if not isinstance(module_name, six.string_types):
+            module_name = None
+        interfaces = sorted({
+            cls.__name__
+            for cls in inspect.getmro(module_class)
+            if (
+                issubclass(cls, OpenPypeInterface)
+                and cls is not OpenPypeInterface
+                and not issubclass(cls, OpenPypeModule)
+            )
+        })
+        modules.append({
+            "class_name": module_class.__name__,
+            "name": module_name,
+            "interfaces": interfaces,
+        })
+
+    return {
+        "stamp": stamp,
+        "modules": modules,
+        "settings_defs": bool(_get_settings_def_classes(python_module)),
+    }
+
+
+def _get_modules_manifest_items():
+    """Manifest items of all OpenPype python modules by name.
+
+    Items of not loaded python modules are used from manifest stored in
+    previous processes. Python modules which are not in the manifest or
+    were changed are imported and manifest is updated.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Manifest items by python module name.
+    """
+
+    import openpype_modules
+
+    if _LoadCache.manifest is None:
+        _LoadCache.manifest = _load_modules_manifest()
+    manifest = _LoadCache.manifest
+
+    changed = False
+    output = {}
+    lazy_names = set(openpype_modules.get_lazy_names())
+    for module_name, source_path in _LoadCache.module_sources.items():
+        item = _LoadCache.manifest_items.get(module_name)
+        if item is None:
+            try:
+                stamp = _get_module_source_stamp(source_path)
+            except (IOError, OSError):
+                stamp = None
+
+            item = manifest.get(source_path)
+            if (
+                module_name not in lazy_names
+                or item is None
+                or item["stamp"] != stamp
+            ):
+                python_module = openpype_modules.get(module_name)
+                if python_module is None:
+                    continue
+                item = _get_python_module_manifest(python_module, stamp)
+                if stamp is not None and manifest.get(source_path) != item:
+                    manifest[source_path] = item
+                    changed = True
+            _LoadCache.manifest_items[module_name] = item
+        output[module_name] = item
+
+    if changed:
+        _save_modules_manifest(manifest)
+    return output
+
+
+def _get_module_classes(python_module, log=None):
+    """OpenPype module classes defined in python module.
+
+    Args:
+        python_module (types.ModuleType): Imported python module.
+        log (Optional[logging.Logger]): Logger used to log abstract classes.
+    """
+
+    module_classes = []
+    # Go through globals in `pype.modules`
+    for name in dir(python_module):
+        modules_item = getattr(python_module, name, None)
+        # Filter globals that are not classes which inherit from
+        #   OpenPypeModule
+        if (
+            not inspect.isclass(modules_item)
+            or modules_item is OpenPypeModule
+            or modules_item is OpenPypeAddOn
+            or not issubclass(modules_item, OpenPypeModule)
+        ):
+            continue
+
+        # Check if class is abstract (Developing purpose)
+        if inspect.isabstract(modules_item):
+            if log is None:
+                continue
+            # Find missing implementations by convetion on `abc` module
+            not_implemented = []
+            for attr_name in dir(modules_item):
+                attr = getattr(modules_item, attr_name, None)
+                abs_method = getattr(
+                    attr, "__isabstractmethod__", None
+                )
+                if attr and abs_method:
+                    not_implemented.append(attr_name)
+
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {}."
+                " Missing implementations: {}"
+            ).format(name, ", ".join(not_implemented)))
+            continue
+        module_classes.append(modules_item)
+    return module_classes
 
 
 @six.add_metaclass(ABCMeta)
@@ -529,32 +894,83 @@ class OpenPypeAddOn(OpenPypeModule):
         pass
 
 
+class _ModulesByName(dict):
+    """Initialized modules by name.
+
+    Modules of lazy manager which are not initialized yet are initialized
+    on access by name.
+
+    Args:
+        manager (ModulesManager): Manager which owns the modules.
+    """
+
+    def __init__(self, manager):
+        super(_ModulesByName, self).__init__()
+        self._manager = manager
+
+    def __missing__(self, module_name):
+        module = self._manager.get(module_name)
+        if module is None:
+            raise KeyError(module_name)
+        return module
+
+    def get(self, module_name, default=None):
+        if module_name in self:
+            return self[module_name]
+        return self._manager.get(module_name, default)
+
+
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
+    Lazy manager imports and initializes only modules which are requested
+    by name, by interface or by methods which need all enabled modules.
+    Which python module contains which OpenPype modules is stored in
+    manifest created by previous non-lazy managers, python modules
+    missing in the manifest are imported immediately. Modules which are
+    disabled in settings are not imported when requested by interface.
+    Attributes 'modules' and 'modules_by_id' contain only initialized
+    modules, 'modules_by_name' initializes requested module on access by
+    name. Modules are connected only with modules initialized before
+    them. Meant for short-lived processes.
+
+    Time report is printed at exit if 'OPENPYPE_PROFILE_STARTUP' environment
+    variable is set to "1" (see '--profile-startup' argument).
+
     Args:
         modules_settings(dict): To be able create module manager with specified
             data. For settings changes callbacks and testing purposes.
+        lazy (bool): Import and initialize modules on request.
     """
     # Helper attributes for report
     _report_total_key = "Total"
 
-    def __init__(self, _system_settings=None):
+    def __init__(self, _system_settings=None, lazy=False):
         self.log = logging.getLogger(self.__class__.__name__)
 
         self._system_settings = _system_settings
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _ModulesByName(self)
         # For report of time consumption
         self._report = {}
+        # Manifest items of not initialized modules by python module name
+        self._lazy = lazy and six.PY3
+        self._pending_manifest_items = {}
+        self._modules_settings = None
 
         self.initialize_modules()
         self.connect_modules()
 
+        if os.environ.get("OPENPYPE_PROFILE_STARTUP") == "1":
+            atexit.register(self.print_report)
+
     def __getitem__(self, module_name):
-        return self.modules_by_name[module_name]
+        module = self.get(module_name)
+        if module is None:
+            raise KeyError(module_name)
+        return module
 
     def get(self, module_name, default=None):
         """Access module by name.
@@ -566,7 +982,14 @@ class ModulesManager:
         Returns:
             Union[OpenPypeModule, None]: Module found by name or None.
         """
-        return self.modules_by_name.get(module_name, default)
+        if module_name not in self.modules_by_name:
+            self._load_lazy_modules(
+                lambda item: item["name"] in (module_name, None),
+                False
+            )
+        if module_name in self.modules_by_name:
+            return self.modules_by_name[module_name]
+        return default
 
     def get_enabled_module(self, module_name, default=None):
         """Fast access to enabled module.
@@ -590,7 +1013,7 @@ class ModulesManager:
     def initialize_modules(self):
         """Import and initialize modules."""
         # Make sure modules are loaded
-        load_modules()
+        load_modules(lazy=self._lazy)
 
         import openpype_modules
 
@@ -599,47 +1022,46 @@ class ModulesManager:
         system_settings = getattr(self, "_system_settings", None)
         if system_settings is None:
             system_settings = get_system_settings()
-        modules_settings = system_settings["modules"]
+        self._modules_settings = system_settings["modules"]
+
+        if not self._lazy:
+            self._initialize_python_modules(
+                list(openpype_modules.values()), "Initialization"
+            )
+            return
 
+        # Modules are initialized on request
+        self._pending_manifest_items = {
+            module_name: item["modules"]
+            for module_name, item in _get_modules_manifest_items().items()
+            if item["modules"]
+        }
+
+    def _initialize_python_modules(self, python_modules, report_label):
+        """Initialize OpenPype modules from python modules.
+
+        Returns:
+            List[OpenPypeModule]: Initialized modules.
+        """
+
+        modules_settings = self._modules_settings
         report = {}
         time_start = time.time()
         prev_start_time = time_start
 
+        import_times = {}
         module_classes = []
-        for module in openpype_modules:
-            # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   OpenPypeModule
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is OpenPypeModule
-                    or modules_item is OpenPypeAddOn
-                    or not issubclass(modules_item, OpenPypeModule)
-                ):
-                    continue
-
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find missing implementations by convetion on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
+        for python_module in python_modules:
+            python_module_name = python_module.__name__.split(".")[-1]
+            import_time = _LoadCache.import_times.get(python_module_name)
+            for modules_item in _get_module_classes(python_module, self.log):
                 module_classes.append(modules_item)
+                # Import time is assigned to first class of python module
+                if import_time is not None:
+                    import_times[modules_item.__name__] = import_time
+                    import_time = None
 
+        initialized_modules = []
         for modules_item in module_classes:
             try:
                 name = modules_item.__name__
@@ -649,6 +1071,7 @@ class ModulesManager:
                 self.modules.append(module)
                 self.modules_by_id[module.id] = module
                 self.modules_by_name[module.name] = module
+                initialized_modules.append(module)
                 enabled_str = "X"
                 if not module.enabled:
                     enabled_str = " "
@@ -665,20 +1088,93 @@ class ModulesManager:
                 )
 
         if self._report is not None:
+            import_times[self._report_total_key] = sum(import_times.values())
+            self._add_report("Import", import_times)
             report[self._report_total_key] = time.time() - time_start
-            self._report["Initialization"] = report
+            self._add_report(report_label, report)
+        return initialized_modules
+
+    def _add_report(self, label, report):
+        """Add times to report, times are summed if label already exists."""
+        current = self._report.get(label)
+        if current is None:
+            self._report[label] = report
+            return
+
+        for key, value in report.items():
+            current[key] = current.get(key, 0) + value
+
+    def _may_be_enabled(self, manifest_item):
+        """Module from manifest is not disabled in settings."""
+        module_settings = self._modules_settings.get(manifest_item["name"])
+        if isinstance(module_settings, dict):
+            return module_settings.get("enabled") is not False
+        return True
+
+    def _load_lazy_modules(self, filter_func, only_enabled=True):
+        """Import and initialize pending modules matching filter.
+
+        Initialized modules are connected with already initialized modules.
+
+        Args:
+            filter_func (Callable[[Dict[str, Any]], bool]): Filter of
+                manifest items of OpenPype modules.
+            only_enabled (bool): Skip modules disabled in settings.
+        """
+
+        if not self._pending_manifest_items:
+            return
+
+        import openpype_modules
+
+        python_modules = []
+        for module_name, items in tuple(self._pending_manifest_items.items()):
+            for item in items:
+                if (
+                    filter_func(item)
+                    and (not only_enabled or self._may_be_enabled(item))
+                ):
+                    self._pending_manifest_items.pop(module_name)
+                    python_module = openpype_modules.get(module_name)
+                    if python_module is not None:
+                        python_modules.append(python_module)
+                    break
+
+        if not python_modules:
+            return
+
+        new_modules = self._initialize_python_modules(
+            python_modules, "Initialization"
+        )
+        self._connect_modules(
+            [module for module in new_modules if module.enabled]
+        )
+
+    def _get_enabled_modules_by_interface(self, interface):
+        """Enabled modules which inherit from interface."""
+        self._load_lazy_modules(
+            lambda item: interface.__name__ in item["interfaces"]
+        )
+        return [
+            module
+            for module in self.modules
+            if module.enabled and isinstance(module, interface)
+        ]
 
     def connect_modules(self):
         """Trigger connection with other enabled modules.
 
         Modules should handle their interfaces in `connect_with_modules`.
         """
+        self._connect_modules(self._get_initialized_enabled_modules())
+
+    def _connect_modules(self, modules):
         report = {}
         time_start = time.time()
         prev_start_time = time_start
-        enabled_modules = self.get_enabled_modules()
+        enabled_modules = self._get_initialized_enabled_modules()
         self.log.debug("Has {} enabled modules.".format(len(enabled_modules)))
-        for module in enabled_modules:
+        for module in modules:
             try:
                 module.connect_with_modules(enabled_modules)
             except Exception:
@@ -691,21 +1187,28 @@ class ModulesManager:
             report[module.__class__.__name__] = now - prev_start_time
             prev_start_time = now
 
-        if self._report is not None:
+        if self._report is not None and modules:
             report[self._report_total_key] = time.time() - time_start
-            self._report["Connect modules"] = report
+            self._add_report("Connect modules", report)
+
+    def _get_initialized_enabled_modules(self):
+        return [
+            module
+            for module in self.modules
+            if module.enabled
+        ]
 
     def get_enabled_modules(self):
         """Enabled modules initialized by the manager.
 
+        Lazy manager imports and initializes all modules which are not
+        disabled in settings.
+
         Returns:
             list: Initialized and enabled modules.
         """
-        return [
-            module
-            for module in self.modules
-            if module.enabled
-        ]
+        self._load_lazy_modules(lambda item: True)
+        return self._get_initialized_enabled_modules()
 
     def collect_global_environments(self):
         """Helper to collect global enviornment variabled from modules.
@@ -747,10 +1250,7 @@ class ModulesManager:
             "actions": []
         }
         unknown_keys_by_module = {}
-        for module in self.get_enabled_modules():
-            # Skip module that do not inherit from `IPluginPaths`
-            if not isinstance(module, IPluginPaths):
-                continue
+        for module in self._get_enabled_modules_by_interface(IPluginPaths):
             plugin_paths = module.get_plugin_paths()
             for key, value in plugin_paths.items():
                 # Filter unknown keys
@@ -788,11 +1288,7 @@ class ModulesManager:
 
     def _collect_plugin_paths(self, method_name, *args, **kwargs):
         output = []
-        for module in self.get_enabled_modules():
-            # Skip module that do not inherit from `IPluginPaths`
-            if not isinstance(module, IPluginPaths):
-                continue
-
+        for module in self._get_enabled_modules_by_interface(IPluginPaths):
             method = getattr(module, method_name)
             paths = method(*args, **kwargs)
             if paths:
@@ -861,11 +1357,8 @@ class ModulesManager:
                 host name set to passed 'host_name'.
         """
 
-        for module in self.get_enabled_modules():
-            if (
-                isinstance(module, IHostAddon)
-                and module.host_name == host_name
-            ):
+        for module in self._get_enabled_modules_by_interface(IHostAddon):
+            if module.host_name == host_name:
                 return module
         return None
 
@@ -879,8 +1372,7 @@ class ModulesManager:
 
         host_names = {
             module.host_name
-            for module in self.get_enabled_modules()
-            if isinstance(module, IHostAddon)
+            for module in self._get_enabled_modules_by_interface(IHostAddon)
         }
         return host_names
 
@@ -1025,6 +1517,9 @@ class TrayModulesManager(ModulesManager):
         self.modules_by_id = {}
         self.modules_by_name = {}
         self._report = {}
+        self._lazy = False
+        self._pending_manifest_items = {}
+        self._modules_settings = None
 
         self.tray_manager = None
 
@@ -1189,41 +1684,64 @@ def get_module_settings_defs():
 
     import openpype_modules
 
-    settings_defs = []
+    if openpype_modules.get_lazy_names():
+        # Import only python modules with settings definitions
+        for module_name, item in _get_modules_manifest_items().items():
+            if item["settings_defs"]:
+                openpype_modules.get(module_name)
+        python_modules = openpype_modules.get_loaded_values()
+    else:
+        python_modules = openpype_modules.values()
 
     log = Logger.get_logger("ModuleSettingsLoad")
 
-    for raw_module in openpype_modules:
-        for attr_name in dir(raw_module):
-            attr = getattr(raw_module, attr_name)
-            if (
-                not inspect.isclass(attr)
-                or attr is ModuleSettingsDef
-                or not issubclass(attr, ModuleSettingsDef)
-            ):
-                continue
+    settings_defs = []
+    for raw_module in python_modules:
+        settings_defs.extend(_get_settings_def_classes(raw_module, log))
+    return settings_defs
 
-            if inspect.isabstract(attr):
-                # Find missing implementations by convetion on `abc` module
-                not_implemented = []
-                for attr_name in dir(attr):
-                    attr = getattr(attr, attr_name, None)
-                    abs_method = getattr(
-                        attr, "__isabstractmethod__", None
-                    )
-                    if attr and abs_method:
-                        not_implemented.append(attr_name)
-
-                # Log missing implementations
-                log.warning((
-                    "Skipping abstract Class: {} in module {}."
-                    " Missing implementations: {}"
-                ).format(
-                    attr_name, raw_module.__name__, ", ".join(not_implemented)
-                ))
+
+def _get_settings_def_classes(raw_module, log=None):
+    """Settings definition classes defined in python module.
+
+    Args:
+        raw_module (types.ModuleType): Imported python module.
+        log (Optional[logging.Logger]): Logger used to log abstract classes.
+    """
+
+    settings_defs = []
+    for attr_name in dir(raw_module):
+        attr = getattr(raw_module, attr_name)
+        if (
+            not inspect.isclass(attr)
+            or attr is ModuleSettingsDef
+            or not issubclass(attr, ModuleSettingsDef)
+        ):
+            continue
+
+        if inspect.isabstract(attr):
+            if log is None:
                 continue
+            # Find missing implementations by convetion on `abc` module
+            not_implemented = []
+            for attr_name in dir(attr):
+                attr = getattr(attr, attr_name, None)
+                abs_method = getattr(
+                    attr, "__isabstractmethod__", None
+                )
+                if attr and abs_method:
+                    not_implemented.append(attr_name)
+
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {} in module {}."
+                " Missing implementations: {}"
+            ).format(
+                attr_name, raw_module.__name__, ", ".join(not_implemented)
+            ))
+            continue
 
-            settings_defs.append(attr)
+        settings_defs.append(attr)
 
     return settings_defs
 
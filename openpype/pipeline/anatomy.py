@@ -1,6 +1,8 @@
 import os
 import re
 import copy
+import json
+import hashlib
 import platform
 import collections
 import numbers
@@ -29,6 +31,13 @@ from openpype.lib import get_local_site_id
 log = Logger.get_logger(__name__)
 
 
+def _hash_data(data):
+    """Hash of json serializable data used to compare state of data."""
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
 class ProjectNotSet(Exception):
     """Exception raised when is created Anatomy without project name."""
 
@@ -161,6 +170,10 @@ class BaseAnatomy(object):
         """Wrapper for Roots `find_root_template_from_path`."""
         return self.roots_obj.find_root_template_from_path(*args, **kwargs)
 
+    def find_root_templates_from_paths(self, *args, **kwargs):
+        """Wrapper for Roots `find_root_templates_from_paths`."""
+        return self.roots_obj.find_root_templates_from_paths(*args, **kwargs)
+
     def path_remapper(self, *args, **kwargs):
         """Wrapper for Roots `path_remapper`."""
         return self.roots_obj.path_remapper(*args, **kwargs)
@@ -409,6 +422,10 @@ class BaseAnatomy(object):
 class Anatomy(BaseAnatomy):
     _project_cache = {}
     _site_cache = {}
+    # Shared anatomy objects by project and site name
+    _anatomy_cache = {}
+    # Lifetime of cached project document and site name in seconds
+    cache_lifetime = 10
 
     def __init__(self, project_name=None, site_name=None):
         if not project_name:
@@ -420,7 +437,8 @@ class Anatomy(BaseAnatomy):
                 " to load data for specific project."
             ))
 
-        project_doc = self.get_project_doc_from_cache(project_name)
+        # Project document is not modified so copy is not needed
+        project_doc = self._get_project_cache_item(project_name)["project_doc"]
         local_settings = get_local_settings()
         if not site_name:
             site_name = self.get_site_name_from_cache(
@@ -434,29 +452,114 @@ class Anatomy(BaseAnatomy):
         )
 
     @classmethod
-    def get_project_doc_from_cache(cls, project_name):
+    def get_shared(cls, project_name=None, site_name=None):
+        """Get shared anatomy object for project and site.
+
+        The same object is returned while project document and local
+        settings of the project did not change. Freshness of project
+        document is checked with hash of the document, which is calculated
+        only when document is re-fetched (see 'cache_lifetime').
+
+        Returned object is shared and must not be modified.
+
+        Args:
+            project_name (Optional[str]): Project name. Value of
+                'AVALON_PROJECT' environment variable is used if not passed.
+            site_name (Optional[str]): Site name. Active site from settings
+                is used if not passed.
+
+        Returns:
+            Anatomy: Shared anatomy object.
+        """
+
+        if not project_name:
+            project_name = os.environ.get("AVALON_PROJECT")
+
+        if not project_name:
+            raise ProjectNotSet((
+                "Implementation bug: Project name is not set. Anatomy requires"
+                " to load data for specific project."
+            ))
+
+        project_item = cls._get_project_cache_item(project_name)
+        local_settings = get_local_settings()
+        if not site_name:
+            site_name = cls.get_site_name_from_cache(
+                project_name, local_settings
+            )
+
+        local_project_settings = local_settings.get("projects") or {}
+        stamp = (
+            project_item["fingerprint"],
+            _hash_data([
+                local_project_settings.get(DEFAULT_PROJECT_KEY),
+                local_project_settings.get(project_name),
+            ])
+        )
+        cache_key = (project_name, site_name)
+        cached = cls._anatomy_cache.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        anatomy = cls(project_name, site_name)
+        cls._anatomy_cache[cache_key] = (stamp, anatomy)
+        return anatomy
+
+    @classmethod
+    def clear_cache(cls, project_name=None):
+        """Clear cached project document, site name and shared anatomies.
+
+        Args:
+            project_name (Optional[str]): Clear only cache of the project.
+                All projects are cleared if not passed.
+        """
+
+        if project_name is None:
+            cls._project_cache.clear()
+            cls._site_cache.clear()
+            cls._anatomy_cache.clear()
+        else:
+            cls._project_cache.pop(project_name, None)
+            cls._site_cache.pop(project_name, None)
+            for cache_key in tuple(cls._anatomy_cache.keys()):
+                if cache_key[0] == project_name:
+                    cls._anatomy_cache.pop(cache_key)
+
+    @classmethod
+    def _get_project_cache_item(cls, project_name):
         project_cache = cls._project_cache.get(project_name)
         if project_cache is not None:
-            if time.time() - project_cache["start"] > 10:
+            if time.time() - project_cache["start"] > cls.cache_lifetime:
                 cls._project_cache.pop(project_name)
                 project_cache = None
 
         if project_cache is None:
+            project_doc = get_project(project_name)
+            fingerprint = None
+            if project_doc:
+                fingerprint = _hash_data(
+                    [project_doc.get("config"), project_doc.get("data")]
+                )
             project_cache = {
-                "project_doc": get_project(project_name),
+                "project_doc": project_doc,
+                "fingerprint": fingerprint,
                 "start": time.time()
             }
             cls._project_cache[project_name] = project_cache
 
+        return project_cache
+
+    @classmethod
+    def get_project_doc_from_cache(cls, project_name):
         return copy.deepcopy(
-            cls._project_cache[project_name]["project_doc"]
+            cls._get_project_cache_item(project_name)["project_doc"]
         )
 
     @classmethod
     def get_site_name_from_cache(cls, project_name, local_settings):
         site_cache = cls._site_cache.get(project_name)
         if site_cache is not None:
-            if time.time() - site_cache["start"] > 10:
+            if time.time() - site_cache["start"] > cls.cache_lifetime:
                 cls._site_cache.pop(project_name)
                 site_cache = None
 
@@ -474,7 +577,9 @@ class Anatomy(BaseAnatomy):
             or default_locals.get("active_site")
         )
         if not active_site:
-            project_settings = get_project_settings(project_name)
+            project_settings = get_project_settings(
+                project_name, read_only=True
+            )
             active_site = (
                 project_settings
                 ["global"]
@@ -1125,12 +1230,129 @@ class RootItem(FormatObject):
 
             if _mod_path.startswith(root_path):
                 result = True
-                replacement = "{" + self.full_key() + "}"
-                output = replacement + mod_path[len(root_path):]
+                output = self.rootless_path(mod_path, root_path)
                 break
 
         return (result, output)
 
+    def rootless_path(self, cleaned_path, root_path):
+        """Replace root value at the start of path with formattable key.
+
+        Args:
+            cleaned_path (str): Path with forward slashes starting with
+                root value.
+            root_path (str): Cleaned root value which was matched.
+
+        Returns:
+            str: Path with "{root}" or "{root[<name>]}" key.
+        """
+
+        return "{" + self.full_key() + "}" + cleaned_path[len(root_path):]
+
+
+class RootsIndex(object):
+    """Prefix index of root values of all platforms.
+
+    Index finds the same root as iteration over roots and their platform
+    values would find, but checks all of them in one pass. Windows values
+    are compared case-insensitive.
+
+    Args:
+        roots (Union[RootItem, Dict[str, Any]]): Roots which are indexed.
+    """
+
+    def __init__(self, roots):
+        self.roots = roots
+
+        # Root item and cleaned root value by order of iteration
+        self._entries = []
+        # Order of first entry by root value
+        indexes_by_prefix = ({}, {})
+        for root_item in self._iter_root_items(roots):
+            for root_os, root_path in root_item.cleaned_data.items():
+                # Skip empty paths
+                if not root_path:
+                    continue
+
+                case_insensitive = root_os == "windows"
+                if case_insensitive:
+                    root_path = root_path.lower()
+                indexes_by_prefix[int(case_insensitive)].setdefault(
+                    root_path, len(self._entries)
+                )
+                self._entries.append((root_item, root_path))
+
+        self._indexes_by_prefix = indexes_by_prefix
+        # Regex alternation returns first matching alternative so order
+        #   of values is kept
+        self._prefix_regexes = tuple(
+            self._create_prefix_regex(indexes_by_prefix[idx])
+            for idx in range(2)
+        )
+
+    @staticmethod
+    def _iter_root_items(roots):
+        if isinstance(roots, RootItem):
+            yield roots
+            return
+
+        for value in roots.values():
+            for root_item in RootsIndex._iter_root_items(value):
+                yield root_item
+
+    @staticmethod
+    def _create_prefix_regex(index_by_prefix):
+        if not index_by_prefix:
+            return None
+        prefixes = sorted(index_by_prefix, key=index_by_prefix.get)
+        return re.compile("|".join(re.escape(prefix) for prefix in prefixes))
+
+    def find_root_item(self, path):
+        """Find root item which value is at the start of the path.
+
+        Args:
+            path (str): Path where root should be found.
+
+        Returns:
+            Union[Tuple[RootItem, str, str], None]: Root item, cleaned path
+                and matched root value or None if path does not start with
+                any root.
+        """
+
+        cleaned_path = str(path).replace("\\", "/")
+        match_idx = None
+        for case_insensitive, regex in enumerate(self._prefix_regexes):
+            if regex is None:
+                continue
+            value = cleaned_path
+            if case_insensitive:
+                value = value.lower()
+            match = regex.match(value)
+            if match is None:
+                continue
+            idx = self._indexes_by_prefix[case_insensitive][match.group(0)]
+            if match_idx is None or idx < match_idx:
+                match_idx = idx
+
+        if match_idx is None:
+            return None
+        root_item, root_path = self._entries[match_idx]
+        return root_item, cleaned_path, root_path
+
+    def find_root_template_from_path(self, path):
+        """Replace root value in path with formatting key.
+
+        Returns:
+            Tuple[bool, str]: Success and path with replaced root or
+                unchanged path.
+        """
+
+        found = self.find_root_item(path)
+        if found is None:
+            return False, path
+        root_item, cleaned_path, root_path = found
+        return True, root_item.rootless_path(cleaned_path, root_path)
+
 
 class Roots:
     """Object which should be used for formatting "root" key in templates.
@@ -1146,6 +1368,7 @@ class Roots:
         self.anatomy = anatomy
         self.loaded_project = None
         self._roots = None
+        self._roots_index = None
 
     def __format__(self, *args, **kwargs):
         return self.roots.__format__(*args, **kwargs)
@@ -1156,6 +1379,31 @@ class Roots:
     def reset(self):
         """Reset current roots value."""
         self._roots = None
+        self._roots_index = None
+
+    def get_roots_index(self, roots=None):
+        """Prefix index of roots.
+
+        Args:
+            roots (Optional[Union[RootItem, dict]]): Roots to index. Roots
+                of the instance are used if not passed.
+
+        Returns:
+            RootsIndex: Index of roots.
+        """
+
+        if roots is None:
+            roots = self.roots
+
+        if roots is None:
+            raise ValueError("Roots are not set. Can't find path.")
+
+        if roots is not self._roots:
+            return RootsIndex(roots)
+
+        if self._roots_index is None or self._roots_index.roots is not roots:
+            self._roots_index = RootsIndex(roots)
+        return self._roots_index
 
     def path_remapper(
         self, path, dst_platform=None, src_platform=None, roots=None
@@ -1193,6 +1441,18 @@ class Roots:
         if isinstance(roots, RootItem):
             return roots.path_remapper(path, dst_platform, src_platform)
 
+        if not src_platform and roots is self._roots:
+            # First root containing path in any platform value is the one
+            #   which would be used by iteration over roots
+            found = self.get_roots_index(roots).find_root_item(path)
+            if found is None:
+                return None
+            result = found[0].path_remapper(path, dst_platform)
+            if result is not None:
+                return result
+            # Root may miss value for destination platform, then other
+            #   roots are tried in order
+
         for _root in roots.values():
             result = self.path_remapper(
                 path, dst_platform, src_platform, _root
@@ -1228,6 +1488,16 @@ class Roots:
         if isinstance(roots, RootItem):
             return roots.find_root_template_from_path(path)
 
+        if roots is self._roots:
+            found = self.get_roots_index(roots).find_root_item(path)
+            if found is None:
+                log.warning("No matching root was found in current setting.")
+                return (False, path)
+
+            root_item, cleaned_path, root_path = found
+            log.info("Found match in root \"{}\".".format(root_item.name))
+            return True, root_item.rootless_path(cleaned_path, root_path)
+
         for root_name, _root in roots.items():
             success, result = self.find_root_template_from_path(path, _root)
             if success:
@@ -1237,6 +1507,35 @@ class Roots:
         log.warning("No matching root was found in current setting.")
         return (False, path)
 
+    def find_root_templates_from_paths(self, paths, roots=None):
+        """Find root values in paths and replace them with formatting key.
+
+        Batch variant of 'find_root_template_from_path'.
+
+        Args:
+            paths (Iterable[str]): Source paths where roots will be searched.
+            roots (Roots/dict, optional): It is possible to use different
+                roots than instance where method was triggered has.
+
+        Returns:
+            List[Tuple[bool, str]]: Success and path with or without
+                replaced root for each path.
+        """
+
+        roots_index = self.get_roots_index(roots)
+        output = [
+            roots_index.find_root_template_from_path(path)
+            for path in paths
+        ]
+        missing = sum(1 for success, _ in output if not success)
+        if missing:
+            log.warning(
+                "No matching root was found for {} of {} paths.".format(
+                    missing, len(output)
+                )
+            )
+        return output
+
     def set_root_environments(self):
         """Set root environments for current project."""
         for key, value in self.root_environments().items():
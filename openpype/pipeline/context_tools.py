@@ -149,7 +149,22 @@ def install_host(host):
     install_openpype_plugins(project_name, host_name)
 
 
-def install_openpype_plugins(project_name=None, host_name=None):
+def install_openpype_plugins(
+    project_name=None, host_name=None, modules_manager=None
+):
+    """Register global plugins and plugins of modules.
+
+    Args:
+        project_name (Optional[str]): Project name.
+        host_name (Optional[str]): Host name.
+        modules_manager (Optional[ModulesManager]): Manager used to
+            collect plugin paths. Global manager is used if not passed.
+            Passed manager is used as global manager if global manager
+            was not created yet.
+    """
+
+    global _modules_manager
+
     # Make sure modules are loaded
     load_modules()
 
@@ -161,7 +176,10 @@ def install_openpype_plugins(project_name=None, host_name=None):
     if host_name is None:
         host_name = os.environ.get("AVALON_APP")
 
-    modules_manager = _get_modules_manager()
+    if modules_manager is None:
+        modules_manager = _get_modules_manager()
+    elif _modules_manager is None:
+        _modules_manager = modules_manager
     publish_plugin_dirs = modules_manager.collect_publish_plugin_paths(
         host_name)
     for path in publish_plugin_dirs:
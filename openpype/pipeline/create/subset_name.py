@@ -1,7 +1,11 @@
 import os
 
 from openpype.settings import get_project_settings
-from openpype.lib import filter_profiles, prepare_template_data
+from openpype.lib import (
+    filter_profiles,
+    get_compiled_profiles,
+    prepare_template_data,
+)
 from openpype.pipeline import legacy_io
 
 from .constants import DEFAULT_SUBSET_TEMPLATE
@@ -40,7 +44,7 @@ def get_subset_name_template(
     """
 
     if project_settings is None:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
     tools_settings = project_settings["global"]["tools"]
     profiles = tools_settings["creator"]["subset_name_profiles"]
     filtering_criteria = {
@@ -50,7 +54,9 @@ def get_subset_name_template(
         "task_types": task_type
     }
 
-    matching_profile = filter_profiles(profiles, filtering_criteria)
+    matching_profile = filter_profiles(
+        get_compiled_profiles(profiles), filtering_criteria
+    )
     template = None
     if matching_profile:
         template = matching_profile["template"]
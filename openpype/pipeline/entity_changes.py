@@ -0,0 +1,385 @@
+"""Listener of changes in database driving cache invalidation.
+
+Listener is watching mongo change streams of project collections and of
+settings collection in a thread. Each change of an entity emits event
+using 'openpype.lib.events' with topic 'entity.<entity type>.<operation>'
+(e.g. 'entity.version.created') and invalidates entity cache, cached
+project documents of 'Anatomy' and cached settings. Change of settings
+emits 'settings.changed'.
+
+Change streams are available only on replica sets. Listener falls back to
+polling on standalone servers. Polling is able to find only created
+entities and changed project documents and settings.
+
+Because caches are invalidated on change, lifetime of anatomy and settings
+caches is extended while change stream is watched. Lifetimes are not
+changed when polling is used as polling does not find all changes.
+
+Listener is started by tray.
+
+Note:
+    Events are emitted from listener thread.
+
+Example:
+    ```python
+    from openpype.lib import register_event_callback
+    from openpype.pipeline.entity_changes import (
+        start_entity_changes_listener
+    )
+
+    def on_version_created(event):
+        print(event["project_name"], event["entity_id"])
+
+    register_event_callback("entity.version.created", on_version_created)
+    start_entity_changes_listener()
+    ```
+"""
+
+import os
+import hashlib
+import threading
+
+from bson.json_util import dumps
+from pymongo.errors import OperationFailure, PyMongoError
+
+from openpype.client import (
+    OpenPypeMongoConnection,
+    invalidate_entity_cache,
+)
+from openpype.client.mongo import get_project_database
+from openpype.lib import Logger, emit_event
+from openpype.settings.lib import clear_settings_cache
+from openpype.settings.handlers import CacheValues
+
+from .anatomy import Anatomy
+
+SETTINGS_COLLECTION_NAME = "settings"
+# Event topic source
+EVENTS_SOURCE = "entity_changes"
+
+_OPERATION_NAMES = {
+    "insert": "created",
+    "update": "changed",
+    "replace": "changed",
+    "delete": "deleted",
+}
+
+
+class EntityChangesListener(object):
+    """Watch database changes and invalidate caches.
+
+    Args:
+        poll_interval (Optional[float]): Interval of polling in seconds used
+            when change streams are not available.
+        cache_lifetime (Optional[int]): Lifetime of anatomy and settings
+            caches in seconds while change stream is watched.
+    """
+
+    default_poll_interval = 5
+    default_cache_lifetime = 600
+
+    def __init__(self, poll_interval=None, cache_lifetime=None):
+        if poll_interval is None:
+            poll_interval = self.default_poll_interval
+        if cache_lifetime is None:
+            cache_lifetime = self.default_cache_lifetime
+
+        self._poll_interval = poll_interval
+        self._cache_lifetime = cache_lifetime
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._mode = None
+        self._orig_lifetimes = None
+
+        self._avalon_db_name = os.environ.get("AVALON_DB") or "avalon"
+        self._settings_db_name = os.environ.get("OPENPYPE_DATABASE_NAME")
+
+        # Polling state
+        self._last_id_by_project = {}
+        self._project_hashes = {}
+        self._settings_hash = None
+
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    @property
+    def mode(self):
+        """Mode of listening 'change_stream' or 'polling'.
+
+        Returns:
+            Union[str, None]: Mode or None if listener is not running.
+        """
+
+        return self._mode
+
+    @property
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="EntityChangesListener"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._mode = None
+        self._restore_cache_lifetimes()
+
+    def _extend_cache_lifetimes(self):
+        if self._orig_lifetimes is not None:
+            return
+        self._orig_lifetimes = (
+            Anatomy.cache_lifetime, CacheValues.cache_lifetime
+        )
+        Anatomy.cache_lifetime = self._cache_lifetime
+        CacheValues.cache_lifetime = self._cache_lifetime
+
+    def _restore_cache_lifetimes(self):
+        if self._orig_lifetimes is None:
+            return
+        anatomy_lifetime, settings_lifetime = self._orig_lifetimes
+        Anatomy.cache_lifetime = anatomy_lifetime
+        CacheValues.cache_lifetime = settings_lifetime
+        self._orig_lifetimes = None
+
+    def _run(self):
+        try:
+            self._mode = "change_stream"
+            self._watch_changes()
+            return
+
+        except OperationFailure as exc:
+            self.log.info((
+                "Change streams are not available ({}). Using polling."
+            ).format(str(exc)))
+
+        except PyMongoError:
+            self.log.warning(
+                "Change stream failed. Using polling.", exc_info=True
+            )
+
+        # Everything could change while change stream was used
+        self._invalidate_all()
+        self._mode = "polling"
+        self._poll_changes()
+
+    # Change streams
+    def _watch_changes(self):
+        db_names = [self._avalon_db_name]
+        if self._settings_db_name:
+            db_names.append(self._settings_db_name)
+
+        pipeline = [{"$match": {"ns.db": {"$in": db_names}}}]
+        client = OpenPypeMongoConnection.get_mongo_client()
+        with client.watch(
+            pipeline,
+            full_document="updateLookup",
+            max_await_time_ms=1000
+        ) as stream:
+            # Caches can live longer only while all changes are received
+            self._extend_cache_lifetimes()
+            try:
+                while not self._stop_event.is_set():
+                    change = stream.try_next()
+                    if change is not None:
+                        self._process_change(change)
+            finally:
+                self._restore_cache_lifetimes()
+
+    def _process_change(self, change):
+        namespace = change.get("ns") or {}
+        db_name = namespace.get("db")
+        collection_name = namespace.get("coll")
+        if (
+            db_name == self._settings_db_name
+            and collection_name == SETTINGS_COLLECTION_NAME
+        ):
+            self._on_settings_change()
+            return
+
+        if db_name != self._avalon_db_name or not collection_name:
+            return
+
+        operation = _OPERATION_NAMES.get(change["operationType"])
+        if operation is None:
+            # Collection was dropped, renamed etc.
+            self._on_project_change(collection_name)
+            return
+
+        doc = change.get("fullDocument") or {}
+        changed_keys = []
+        update_description = change.get("updateDescription")
+        if update_description:
+            changed_keys.extend(update_description["updatedFields"].keys())
+            changed_keys.extend(update_description["removedFields"])
+
+        self._on_entity_change(
+            collection_name,
+            doc.get("type"),
+            change["documentKey"]["_id"],
+            operation,
+            changed_keys
+        )
+
+    # Polling
+    def _poll_changes(self):
+        self._poll_projects(emit=False)
+        self._poll_settings(emit=False)
+        while not self._stop_event.wait(self._poll_interval):
+            try:
+                self._poll_projects()
+                self._poll_settings()
+            except PyMongoError:
+                self.log.warning("Polling of changes failed.", exc_info=True)
+
+    def _poll_projects(self, emit=True):
+        database = get_project_database()
+        for project_name in database.list_collection_names():
+            collection = database[project_name]
+            project_doc = collection.find_one({"type": "project"})
+            if not project_doc:
+                continue
+
+            project_hash = _hash_document(project_doc)
+            prev_hash = self._project_hashes.get(project_name)
+            self._project_hashes[project_name] = project_hash
+            if emit and prev_hash is not None and prev_hash != project_hash:
+                self._on_entity_change(
+                    project_name, "project", project_doc["_id"], "changed"
+                )
+
+            last_id = self._last_id_by_project.get(project_name)
+            if last_id is None:
+                for doc in (
+                    collection.find({}, {"_id": True})
+                    .sort("_id", -1)
+                    .limit(1)
+                ):
+                    last_id = doc["_id"]
+                self._last_id_by_project[project_name] = last_id
+                if not emit or last_id is None:
+                    continue
+                query_filter = {}
+            else:
+                query_filter = {"_id": {"$gt": last_id}}
+
+            for doc in (
+                collection.find(query_filter, {"type": True})
+                .sort("_id", 1)
+            ):
+                self._last_id_by_project[project_name] = doc["_id"]
+                self._on_entity_change(
+                    project_name, doc.get("type"), doc["_id"], "created"
+                )
+
+    def _poll_settings(self, emit=True):
+        if not self._settings_db_name:
+            return
+
+        client = OpenPypeMongoConnection.get_mongo_client()
+        collection = (
+            client[self._settings_db_name][SETTINGS_COLLECTION_NAME]
+        )
+        # Data are not compared, saved settings always change
+        #   'last_saved_info'
+        docs = list(
+            collection.find({}, {"data": False, "value": False}).sort("_id")
+        )
+        settings_hash = _hash_document(docs)
+        prev_hash = self._settings_hash
+        self._settings_hash = settings_hash
+        if emit and prev_hash is not None and prev_hash != settings_hash:
+            self._on_settings_change()
+
+    # Invalidation and events
+    def _invalidate_all(self):
+        invalidate_entity_cache()
+        Anatomy.clear_cache()
+        clear_settings_cache()
+
+    def _on_settings_change(self):
+        clear_settings_cache()
+        Anatomy.clear_cache()
+        emit_event("settings.changed", {}, EVENTS_SOURCE)
+
+    def _on_project_change(self, project_name):
+        invalidate_entity_cache(project_name)
+        Anatomy.clear_cache(project_name)
+        clear_settings_cache(project_name)
+
+    def _on_entity_change(
+        self, project_name, entity_type, entity_id, operation,
+        changed_keys=None
+    ):
+        if not entity_type or entity_type == "project":
+            # Type of deleted entities is unknown
+            self._on_project_change(project_name)
+        else:
+            invalidate_entity_cache(project_name, [entity_type])
+
+        emit_event(
+            "entity.{}.{}".format(entity_type or "unknown", operation),
+            {
+                "project_name": project_name,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "operation": operation,
+                "changed_keys": changed_keys or [],
+            },
+            EVENTS_SOURCE
+        )
+
+
+def _hash_document(doc):
+    return hashlib.md5(dumps(doc, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+_listener = None
+
+
+def get_entity_changes_listener():
+    """Listener of process if was started.
+
+    Returns:
+        Union[EntityChangesListener, None]: Running listener.
+    """
+
+    return _listener
+
+
+def start_entity_changes_listener(poll_interval=None, cache_lifetime=None):
+    """Start listener of database changes in current process.
+
+    Args:
+        poll_interval (Optional[float]): Interval of polling in seconds used
+            when change streams are not available.
+        cache_lifetime (Optional[int]): Lifetime of anatomy and settings
+            caches in seconds while change stream is watched.
+
+    Returns:
+        EntityChangesListener: Started listener.
+    """
+
+    global _listener
+    if _listener is None:
+        _listener = EntityChangesListener(poll_interval, cache_lifetime)
+    _listener.start()
+    return _listener
+
+
+def stop_entity_changes_listener():
+    """Stop listener of database changes if is running."""
+
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
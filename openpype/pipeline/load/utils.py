@@ -12,7 +12,6 @@ from openpype.client import (
     get_project,
     get_assets,
     get_subsets,
-    get_versions,
     get_version_by_id,
     get_last_version_by_subset_id,
     get_hero_version_by_subset_id,
@@ -21,7 +20,9 @@ from openpype.client import (
     get_representations,
     get_representation_by_id,
     get_representation_by_name,
-    get_representation_parents
+    get_representation_parents,
+    get_representations_contexts,
+    get_versions_contexts,
 )
 from openpype.lib import (
     StringTemplate,
@@ -117,60 +118,26 @@ def get_contexts_for_repre_docs(project_name, repre_docs):
         version_ids.add(repre_doc["parent"])
         repre_docs_by_id[repre_doc["_id"]] = repre_doc
 
-    version_docs = get_versions(
-        project_name, version_ids, hero=True
-    )
-
-    version_docs_by_id = {}
-    hero_version_docs = []
-    versions_for_hero = set()
-    subset_ids = set()
-    for version_doc in version_docs:
-        if version_doc["type"] == "hero_version":
-            hero_version_docs.append(version_doc)
-            versions_for_hero.add(version_doc["version_id"])
-        version_docs_by_id[version_doc["_id"]] = version_doc
-        subset_ids.add(version_doc["parent"])
-
-    if versions_for_hero:
-        _version_docs = get_versions(project_name, versions_for_hero)
-        _version_data_by_id = {
-            version_doc["_id"]: version_doc["data"]
-            for version_doc in _version_docs
-        }
-
-        for hero_version_doc in hero_version_docs:
-            hero_version_id = hero_version_doc["_id"]
-            version_id = hero_version_doc["version_id"]
-            version_data = copy.deepcopy(_version_data_by_id[version_id])
-            version_docs_by_id[hero_version_id]["data"] = version_data
-
-    subset_docs = get_subsets(project_name, subset_ids)
-    subset_docs_by_id = {}
-    asset_ids = set()
-    for subset_doc in subset_docs:
-        subset_docs_by_id[subset_doc["_id"]] = subset_doc
-        asset_ids.add(subset_doc["parent"])
-
-    asset_docs = get_assets(project_name, asset_ids)
-    asset_docs_by_id = {
-        asset_doc["_id"]: asset_doc
-        for asset_doc in asset_docs
-    }
+    version_contexts = get_versions_contexts(project_name, version_ids)
 
     project_doc = get_project(project_name)
 
     for repre_id, repre_doc in repre_docs_by_id.items():
-        version_doc = version_docs_by_id[repre_doc["parent"]]
-        subset_doc = subset_docs_by_id[version_doc["parent"]]
-        asset_doc = asset_docs_by_id[subset_doc["parent"]]
+        version_context = version_contexts[repre_doc["parent"]]
+        version_doc = version_context["version"]
+        hero_source_version_doc = version_context["hero_source_version"]
+        if hero_source_version_doc is not None:
+            version_doc["data"] = copy.deepcopy(
+                hero_source_version_doc["data"]
+            )
+
         context = {
             "project": {
                 "name": project_doc["name"],
                 "code": project_doc["data"].get("code")
             },
-            "asset": asset_doc,
-            "subset": subset_doc,
+            "asset": version_context["asset"],
+            "subset": version_context["subset"],
             "version": version_doc,
             "representation": repre_doc,
         }
@@ -535,7 +502,7 @@ def get_representation_path_from_context(context):
     root = None
     session_project = legacy_io.Session.get("AVALON_PROJECT")
     if project_doc and project_doc["name"] != session_project:
-        anatomy = Anatomy(project_doc["name"])
+        anatomy = Anatomy.get_shared(project_doc["name"])
         root = anatomy.roots
 
     return get_representation_path(representation, root)
@@ -862,40 +829,38 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields=["_id", "parent"]
-    )
-    # Store representations by stringified representation id
-    repre_docs_by_str_id = {}
-    repre_docs_by_version_id = collections.defaultdict(list)
-    for repre_doc in repre_docs:
-        repre_id = str(repre_doc["_id"])
-        version_id = repre_doc["parent"]
-        repre_docs_by_str_id[repre_id] = repre_doc
-        repre_docs_by_version_id[version_id].append(repre_doc)
-
-    # Query version docs to get it's subset ids
+    # Query representations with their versions in one call
     # - also query hero version to be able identify if representation
     #   belongs to existing version
-    version_docs = get_versions(
+    repre_contexts = get_representations_contexts(
         project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
+        repre_ids,
+        parent_type="version",
+        fields_by_type={
+            "representation": ["_id", "parent"],
+            "version": ["_id", "parent", "type"],
+        }
     )
+    # Store representations by stringified representation id
+    repre_docs_by_str_id = {}
     verisons_by_id = {}
     versions_by_subset_id = collections.defaultdict(list)
-    hero_version_ids = set()
-    for version_doc in version_docs:
+    for repre_context in repre_contexts.values():
+        repre_doc = repre_context["representation"]
+        repre_docs_by_str_id[str(repre_doc["_id"])] = repre_doc
+
+        version_doc = repre_context["version"]
+        if version_doc is None:
+            continue
+
         version_id = version_doc["_id"]
+        if version_id in verisons_by_id:
+            continue
         # Store versions by their ids
         verisons_by_id[version_id] = version_doc
         # There's no need to query subsets for hero versions
         #   - they are considered as latest?
         if version_doc["type"] == "hero_version":
-            hero_version_ids.add(version_id)
             continue
         subset_id = version_doc["parent"]
         versions_by_subset_id[subset_id].append(version_doc)
@@ -5,7 +5,11 @@ import logging
 import pymongo
 from uuid import uuid4
 
-from openpype.client import OpenPypeMongoConnection
+from openpype.client import (
+    OpenPypeMongoConnection,
+    invalidate_entity_cache,
+    mark_project_snapshot_stale,
+)
 
 from . import schema
 
@@ -32,6 +36,36 @@ def requires_install(func):
     return decorated
 
 
+# Collection methods changing documents
+#   - entity cache of project is invalidated after they're called
+COLLECTION_WRITE_METHODS = {
+    "bulk_write",
+    "insert_one",
+    "insert_many",
+    "replace_one",
+    "update_one",
+    "update_many",
+    "delete_one",
+    "delete_many",
+    "find_one_and_delete",
+    "find_one_and_replace",
+    "find_one_and_update",
+}
+
+
+def invalidates_entity_cache(func, project_name):
+    """Invalidate entity cache of project after function call."""
+
+    @functools.wraps(func)
+    def decorated(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            mark_project_snapshot_stale(project_name)
+            invalidate_entity_cache(project_name)
+    return decorated
+
+
 def auto_reconnect(func):
     """Handling auto reconnect in 3 retry times"""
     retry_times = 3
@@ -154,6 +188,8 @@ class AvalonMongoDB:
         # Decorate function
         if callable(attr):
             attr = auto_reconnect(attr)
+            if attr_name in COLLECTION_WRITE_METHODS:
+                attr = invalidates_entity_cache(attr, project_name)
         return attr
 
     @property
@@ -241,9 +277,14 @@ class AvalonMongoDB:
     def insert_one(self, item, *args, **kwargs):
         assert isinstance(item, dict), "item must be of type <dict>"
         schema.validate(item)
-        return self._database[self.active_project()].insert_one(
-            item, *args, **kwargs
-        )
+        project_name = self.active_project()
+        try:
+            return self._database[project_name].insert_one(
+                item, *args, **kwargs
+            )
+        finally:
+            mark_project_snapshot_stale(project_name)
+            invalidate_entity_cache(project_name)
 
     @auto_reconnect
     def insert_many(self, items, *args, **kwargs):
@@ -253,9 +294,14 @@ class AvalonMongoDB:
             assert isinstance(item, dict), "`item` must be of type <dict>"
             schema.validate(item)
 
-        return self._database[self.active_project()].insert_many(
-            items, *args, **kwargs
-        )
+        project_name = self.active_project()
+        try:
+            return self._database[project_name].insert_many(
+                items, *args, **kwargs
+            )
+        finally:
+            mark_project_snapshot_stale(project_name)
+            invalidate_entity_cache(project_name)
 
     def parenthood(self, document):
         assert document is not None, "This is a bug"
@@ -0,0 +1,274 @@
+"""Cache of publish plugins discovery.
+
+Python files in publish plugin directories are compiled to bytecode which
+is cached in memory and on disk. Cached bytecode is used while path,
+modification time and size of the file did not change.
+
+For each successfully executed file is stored manifest of pyblish plugin
+classes defined in the file with their hosts and families. Files whose
+plugins can't match registered hosts or requested families don't have to
+be executed at all.
+
+Hosts and families may be inherited from base classes defined in other
+modules which are not validated by the file stamp. Cache is stored per
+OpenPype version so manifests are created again after update.
+"""
+
+import os
+import sys
+import marshal
+import hashlib
+import logging
+
+import pyblish.plugin
+
+import openpype.version
+
+log = logging.getLogger(__name__)
+
+
+def get_publish_plugins_cache_dir():
+    """Directory where compiled publish plugins are stored.
+
+    Cache is specific for python version as it is stored using 'marshal'
+    and for OpenPype version as manifests depend on base plugin classes.
+    """
+
+    import appdirs
+
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "publish_plugins_cache",
+        openpype.version.__version__,
+        "py{}{}".format(*sys.version_info[:2])
+    )
+
+
+def _to_list(value):
+    if value is None:
+        return []
+    if not isinstance(value, (list, tuple, set)):
+        value = [value]
+    return [str(item) for item in value]
+
+
+def get_plugins_manifest(module):
+    """Manifest of pyblish plugins defined in a module.
+
+    Args:
+        module (types.ModuleType): Executed plugin module.
+
+    Returns:
+        List[Tuple[str, List[str], List[str]]]: Name, hosts and families
+            of each pyblish plugin class in module.
+    """
+
+    manifest = []
+    for name in dir(module):
+        if name.startswith("_"):
+            continue
+        obj = getattr(module, name)
+        if (
+            not isinstance(obj, type)
+            or not issubclass(obj, pyblish.plugin.Plugin)
+        ):
+            continue
+        manifest.append((
+            obj.__name__,
+            _to_list(getattr(obj, "hosts", None)),
+            _to_list(getattr(obj, "families", None)),
+        ))
+    return manifest
+
+
+def manifest_can_match(manifest, host_names, families=None):
+    """Can any plugin from manifest match hosts and families.
+
+    Host match is the same as in 'pyblish.plugin.host_is_compatible' so
+    file without compatible plugin would not add any plugin to discovery.
+    Families match is conservative, plugin does not match only if none of
+    its families is in passed families.
+
+    Args:
+        manifest (List[Tuple[str, List[str], List[str]]]): Manifest of
+            plugins in a file.
+        host_names (Iterable[str]): Registered host names.
+        families (Optional[Iterable[str]]): Families of instances which
+            will be published. Families are not checked if not passed.
+
+    Returns:
+        bool: Some plugin from manifest can match.
+    """
+
+    host_names = set(host_names)
+    if families is not None:
+        families = set(families)
+
+    for _, plugin_hosts, plugin_families in manifest:
+        if "*" not in plugin_hosts and not host_names & set(plugin_hosts):
+            continue
+
+        if (
+            families is None
+            or not plugin_families
+            or "*" in plugin_families
+            or families & set(plugin_families)
+        ):
+            return True
+    return False
+
+
+class PluginFileRecord(object):
+    """Cached data of single plugin file.
+
+    Args:
+        stamp (Tuple[float, int]): Modification time and size of file.
+        code (types.CodeType): Compiled code of file.
+        manifest (Union[List[tuple], None]): Manifest of plugins in file.
+            Is 'None' until the file is successfully executed.
+    """
+
+    def __init__(self, stamp, code, manifest=None):
+        self.stamp = stamp
+        self.code = code
+        self.manifest = manifest
+
+    def to_data(self):
+        return (self.stamp, self.code, self.manifest)
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(*data)
+
+
+class PublishPluginsCache(object):
+    """Bytecode and manifest cache of publish plugin directories.
+
+    Records of all files in a directory are stored in one file in cache
+    directory. Records are validated by modification time and size of each
+    file, so changed files are compiled again.
+
+    Args:
+        cache_dir (Optional[str]): Directory where records are stored.
+            Output of 'get_publish_plugins_cache_dir' is used if not passed.
+    """
+
+    def __init__(self, cache_dir=None):
+        self._cache_dir = cache_dir
+        self._records_by_dir = {}
+        self._changed_dirs = set()
+
+    @property
+    def cache_dir(self):
+        if self._cache_dir is None:
+            self._cache_dir = get_publish_plugins_cache_dir()
+        return self._cache_dir
+
+    def _get_dir_cache_path(self, dirpath):
+        dir_hash = hashlib.sha1(dirpath.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, dir_hash + ".bin")
+
+    def _get_dir_records(self, dirpath):
+        records = self._records_by_dir.get(dirpath)
+        if records is not None:
+            return records
+
+        records = {}
+        try:
+            with open(self._get_dir_cache_path(dirpath), "rb") as stream:
+                data = marshal.loads(stream.read())
+            records = {
+                filepath: PluginFileRecord.from_data(item)
+                for filepath, item in data.items()
+            }
+
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            pass
+        self._records_by_dir[dirpath] = records
+        return records
+
+    def get_record(self, filepath):
+        """Record of file with compiled code.
+
+        Source is compiled if file is not cached or was changed.
+
+        Args:
+            filepath (str): Normalized path to python file.
+
+        Returns:
+            PluginFileRecord: Record of the file.
+        """
+
+        stat = os.stat(filepath)
+        stamp = (stat.st_mtime, stat.st_size)
+        dirpath = os.path.dirname(filepath)
+        records = self._get_dir_records(dirpath)
+        record = records.get(filepath)
+        if record is not None and record.stamp == stamp:
+            return record
+
+        with open(filepath, "rb") as stream:
+            code = compile(stream.read(), filepath, "exec")
+        record = PluginFileRecord(stamp, code)
+        records[filepath] = record
+        self._changed_dirs.add(dirpath)
+        return record
+
+    def set_manifest(self, filepath, manifest):
+        """Store manifest of plugins of executed file."""
+        dirpath = os.path.dirname(filepath)
+        record = self._get_dir_records(dirpath).get(filepath)
+        if record is not None and record.manifest != manifest:
+            record.manifest = manifest
+            self._changed_dirs.add(dirpath)
+
+    def save(self):
+        """Store changed records to cache directory."""
+        changed_dirs = self._changed_dirs
+        self._changed_dirs = set()
+        for dirpath in changed_dirs:
+            records = self._records_by_dir[dirpath]
+            # Remove records of files which don't exist anymore
+            data = {
+                filepath: record.to_data()
+                for filepath, record in records.items()
+                if os.path.exists(filepath)
+            }
+            cache_path = self._get_dir_cache_path(dirpath)
+            try:
+                if not os.path.exists(self.cache_dir):
+                    os.makedirs(self.cache_dir)
+                tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+                with open(tmp_path, "wb") as stream:
+                    stream.write(marshal.dumps(data))
+                if os.path.exists(cache_path):
+                    os.remove(cache_path)
+                os.rename(tmp_path, cache_path)
+
+            except (IOError, OSError):
+                log.debug(
+                    "Failed to store publish plugins cache \"{}\"".format(
+                        cache_path
+                    ),
+                    exc_info=True
+                )
+
+    def clear(self):
+        """Clear records in memory."""
+        self._records_by_dir = {}
+        self._changed_dirs = set()
+
+
+class _GlobalCache:
+    _cache = None
+
+    @classmethod
+    def get_cache(cls):
+        if cls._cache is None:
+            cls._cache = PublishPluginsCache()
+        return cls._cache
+
+
+def get_publish_plugins_cache():
+    """Global publish plugins cache used by 'publish_plugins_discover'."""
+    return _GlobalCache.get_cache()
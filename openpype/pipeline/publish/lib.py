@@ -10,16 +10,22 @@ import six
 import pyblish.plugin
 import pyblish.api
 
-from openpype.lib import Logger, filter_profiles
+from openpype.lib import Logger, filter_profiles, get_compiled_profiles
 from openpype.settings import (
     get_project_settings,
     get_system_settings,
 )
+from openpype.settings.cache import unfreeze_settings
 
 from .contants import (
     DEFAULT_PUBLISH_TEMPLATE,
     DEFAULT_HERO_PUBLISH_TEMPLATE,
 )
+from .discover_cache import (
+    get_publish_plugins_cache,
+    get_plugins_manifest,
+    manifest_can_match,
+)
 
 
 def get_template_name_profiles(
@@ -37,6 +43,14 @@ def get_template_name_profiles(
         List[Dict[str, Any]]: Publish template profiles.
     """
 
+    return copy.deepcopy(
+        _get_template_name_profiles(project_name, project_settings, logger)
+    )
+
+
+def _get_template_name_profiles(project_name, project_settings, logger):
+    """Publish template profiles without copy of settings values."""
+
     if not project_name and not project_settings:
         raise ValueError((
             "Both project name and project settings are missing."
@@ -44,7 +58,7 @@ def get_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
 
     profiles = (
         project_settings
@@ -54,7 +68,7 @@ def get_template_name_profiles(
         ["template_name_profiles"]
     )
     if profiles:
-        return copy.deepcopy(profiles)
+        return profiles
 
     # Use legacy approach for cases new settings are not filled yet for the
     #   project
@@ -98,6 +112,16 @@ def get_hero_template_name_profiles(
         List[Dict[str, Any]]: Publish template profiles.
     """
 
+    return copy.deepcopy(
+        _get_hero_template_name_profiles(
+            project_name, project_settings, logger
+        )
+    )
+
+
+def _get_hero_template_name_profiles(project_name, project_settings, logger):
+    """Hero publish template profiles without copy of settings values."""
+
     if not project_name and not project_settings:
         raise ValueError((
             "Both project name and project settings are missing."
@@ -105,7 +129,7 @@ def get_hero_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
 
     profiles = (
         project_settings
@@ -115,11 +139,11 @@ def get_hero_template_name_profiles(
         ["hero_template_name_profiles"]
     )
     if profiles:
-        return copy.deepcopy(profiles)
+        return profiles
 
     # Use legacy approach for cases new settings are not filled yet for the
     #   project
-    legacy_profiles = copy.deepcopy(
+    legacy_profiles = (
         project_settings
         ["global"]
         ["publish"]
@@ -180,16 +204,18 @@ def get_publish_template_name(
     }
     if hero:
         default_template = DEFAULT_HERO_PUBLISH_TEMPLATE
-        profiles = get_hero_template_name_profiles(
+        profiles = _get_hero_template_name_profiles(
             project_name, project_settings, logger
         )
 
     else:
-        profiles = get_template_name_profiles(
+        profiles = _get_template_name_profiles(
             project_name, project_settings, logger
         )
         default_template = DEFAULT_PUBLISH_TEMPLATE
 
+    # Profiles are compiled once for settings object
+    profiles = get_compiled_profiles(profiles)
     profile = filter_profiles(profiles, filter_criteria, logger=logger)
     if profile:
         template = profile["template_name"]
@@ -199,13 +225,15 @@ def get_publish_template_name(
 class DiscoverResult:
     """Hold result of publish plugins discovery.
 
-    Stores discovered plugins duplicated plugins and file paths which
-    crashed on execution of file.
+    Stores discovered plugins duplicated plugins, file paths which
+    crashed on execution of file and file paths which were skipped because
+    their plugins can't match current host or families.
     """
     def __init__(self):
         self.plugins = []
         self.crashed_file_paths = {}
         self.duplicated_plugins = []
+        self.skipped_file_paths = []
 
     def __iter__(self):
         for plugin in self.plugins:
@@ -272,15 +300,24 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+def publish_plugins_discover(paths=None, families=None, use_cache=True):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able collect crashed files
     and reason of their crash.
 
+    Plugin files are executed from cached bytecode. Files which were already
+    executed and none of their plugins can match registered hosts, or
+    passed families, are not executed at all.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        families (Iterable[str], optional): Families of instances which
+            will be published. Files with plugins which can't process any
+            of the families are skipped. Families are not used for
+            filtering if not passed.
+        use_cache (bool): Use cached bytecode and plugins manifest.
 
     """
 
@@ -293,6 +330,12 @@ def publish_plugins_discover(paths=None):
     allow_duplicates = pyblish.plugin.ALLOW_DUPLICATES
     log = pyblish.plugin.log
 
+    cache = None
+    host_names = None
+    if use_cache:
+        cache = get_publish_plugins_cache()
+        host_names = pyblish.plugin.registered_hosts()
+
     # Include plug-ins from registered paths
     if not paths:
         paths = pyblish.plugin.plugin_paths()
@@ -320,8 +363,23 @@ def publish_plugins_discover(paths=None):
             module.__file__ = abspath
 
             try:
-                with open(abspath, "rb") as f:
-                    six.exec_(f.read(), module.__dict__)
+                if cache is None:
+                    with open(abspath, "rb") as f:
+                        six.exec_(f.read(), module.__dict__)
+
+                else:
+                    record = cache.get_record(abspath)
+                    if (
+                        record.manifest is not None
+                        and not manifest_can_match(
+                            record.manifest, host_names, families
+                        )
+                    ):
+                        result.skipped_file_paths.append(abspath)
+                        continue
+
+                    six.exec_(record.code, module.__dict__)
+                    cache.set_manifest(abspath, get_plugins_manifest(module))
 
                 # Store reference to original module, to avoid
                 # garbage collection from collecting it's global
@@ -367,6 +425,9 @@ def publish_plugins_discover(paths=None):
 
     result.plugins = plugins
 
+    if cache is not None:
+        cache.save()
+
     return result
 
 
@@ -378,6 +439,11 @@ def filter_pyblish_plugins(plugins):
     is called the method. Default behavior looks for plugin name and current
     host name to look for
 
+    Values are set on plugins as mutable copies. Options listed in plugin's
+    attribute 'read_only_settings' are set as read-only settings values
+    which are shared until settings change, e.g. profiles filtered with
+    'get_compiled_profiles' are compiled only once per settings version.
+
     Args:
         plugins (List[pyblish.plugin.Plugin]): Discovered plugins on which
             are applied settings.
@@ -391,17 +457,22 @@ def filter_pyblish_plugins(plugins):
     host = pyblish.api.current_host()
     project_name = os.environ.get("AVALON_PROJECT")
 
-    project_setting = get_project_settings(project_name)
-    system_settings = get_system_settings()
+    project_setting = get_project_settings(project_name, read_only=True)
+    # Mutable copies are created only if a plugin implements 'apply_settings'
+    mutable_settings = None
 
     # iterate over plugins
     for plugin in plugins[:]:
         if hasattr(plugin, "apply_settings"):
+            if mutable_settings is None:
+                mutable_settings = (
+                    project_setting.copy(), get_system_settings()
+                )
             try:
                 # Use classmethod 'apply_settings'
                 # - can be used to target settings from custom settings place
                 # - skip default behavior when successful
-                plugin.apply_settings(project_setting, system_settings)
+                plugin.apply_settings(*mutable_settings)
                 continue
 
             except Exception:
@@ -448,6 +519,7 @@ def filter_pyblish_plugins(plugins):
             except KeyError:
                 continue
 
+        read_only_options = getattr(plugin, "read_only_settings", None) or ()
         for option, value in config_data.items():
             if option == "enabled" and value is False:
                 log.info('removing plugin {}'.format(plugin.__name__))
@@ -456,6 +528,8 @@ def filter_pyblish_plugins(plugins):
                 log.info('setting {}:{} on plugin {}'.format(
                     option, value, plugin.__name__))
 
+                if option not in read_only_options:
+                    value = unfreeze_settings(value)
                 setattr(plugin, option, value)
 
 
@@ -16,7 +16,7 @@ def get_general_template_data(system_settings=None):
     """
 
     if not system_settings:
-        system_settings = get_system_settings()
+        system_settings = get_system_settings(read_only=True)
     studio_name = system_settings["general"]["studio_name"]
     studio_code = system_settings["general"]["studio_code"]
     return {
@@ -105,7 +105,7 @@ class TemplateResolver(ThumbnailResolver):
         })
         # Add anatomy roots if is in template
         if "{root" in template:
-            anatomy = Anatomy(project_name)
+            anatomy = Anatomy.get_shared(project_name)
             template_data["root"] = anatomy.roots
 
         try:
@@ -67,7 +67,7 @@ def get_workfile_template_key(
         return default
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
 
     try:
         profiles = (
@@ -122,7 +122,7 @@ def get_workdir_with_workdir_data(
     """
 
     if not anatomy:
-        anatomy = Anatomy(project_name)
+        anatomy = Anatomy.get_shared(project_name)
 
     if not template_key:
         template_key = get_workfile_template_key(
@@ -173,7 +173,7 @@ def get_workdir(
     """
 
     if not anatomy:
-        anatomy = Anatomy(project_doc["name"])
+        anatomy = Anatomy.get_shared(project_doc["name"])
 
     workdir_data = get_template_data(
         project_doc, asset_doc, task_name, host_name
@@ -403,7 +403,7 @@ def get_custom_workfile_template(
         return
 
     if anatomy is None:
-        anatomy = Anatomy(project_name)
+        anatomy = Anatomy.get_shared(project_name)
 
     # get project, asset, task anatomy context data
     anatomy_context_data = get_template_data(
@@ -497,7 +497,7 @@ def create_workdir_extra_folders(
 
     # Load project settings if not set
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
 
     # Load extra folders profiles
     extra_folders_profiles = (
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Collect OpenPype modules."""
-from openpype.modules import ModulesManager
+from openpype.pipeline.context_tools import _get_modules_manager
 import pyblish.api
 
 
@@ -11,5 +11,6 @@ class CollectModules(pyblish.api.ContextPlugin):
     label = "OpenPype Modules"
 
     def process(self, context):
-        manager = ModulesManager()
+        # Reuse modules manager of the process which may be lazy
+        manager = _get_modules_manager()
         context.data["openPypeModules"] = manager.modules_by_name
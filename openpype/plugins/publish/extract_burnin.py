@@ -20,7 +20,10 @@ from openpype.lib import (
 
     CREATE_NO_WINDOW
 )
-from openpype.lib.profiles_filtering import filter_profiles
+from openpype.lib.profiles_filtering import (
+    filter_profiles,
+    get_compiled_profiles,
+)
 
 
 class ExtractBurnin(publish.Extractor):
@@ -75,6 +78,8 @@ class ExtractBurnin(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Profiles are not copied from settings to be compiled only once
+    read_only_settings = ["profiles"]
 
     def process(self, instance):
 
@@ -163,8 +168,8 @@ class ExtractBurnin(publish.Extractor):
             "task_types": task_type,
             "subset": subset
         }
-        profile = filter_profiles(self.profiles, filtering_criteria,
-                                  logger=self.log)
+        profile = filter_profiles(get_compiled_profiles(self.profiles),
+                                  filtering_criteria, logger=self.log)
 
         if not profile:
             self.log.info((
@@ -1,4 +1,5 @@
 import os
+import re
 import logging
 import sys
 import copy
@@ -20,10 +21,16 @@ from openpype.client.operations import (
 
 from openpype.client import (
     get_representations,
+    get_representation_files_by_content_hash,
     get_subset_by_name,
     get_version_by_name,
 )
-from openpype.lib import source_hash
+from openpype.lib import (
+    source_hash_from_stat,
+    get_files_stats,
+    get_content_hashes,
+    format_file_size,
+)
 from openpype.lib.file_transaction import FileTransaction
 from openpype.pipeline.publish import (
     KnownPublishError,
@@ -32,6 +39,9 @@ from openpype.pipeline.publish import (
 
 log = logging.getLogger(__name__)
 
+# Root part of rootless path e.g. '{root[work]}'
+ROOT_KEY_REGEX = re.compile(r"^\{root(\[[^\]]*\])?\}")
+
 
 def get_instance_families(instance):
     """Get all families of the instance"""
@@ -53,6 +63,36 @@ def get_frame_padded(frame, padding):
     return "{frame:0{padding}d}".format(padding=padding, frame=frame)
 
 
+class _TransferProgressLogger(object):
+    """Log aggregated progress of file transfers by tens of percents."""
+
+    def __init__(self, log):
+        self._log = log
+        self._last_percent = 0
+
+    def __call__(self, progress):
+        if progress.total_bytes:
+            ratio = float(progress.done_bytes) / progress.total_bytes
+        elif progress.total_files:
+            ratio = float(progress.done_files) / progress.total_files
+        else:
+            return
+
+        percent = int(ratio * 10) * 10
+        if percent <= self._last_percent:
+            return
+        self._last_percent = percent
+        self._log.debug(
+            "Transferred {}% ({}/{} files, {}/{} bytes)".format(
+                percent,
+                progress.done_files,
+                progress.total_files,
+                progress.done_bytes,
+                progress.total_bytes
+            )
+        )
+
+
 class IntegrateAsset(pyblish.api.InstancePlugin):
     """Register publish in the database and transfer files to destinations.
 
@@ -144,6 +184,20 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "family", "hierarchy", "username", "user", "output"
     ]
     skip_host_families = []
+    # Maximum number of threads transferring files
+    transfer_max_workers = 8
+    # Maximum number of threads by anatomy root name
+    transfer_workers_by_root = {}
+    # Transfer files to temporary files recorded in journal
+    transfer_journal = False
+    # Flush transferred files to disk before commit
+    transfer_fsync = False
+    # Hardlink files with identical content which were already published
+    content_dedup = {
+        "enabled": False,
+        "min_size": 1,
+        "hash_algorithm": "blake2b",
+    }
 
     def process(self, instance):
         if self._temp_skip_instance_by_settings(instance):
@@ -168,7 +222,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log)
+        file_transactions = self._create_file_transaction(instance)
         try:
             self.register(instance, file_transactions, filtered_repres)
         except Exception:
@@ -182,6 +236,27 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # the try, except.
         file_transactions.finalize()
 
+    def _create_file_transaction(self, instance):
+        anatomy = instance.context.data["anatomy"]
+        workers_by_root = {}
+        for root_name, workers in self.transfer_workers_by_root.items():
+            root = anatomy.roots.get(root_name)
+            if root is None:
+                self.log.warning(
+                    "Unknown root \"{}\" in transfer workers settings".format(
+                        root_name))
+                continue
+            workers_by_root[root.value] = workers
+
+        return FileTransaction(
+            log=self.log,
+            max_workers=self.transfer_max_workers,
+            workers_by_root=workers_by_root,
+            progress_callback=_TransferProgressLogger(self.log),
+            journal=self.transfer_journal,
+            fsync=self.transfer_fsync
+        )
+
     def _temp_skip_instance_by_settings(self, instance):
         """Decide if instance will be processed with new or legacy integrator.
 
@@ -328,6 +403,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                       "written to database..".format(subset=subset,
                                                      version=version))
 
+        content_hashes = self.deduplicate_transfers(
+            instance, anatomy, file_transactions
+        )
+
         # Process all file transfers of all integrations now
         self.log.debug("Integrating source files to destination ...")
         file_transactions.process()
@@ -348,9 +427,20 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can re-use those file infos per representation
-        resource_file_infos = self.get_files_info(resource_destinations,
-                                                  sites=sites,
-                                                  anatomy=anatomy)
+        # Reuse stat of transferred files for file infos
+        destinations = list(resource_destinations)
+        for prepared in prepared_representations:
+            destinations.extend(dst for _, dst in prepared["transfers"])
+        file_stats = self.get_destinations_stats(
+            file_transactions, destinations
+        )
+        resource_file_infos = self.get_files_info(
+            resource_destinations,
+            sites=sites,
+            anatomy=anatomy,
+            file_stats=file_stats,
+            content_hashes=content_hashes
+        )
 
         # Finalize the representations now the published files are integrated
         # Get 'files' info for representations and its attached resources
@@ -361,7 +451,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_doc["files"] = self.get_files_info(
-                destinations, sites=sites, anatomy=anatomy
+                destinations,
+                sites=sites,
+                anatomy=anatomy,
+                file_stats=file_stats,
+                content_hashes=content_hashes
             )
 
             # Add the version resource file infos to each representation
@@ -843,13 +937,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         family = anatomy_data["family"]
         task_info = anatomy_data.get("task") or {}
 
+        # Cached read-only project settings are used (instead of mutable
+        #   settings in context) so profiles are compiled only once
         return get_publish_template_name(
             project_name,
             host_name,
             family,
             task_name=task_info.get("name"),
             task_type=task_info.get("type"),
-            project_settings=context.data["project_settings"],
             logger=self.log
         )
 
@@ -880,25 +975,200 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, destinations, sites, anatomy):
+    def get_rootless_paths(self, anatomy, paths):
+        """Batch variant of 'get_rootless_path'.
+
+        Args:
+            anatomy: anatomy part from instance
+            paths (List[str]): absolute paths
+        Returns:
+            List[str]: modified paths if possible, or unmodified paths
+        """
+
+        output = []
+        results = anatomy.find_root_templates_from_paths(paths)
+        for path, (success, rootless_path) in zip(paths, results):
+            if success:
+                path = rootless_path
+            else:
+                self.log.warning((
+                    "Could not find root path for remapping \"{}\"."
+                    " This may cause issues on farm."
+                ).format(path))
+            output.append(path)
+        return output
+
+    def deduplicate_transfers(self, instance, anatomy, file_transactions):
+        """Hardlink files with content which was already published.
+
+        Content hash of copied files is compared with content hashes of
+        published files in the same project root. Copy is replaced with
+        hardlink of the published file, or skipped if destination already
+        has the content.
+
+        Arguments:
+            instance (pyblish.api.Instance): Published instance.
+            anatomy (Anatomy): Project anatomy.
+            file_transactions (FileTransaction): Queued file transaction.
+        Returns:
+            Dict[str, str]: Content hash by normalized destination path.
+        """
+
+        if not self.content_dedup["enabled"]:
+            return {}
+
+        copies = [
+            (src, dst)
+            for src, dst, mode in file_transactions.queued_transfers
+            if mode == FileTransaction.MODE_COPY
+        ]
+        src_stats = get_files_stats(
+            {src for src, _ in copies}, self.transfer_max_workers
+        )
+        min_size = self.content_dedup["min_size"] * 1024 * 1024
+        copies = [
+            (src, dst)
+            for src, dst in copies
+            if src in src_stats and src_stats[src].st_size >= min_size
+        ]
+        if not copies:
+            return {}
+
+        hashes_by_src = get_content_hashes(
+            {src for src, _ in copies},
+            self.content_dedup["hash_algorithm"],
+            self.transfer_max_workers
+        )
+        project_name = instance.context.data["projectName"]
+        published_by_hash = get_representation_files_by_content_hash(
+            project_name, hashes_by_src.values()
+        )
+
+        content_hashes = {}
+        saved_bytes = 0
+        deduplicated = 0
+        dst_rootless_paths = self.get_rootless_paths(
+            anatomy, [dst for _, dst in copies]
+        )
+        for (src, dst), dst_rootless in zip(copies, dst_rootless_paths):
+            content_hash = hashes_by_src[src]
+            content_hashes[dst] = content_hash
+            dst_root = ROOT_KEY_REGEX.match(dst_rootless)
+            if dst_root is None:
+                continue
+
+            size = src_stats[src].st_size
+            for rootless_path in published_by_hash.get(content_hash, []):
+                # Hardlinks can't be created across roots
+                if not rootless_path.startswith(dst_root.group(0)):
+                    continue
+                path = os.path.normpath(anatomy.fill_root(rootless_path))
+                try:
+                    if os.path.getsize(path) != size:
+                        continue
+                except OSError:
+                    continue
+
+                if path == dst:
+                    self.log.debug(
+                        "Destination has the same content: {}".format(dst))
+                    file_transactions.update_transfer(dst, dst)
+                else:
+                    self.log.debug(
+                        "Hardlinking published file: {} -> {}".format(
+                            path, dst))
+                    file_transactions.update_transfer(
+                        dst, path, FileTransaction.MODE_HARDLINK_OR_COPY
+                    )
+                saved_bytes += size
+                deduplicated += 1
+                break
+
+        self.log.info(
+            "Deduplicated {} of {} files, saved {}".format(
+                deduplicated, len(copies), format_file_size(saved_bytes)
+            )
+        )
+        instance.data["deduplicatedBytes"] = saved_bytes
+        return content_hashes
+
+    def get_destinations_stats(self, file_transactions, destinations):
+        """Stat of published files.
+
+        Stat of files transferred by file transaction is reused, stat of
+        other files is collected in batch.
+
+        Arguments:
+            file_transactions (FileTransaction): Processed file transaction.
+            destinations (Iterable[str]): Destination paths.
+        Returns:
+            Dict[str, os.stat_result]: Stat by normalized destination path.
+        """
+
+        file_stats = file_transactions.transferred_stats
+        missing = set()
+        for path in destinations:
+            path = os.path.normpath(os.path.abspath(path))
+            if path not in file_stats:
+                missing.add(path)
+
+        if missing:
+            file_stats.update(get_files_stats(
+                missing, max_workers=self.transfer_max_workers
+            ))
+        return file_stats
+
+    def get_files_info(
+        self,
+        destinations,
+        sites,
+        anatomy,
+        file_stats=None,
+        content_hashes=None
+    ):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             destinations (list): List of transferred file destinations
             sites (list): array of published locations
             anatomy: anatomy part from instance
+            file_stats (Optional[Dict[str, os.stat_result]]): Known stat of
+                files by normalized path
+            content_hashes (Optional[Dict[str, str]]): Content hashes of
+                files by normalized path
         Returns:
             output_resources: array of dictionaries to be added to 'files' key
             in representation
         """
 
+        if file_stats is None:
+            file_stats = {}
+        if content_hashes is None:
+            content_hashes = {}
         file_infos = []
-        for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+        rootless_paths = self.get_rootless_paths(anatomy, destinations)
+        for file_path, rootless_path in zip(destinations, rootless_paths):
+            normalized_path = os.path.normpath(os.path.abspath(file_path))
+            file_info = self.prepare_file_info(
+                file_path,
+                anatomy,
+                sites=sites,
+                rootless_path=rootless_path,
+                stat=file_stats.get(normalized_path),
+                content_hash=content_hashes.get(normalized_path)
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def prepare_file_info(
+        self,
+        path,
+        anatomy,
+        sites,
+        rootless_path=None,
+        stat=None,
+        content_hash=None
+    ):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -907,18 +1177,30 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            rootless_path: already converted rootless path of file
+            stat: already collected stat of file
+            content_hash: hash of file content used for deduplication
 
         Returns:
             dict: file info dictionary
         """
 
-        return {
+        if rootless_path is None:
+            rootless_path = self.get_rootless_path(anatomy, path)
+
+        if stat is None:
+            stat = os.stat(path)
+
+        file_info = {
             "_id": ObjectId(),
-            "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "path": rootless_path,
+            "size": stat.st_size,
+            "hash": source_hash_from_stat(path, stat),
             "sites": sites
         }
+        if content_hash:
+            file_info["content_hash"] = content_hash
+        return file_info
 
     def _validate_path_in_project_roots(self, anatomy, file_path):
         """Checks if 'file_path' starts with any of the roots.
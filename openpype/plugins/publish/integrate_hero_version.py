@@ -1,8 +1,6 @@
 import os
 import copy
 import clique
-import errno
-import shutil
 
 import pyblish.api
 
@@ -18,7 +16,8 @@ from openpype.client.operations import (
     prepare_hero_version_update_data,
     prepare_representation_update_data,
 )
-from openpype.lib import create_hard_link
+from openpype.lib import get_files_stats
+from openpype.lib.file_transaction import FileTransaction
 from openpype.pipeline import (
     schema
 )
@@ -55,6 +54,8 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
     template_name_profiles = []
     _default_template_name = "hero"
+    # Maximum number of threads creating hero files
+    max_transfer_workers = 8
 
     def process(self, instance):
         self.log.debug(
@@ -242,53 +243,14 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             repre_name_low = repre["name"].lower()
             archived_repres_by_name[repre_name_low] = repre
 
-        backup_hero_publish_dir = None
-        if os.path.exists(hero_publish_dir):
-            backup_hero_publish_dir = hero_publish_dir + ".BACKUP"
-            max_idx = 10
-            idx = 0
-            _backup_hero_publish_dir = backup_hero_publish_dir
-            while os.path.exists(_backup_hero_publish_dir):
-                self.log.debug((
-                    "Backup folder already exists."
-                    " Trying to remove \"{}\""
-                ).format(_backup_hero_publish_dir))
-
-                try:
-                    shutil.rmtree(_backup_hero_publish_dir)
-                    backup_hero_publish_dir = _backup_hero_publish_dir
-                    break
-                except Exception:
-                    self.log.info((
-                        "Could not remove previous backup folder."
-                        " Trying to add index to folder name"
-                    ))
-
-                _backup_hero_publish_dir = (
-                    backup_hero_publish_dir + str(idx)
-                )
-                if not os.path.exists(_backup_hero_publish_dir):
-                    backup_hero_publish_dir = _backup_hero_publish_dir
-                    break
-
-                if idx > max_idx:
-                    raise AssertionError((
-                        "Backup folders are fully occupied to max index \"{}\""
-                    ).format(max_idx))
-                    break
-
-                idx += 1
-
-            self.log.debug("Backup folder path is \"{}\"".format(
-                backup_hero_publish_dir
-            ))
-            try:
-                os.rename(hero_publish_dir, backup_hero_publish_dir)
-            except PermissionError:
-                raise AssertionError((
-                    "Could not create hero version because it is not"
-                    " possible to replace current hero files."
-                ))
+        file_transaction = FileTransaction(
+            log=self.log,
+            max_workers=self.max_transfer_workers,
+            journal=True
+        )
+        # Content hashes of hero files by path
+        new_content_hashes = {}
+        old_content_hashes = self._get_content_hashes(anatomy, old_repres)
         try:
             src_to_dst_file_paths = []
             for repre_info in published_repres.values():
@@ -376,6 +338,10 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                                 src_file_name, dst_file
                             )
 
+                new_content_hashes.update(
+                    self._get_content_hashes(anatomy, [repre])
+                )
+
                 schema.validate(repre)
 
                 repre_name_low = repre["name"].lower()
@@ -416,14 +382,16 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
             self.path_checks = []
 
-            # Copy(hardlink) paths of source and destination files
-            # TODO should we *only* create hardlinks?
-            # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            # Hardlink (or copy) only files which changed, other files in
+            #   hero folder which are not part of new hero are removed
+            stale_file_paths = self._queue_changed_files(
+                file_transaction,
+                hero_publish_dir,
+                src_to_dst_file_paths + other_file_paths_mapping,
+                new_content_hashes,
+                old_content_hashes
+            )
+            file_transaction.process()
 
             # Archive not replaced old representations
             for repre_name_low, repre in old_repres_to_delete.items():
@@ -450,27 +418,14 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
             op_session.commit()
 
-            # Remove backuped previous hero
-            if (
-                backup_hero_publish_dir is not None and
-                os.path.exists(backup_hero_publish_dir)
-            ):
-                shutil.rmtree(backup_hero_publish_dir)
-
         except Exception:
-            if (
-                backup_hero_publish_dir is not None and
-                os.path.exists(backup_hero_publish_dir)
-            ):
-                if os.path.exists(hero_publish_dir):
-                    shutil.rmtree(hero_publish_dir)
-                os.rename(backup_hero_publish_dir, hero_publish_dir)
-            self.log.error((
-                "!!! Creating of hero version failed."
-                " Previous hero version maybe lost some data!"
-            ))
+            file_transaction.rollback()
+            self.log.error("!!! Creating of hero version failed.")
             raise
 
+        file_transaction.finalize()
+        self._remove_stale_files(hero_publish_dir, stale_file_paths)
+
         self.log.debug((
             "--- hero version integration for subset `{}`"
             " seems to be successful."
@@ -478,6 +433,115 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             instance.data.get("subset", str(instance))
         ))
 
+    def _get_content_hashes(self, anatomy, repres):
+        """Content hashes of representation files by normalized path."""
+        output = {}
+        for repre in repres:
+            for file_info in repre.get("files") or []:
+                content_hash = file_info.get("content_hash")
+                if content_hash:
+                    path = anatomy.fill_root(file_info["path"])
+                    output[os.path.normpath(path)] = content_hash
+        return output
+
+    def _queue_changed_files(
+        self,
+        file_transaction,
+        hero_publish_dir,
+        src_to_dst_file_paths,
+        new_content_hashes,
+        old_content_hashes
+    ):
+        """Add transfers of files which are different in hero folder.
+
+        Hero file is unchanged if it is hardlink of source file or if
+        content hash of source and existing hero file is the same.
+
+        Returns:
+            List[str]: Existing files in hero folder which are not part of
+                new hero version.
+        """
+
+        dst_paths = set()
+        mapping = []
+        for src_path, dst_path in src_to_dst_file_paths:
+            src_path = os.path.normpath(str(src_path))
+            dst_path = os.path.normpath(str(dst_path))
+            if dst_path not in dst_paths:
+                dst_paths.add(dst_path)
+                mapping.append((src_path, dst_path))
+
+        existing_paths = set(self.get_all_files_from_path(hero_publish_dir))
+        stat_paths = [src_path for src_path, _ in mapping]
+        stat_paths.extend(
+            dst_path
+            for _, dst_path in mapping
+            if dst_path in existing_paths
+        )
+        stats = get_files_stats(stat_paths, self.max_transfer_workers)
+        unchanged = 0
+        for src_path, dst_path in mapping:
+            src_stat = stats.get(src_path)
+            dst_stat = stats.get(dst_path)
+            if src_stat is not None and dst_stat is not None and (
+                self._is_same_file(src_stat, dst_stat)
+                or (
+                    src_stat.st_size == dst_stat.st_size
+                    and dst_path in new_content_hashes
+                    and new_content_hashes[dst_path] == (
+                        old_content_hashes.get(dst_path)
+                    )
+                )
+            ):
+                unchanged += 1
+                continue
+
+            file_transaction.add(
+                src_path, dst_path, FileTransaction.MODE_HARDLINK_OR_COPY
+            )
+
+        self.log.debug("Hero files unchanged: {}, changed: {}".format(
+            unchanged, len(mapping) - unchanged
+        ))
+        return [
+            path
+            for path in existing_paths
+            if path not in dst_paths
+        ]
+
+    def _is_same_file(self, src_stat, dst_stat):
+        # Inode is not available on Windows in Python 2
+        return (
+            src_stat.st_ino != 0
+            and src_stat.st_ino == dst_stat.st_ino
+            and src_stat.st_dev == dst_stat.st_dev
+        )
+
+    def _remove_stale_files(self, hero_publish_dir, stale_file_paths):
+        """Remove files of previous hero version and empty folders."""
+        dirpaths = set()
+        for path in stale_file_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                self.log.warning(
+                    "Failed to remove previous hero file \"{}\"".format(path),
+                    exc_info=True
+                )
+                continue
+            dirpaths.add(os.path.dirname(path))
+
+        # Remove empty folders from the deepest
+        for dirpath in sorted(dirpaths, key=len, reverse=True):
+            while (
+                dirpath != hero_publish_dir
+                and dirpath.startswith(hero_publish_dir)
+                and os.path.isdir(dirpath)
+                and not os.listdir(dirpath)
+            ):
+                os.rmdir(dirpath)
+                dirpath = os.path.dirname(dirpath)
+
     def get_all_files_from_path(self, path):
         files = []
         for (dir_path, dir_names, file_names) in os.walk(path):
@@ -531,13 +595,14 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
         # TODO raise error if Hero not set?
         family = self.main_family_from_instance(instance)
 
+        # Cached read-only project settings are used (instead of mutable
+        #   settings in context) so profiles are compiled only once
         return get_publish_template_name(
             project_name,
             host_name,
             family,
             task_info.get("name"),
             task_info.get("type"),
-            project_settings=instance.context.data["project_settings"],
             hero=True,
             logger=self.log
         )
@@ -549,40 +614,6 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             family = instance.data["families"][0]
         return family
 
-    def copy_file(self, src_path, dst_path):
-        # TODO check drives if are the same to check if cas hardlink
-        dirname = os.path.dirname(dst_path)
-
-        try:
-            os.makedirs(dirname)
-            self.log.debug("Folder(s) created: \"{}\"".format(dirname))
-        except OSError as exc:
-            if exc.errno != errno.EEXIST:
-                self.log.error("An unexpected error occurred.", exc_info=True)
-                raise
-
-            self.log.debug("Folder already exists: \"{}\"".format(dirname))
-
-        self.log.debug("Copying file \"{}\" to \"{}\"".format(
-            src_path, dst_path
-        ))
-
-        # First try hardlink and copy if paths are cross drive
-        try:
-            create_hard_link(src_path, dst_path)
-            # Return when successful
-            return
-
-        except OSError as exc:
-            # re-raise exception if different than
-            # EXDEV - cross drive path
-            # EINVAL - wrong format, must be NTFS
-            self.log.debug("Hardlink failed with errno:'{}'".format(exc.errno))
-            if exc.errno not in [errno.EXDEV, errno.EINVAL]:
-                raise
-
-        shutil.copy(src_path, dst_path)
-
     def version_from_representations(self, project_name, repres):
         for repre in repres:
             version = get_version_by_id(project_name, repre["parent"])
@@ -396,7 +396,6 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             family,
             task_name=task_info.get("name"),
             task_type=task_info.get("type"),
-            project_settings=instance.context.data["project_settings"],
             logger=self.log
         )
 
@@ -100,9 +100,10 @@ class PypeCommands:
 
         log = Logger.get_logger("CLI-publish")
 
-        install_openpype_plugins()
+        # Only modules with plugin paths are needed
+        manager = ModulesManager(lazy=True)
 
-        manager = ModulesManager()
+        install_openpype_plugins(modules_manager=manager)
 
         publish_paths = manager.collect_plugin_paths()["publish"]
 
@@ -117,7 +118,8 @@ class PypeCommands:
                 os.environ["AVALON_PROJECT"],
                 os.environ["AVALON_ASSET"],
                 os.environ["AVALON_TASK"],
-                os.environ["AVALON_APP_NAME"]
+                os.environ["AVALON_APP_NAME"],
+                modules_manager=manager
             )
             os.environ.update(env)
 
@@ -363,3 +365,9 @@ class PypeCommands:
         from openpype.lib.project_backpack import unpack_project
 
         unpack_project(zip_filepath, new_root)
+
+    def recover_file_transactions(self, rollback, force, journal_dir):
+        from openpype.lib.file_transaction import recover_file_transactions
+
+        recovered = recover_file_transactions(journal_dir, rollback, force)
+        print("Recovered {} file transactions".format(len(recovered)))
@@ -22,7 +22,9 @@ from .lib import (
     get_project_settings,
     get_current_project_settings,
     get_anatomy_settings,
-    get_local_settings
+    get_local_settings,
+    clear_settings_cache,
+    get_settings_cache_stats,
 )
 from .entities import (
     SystemSettings,
@@ -54,6 +56,8 @@ __all__ = (
     "get_current_project_settings",
     "get_anatomy_settings",
     "get_local_settings",
+    "clear_settings_cache",
+    "get_settings_cache_stats",
 
     "SystemSettings",
     "ProjectSettings",
@@ -0,0 +1,241 @@
+"""Cache of merged settings.
+
+Merging of default settings with studio, project and local overrides is
+expensive so merged result is cached. Cached values are stored under key
+created from settings type, project name, site id, openpype version and
+last saved stamp of overrides. When overrides are saved the stamp changes
+so cached value is not used anymore. Stamps are queried from database at
+most once per stamp lifetime.
+
+Cached values are read-only to be able to return them without copy. Use
+'copy' method to get mutable copy of values.
+"""
+
+import time
+import collections
+
+
+class ReadOnlyDict(dict):
+    """Dictionary which can't be modified.
+
+    Nested dictionaries and lists are read-only too. Method 'copy' returns
+    mutable deep copy of data.
+    """
+
+    def __init__(self, data=None):
+        super(ReadOnlyDict, self).__init__(
+            (key, freeze_settings(value))
+            for key, value in (data or {}).items()
+        )
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Settings values are read-only. Use 'copy' method.")
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def copy(self):
+        """Mutable deep copy of data."""
+        return {
+            key: unfreeze_settings(value)
+            for key, value in self.items()
+        }
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __reduce__(self):
+        return dict, (self.copy(), )
+
+
+class ReadOnlyList(list):
+    """List which can't be modified.
+
+    Nested dictionaries and lists are read-only too. Method 'copy' returns
+    mutable deep copy of data.
+    """
+
+    def __init__(self, data=None):
+        super(ReadOnlyList, self).__init__(
+            freeze_settings(item)
+            for item in (data or [])
+        )
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Settings values are read-only. Use 'copy' method.")
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+    clear = _read_only
+
+    def copy(self):
+        """Mutable deep copy of data."""
+        return [unfreeze_settings(item) for item in self]
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __reduce__(self):
+        return list, (self.copy(), )
+
+
+def freeze_settings(value):
+    """Convert dictionaries and lists in value to read-only variants."""
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList)):
+        return value
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return ReadOnlyList(value)
+    return value
+
+
+def unfreeze_settings(value):
+    """Mutable copy of dictionaries and lists in value."""
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {
+            key: unfreeze_settings(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [unfreeze_settings(item) for item in value]
+    return value
+
+
+class MergedSettingsCache:
+    """Cache of merged settings values.
+
+    Only last value of a settings type and project is kept. Value is used
+    only if stamp of overrides did not change since it was cached.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._stamps = {}
+        self._hits = collections.defaultdict(int)
+        self._misses = collections.defaultdict(int)
+
+    def get(self, settings_type, project_name, stamp, variant=None):
+        """Cached value if was cached with the same stamp.
+
+        Args:
+            settings_type (str): Type of settings.
+            project_name (Union[str, None]): Project name.
+            stamp (Hashable): Stamp of overrides with openpype version and
+                local site.
+            variant (Optional[Hashable]): Variant of value, e.g. if
+                metadata are cleared.
+
+        Returns:
+            Union[ReadOnlyDict, None]: Cached value or None.
+        """
+
+        cached = self._cache.get((settings_type, project_name, variant))
+        if cached is not None and cached[0] == stamp:
+            self._hits[settings_type] += 1
+            return cached[1]
+        self._misses[settings_type] += 1
+        return None
+
+    def set(self, settings_type, project_name, stamp, value, variant=None):
+        """Store value to cache.
+
+        Returns:
+            ReadOnlyDict: Read-only value which was stored.
+        """
+
+        value = freeze_settings(value)
+        self._cache[(settings_type, project_name, variant)] = (stamp, value)
+        return value
+
+    def clear(self, project_name=None):
+        """Remove cached values.
+
+        Args:
+            project_name (Optional[str]): Remove only values of the project.
+                All values are removed if not passed.
+        """
+
+        if project_name is None:
+            self._cache.clear()
+            self._stamps.clear()
+            return
+
+        for cache in (self._cache, self._stamps):
+            for cache_key in tuple(cache.keys()):
+                if cache_key[1] == project_name:
+                    cache.pop(cache_key)
+
+    def get_stamp(self, settings_type, project_name, lifetime, variant=None):
+        """Stamp stored with 'set_stamp' if is not older than lifetime.
+
+        Args:
+            settings_type (str): Type of settings.
+            project_name (Union[str, None]): Project name.
+            lifetime (float): Maximum age of stamp in seconds.
+            variant (Optional[Hashable]): Variant of stamp.
+
+        Returns:
+            Union[Hashable, None]: Stamp or None.
+        """
+
+        cached = self._stamps.get((settings_type, project_name, variant))
+        if cached is not None and time.time() - cached[0] <= lifetime:
+            return cached[1]
+        return None
+
+    def set_stamp(self, settings_type, project_name, stamp, variant=None):
+        """Store stamp queried from database."""
+        self._stamps[(settings_type, project_name, variant)] = (
+            time.time(), stamp
+        )
+
+    def clear_stamps(self):
+        """Remove stored stamps so they're queried again."""
+        self._stamps.clear()
+
+    def get_stats(self):
+        """Hits and misses of cache by settings type.
+
+        Returns:
+            Dict[str, Dict[str, Union[int, float]]]: Count of hits, misses
+                and hit rate by settings type.
+        """
+
+        output = {}
+        for settings_type in set(self._hits) | set(self._misses):
+            hits = self._hits[settings_type]
+            misses = self._misses[settings_type]
+            output[settings_type] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": float(hits) / (hits + misses),
+            }
+        return output
+
+    def reset_stats(self):
+        self._hits.clear()
+        self._misses.clear()
@@ -7,8 +7,11 @@ from abc import ABCMeta, abstractmethod
 import six
 
 import openpype.version
-from openpype.client.mongo import OpenPypeMongoConnection
-from openpype.client.entities import get_project_connection, get_project
+from openpype.client.mongo import (
+    OpenPypeMongoConnection,
+    get_project_connection,
+)
+from openpype.client.entities import get_project
 
 from .constants import (
     GLOBAL_SETTINGS_KEY,
@@ -444,6 +447,23 @@ class SettingsHandler:
 
         pass
 
+    @abstractmethod
+    def get_last_saved_stamp(self, settings_type, project_name=None):
+        """Stamp of last saved overrides used to validate cached settings.
+
+        Stamp must be cheap to get and must change when overrides used for
+        settings type (and project) are saved.
+
+        Args:
+            settings_type (str): System or project settings key.
+            project_name (Optional[str]): Project name for project settings.
+
+        Returns:
+            Hashable: Stamp of current state of overrides.
+        """
+
+        pass
+
     # UI related calls
     @abstractmethod
     def get_last_opened_info(self):
@@ -492,6 +512,18 @@ class SettingsHandler:
 
         pass
 
+    @abstractmethod
+    def clear_cache(self, project_name=None):
+        """Mark cached settings as outdated.
+
+        Args:
+            project_name (Optional[str]): Clear only cache of project settings
+                and anatomy of the project. All caches are cleared if not
+                passed.
+        """
+
+        pass
+
 
 @six.add_metaclass(ABCMeta)
 class LocalSettingsHandler:
@@ -514,6 +546,18 @@ class LocalSettingsHandler:
         """Studio overrides of system settings."""
         pass
 
+    @abstractmethod
+    def get_last_saved_stamp(self):
+        """Stamp of last saved local settings.
+
+        Stamp must be cheap to get and must change when local settings are
+        saved or when local site is different.
+
+        Returns:
+            Hashable: Stamp of current state of local settings.
+        """
+        pass
+
 
 class CacheValues:
     cache_lifetime = 10
@@ -561,7 +605,7 @@ class CacheValues:
         return delta > self.cache_lifetime
 
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
 
 
 class MongoSettingsHandler(SettingsHandler):
@@ -1390,6 +1434,43 @@ class MongoSettingsHandler(SettingsHandler):
 
         return self.project_settings_cache[project_name].last_saved_info.copy()
 
+    def get_last_saved_stamp(self, settings_type, project_name=None):
+        """Stamp of overrides documents for current version.
+
+        Only documents of current version are checked. Overrides loaded from
+        closest older version are validated when document for current
+        version is created.
+        """
+
+        if settings_type == SYSTEM_SETTINGS_KEY:
+            query_filter = {"type": self._system_settings_key}
+
+        elif settings_type == PROJECT_SETTINGS_KEY:
+            query_filter = {"type": self._project_settings_key}
+            if project_name is None:
+                query_filter["is_default"] = True
+            else:
+                query_filter["$or"] = [
+                    {"is_default": True},
+                    {"project_name": project_name}
+                ]
+
+        else:
+            raise ValueError(
+                "Unknown settings type \"{}\"".format(settings_type)
+            )
+
+        query_filter["version"] = self._current_version
+        return tuple(sorted(
+            (
+                str(doc["_id"]),
+                (doc.get("last_saved_info") or {}).get("timestamp")
+            )
+            for doc in self.collection.find(
+                query_filter, {"last_saved_info.timestamp": True}
+            )
+        ))
+
     def get_studio_project_settings_overrides(self, return_version):
         """Studio overrides of default project settings."""
         return self._get_project_settings_overrides(None, return_version)
@@ -1527,6 +1608,23 @@ class MongoSettingsHandler(SettingsHandler):
             return doc
         return doc["data"]
 
+    def clear_cache(self, project_name=None):
+        if project_name is not None:
+            caches = []
+            for cache_by_project in (
+                self.project_settings_cache,
+                self.project_anatomy_cache,
+            ):
+                if project_name in cache_by_project:
+                    caches.append(cache_by_project[project_name])
+        else:
+            caches = [self.system_settings_cache]
+            caches.extend(self.project_settings_cache.values())
+            caches.extend(self.project_anatomy_cache.values())
+
+        for cache in caches:
+            cache.set_outdated()
+
     # Implementations of abstract methods to clear overrides for version
     def clear_studio_system_settings_overrides_for_version(self, version):
         self.collection.delete_one({
@@ -1793,6 +1891,9 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
 
         self.local_settings_cache.update_data(data, None)
 
+        timestamp = datetime.datetime.now().strftime(
+            SettingsStateInfo.timestamp_format
+        )
         self.collection.replace_one(
             {
                 "type": LOCAL_SETTING_KEY,
@@ -1801,7 +1902,8 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             {
                 "type": LOCAL_SETTING_KEY,
                 "site_id": self.local_site_id,
-                "data": self.local_settings_cache.data
+                "data": self.local_settings_cache.data,
+                "last_saved_info": {"timestamp": timestamp}
             },
             upsert=True
         )
@@ -1817,3 +1919,20 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             self.local_settings_cache.update_from_document(document, None)
 
         return self.local_settings_cache.data_copy()
+
+    def get_last_saved_stamp(self):
+        """Stamp of local settings document for local site id."""
+        document = self.collection.find_one(
+            {
+                "type": LOCAL_SETTING_KEY,
+                "site_id": self.local_site_id
+            },
+            {"last_saved_info.timestamp": True}
+        )
+        if not document:
+            return self.local_site_id, None, None
+        return (
+            self.local_site_id,
+            str(document["_id"]),
+            (document.get("last_saved_info") or {}).get("timestamp")
+        )
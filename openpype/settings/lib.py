@@ -1,9 +1,14 @@
 import os
+import sys
 import json
+import marshal
 import functools
 import logging
 import platform
 import copy
+
+import openpype.version
+
 from .exceptions import (
     SaveWarningExc
 )
@@ -17,6 +22,11 @@ from .constants import (
     PROJECT_ANATOMY_KEY,
     DEFAULT_PROJECT_KEY
 )
+from .cache import (
+    MergedSettingsCache,
+    freeze_settings,
+    unfreeze_settings,
+)
 
 log = logging.getLogger(__name__)
 
@@ -30,15 +40,21 @@ DEFAULTS_DIR = os.path.join(
     "defaults"
 )
 
-# Variable where cache of default settings are stored
+# Variable where cache of marshaled default settings is stored
 _DEFAULT_SETTINGS = None
 
+# Read-only default settings shared by merged settings (by cleared metadata)
+_DEFAULT_SETTINGS_TREES = {}
+
 # Handler of studio overrides
 _SETTINGS_HANDLER = None
 
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Cache of merged system and project settings
+_MERGED_SETTINGS_CACHE = MergedSettingsCache()
+
 
 def require_handler(func):
     @functools.wraps(func)
@@ -116,6 +132,106 @@ def closed_settings_ui(info_obj):
     return _SETTINGS_HANDLER.closed_settings_ui(info_obj)
 
 
+def clear_settings_cache(project_name=None):
+    """Mark cached settings overrides as outdated.
+
+    Next request of settings will load overrides from database.
+
+    Args:
+        project_name (Optional[str]): Clear only cache of the project. All
+            caches are cleared if not passed.
+    """
+
+    _MERGED_SETTINGS_CACHE.clear(project_name)
+    if _SETTINGS_HANDLER is not None:
+        _SETTINGS_HANDLER.clear_cache(project_name)
+
+
+def get_settings_cache_stats():
+    """Hits and misses of merged settings cache.
+
+    Returns:
+        Dict[str, Dict[str, Union[int, float]]]: Count of hits, misses and
+            hit rate by settings type.
+    """
+
+    return _MERGED_SETTINGS_CACHE.get_stats()
+
+
+@require_local_handler
+def _get_local_settings_stamp():
+    return _LOCAL_SETTINGS_HANDLER.get_last_saved_stamp()
+
+
+@require_handler
+def _query_settings_stamp(settings_type, project_name, exclude_locals):
+    local_stamp = None
+    if not exclude_locals:
+        local_stamp = _get_local_settings_stamp()
+
+    return (
+        openpype.version.__version__,
+        _SETTINGS_HANDLER.get_last_saved_stamp(settings_type, project_name),
+        local_stamp
+    )
+
+
+def _get_settings_stamp(settings_type, project_name, exclude_locals):
+    """Stamp of current state of overrides used for merged settings.
+
+    Stamp is queried from database at most once per lifetime of settings
+    handler caches.
+    """
+
+    from .handlers import CacheValues
+
+    stamp = _MERGED_SETTINGS_CACHE.get_stamp(
+        settings_type, project_name, CacheValues.cache_lifetime,
+        exclude_locals
+    )
+    if stamp is None:
+        stamp = _query_settings_stamp(
+            settings_type, project_name, exclude_locals
+        )
+        _MERGED_SETTINGS_CACHE.set_stamp(
+            settings_type, project_name, stamp, exclude_locals
+        )
+    return stamp
+
+
+def _get_cached_settings(
+    settings_type,
+    project_name,
+    clear_metadata,
+    exclude_locals,
+    read_only,
+    func
+):
+    """Get merged settings from cache or create them with passed function.
+
+    Returns:
+        dict: Read-only settings or mutable copy.
+    """
+
+    stamp = _get_settings_stamp(settings_type, project_name, exclude_locals)
+    variant = (clear_metadata, exclude_locals)
+    result = _MERGED_SETTINGS_CACHE.get(
+        settings_type, project_name, stamp, variant
+    )
+    if result is None:
+        result = _MERGED_SETTINGS_CACHE.set(
+            settings_type,
+            project_name,
+            stamp,
+            func(clear_metadata, exclude_locals),
+            variant
+        )
+
+    if read_only:
+        return result
+    return result.copy()
+
+
 @require_handler
 def save_studio_settings(data):
     """Save studio overrides of system settings.
@@ -160,6 +276,7 @@ def save_studio_settings(data):
                 warnings.extend(exc.warnings)
 
     _SETTINGS_HANDLER.save_studio_settings(data)
+    _MERGED_SETTINGS_CACHE.clear_stamps()
     if warnings:
         raise SaveWarningExc(warnings)
 
@@ -220,6 +337,7 @@ def save_project_settings(project_name, overrides):
                 warnings.extend(exc.warnings)
 
     _SETTINGS_HANDLER.save_project_settings(project_name, overrides)
+    _MERGED_SETTINGS_CACHE.clear_stamps()
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -281,6 +399,7 @@ def save_project_anatomy(project_name, anatomy_data):
                 warnings.extend(exc.warnings)
 
     _SETTINGS_HANDLER.save_project_anatomy(project_name, anatomy_data)
+    _MERGED_SETTINGS_CACHE.clear_stamps()
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -488,7 +607,9 @@ def clear_project_settings_overrides_for_version(
 
 @require_local_handler
 def save_local_settings(data):
-    return _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    result = _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    _MERGED_SETTINGS_CACHE.clear_stamps()
+    return result
 
 
 @require_local_handler
@@ -505,19 +626,164 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    _DEFAULT_SETTINGS_TREES.clear()
+    _MERGED_SETTINGS_CACHE.clear()
+
+
+def get_default_settings_bundle_path():
+    """Path to bundle of compiled default settings.
+
+    Bundle is specific for python version as it is stored using 'marshal'.
+    """
+
+    import appdirs
+
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "settings",
+        "defaults_bundle_py{}{}.bin".format(*sys.version_info[:2])
+    )
+
+
+def _get_defaults_sources_stamp(source_paths):
+    """Stamp of files in default settings sources.
+
+    Files are not read, only modification time and size of json files are
+    used so the check is cheap on each start.
+
+    Args:
+        source_paths (Iterable[str]): Paths to directories or json files.
+
+    Returns:
+        List[List[Any]]: Relative path, modification time and size of all
+            json files per source path.
+    """
+
+    stamp = []
+    for source_path in source_paths:
+        if os.path.isfile(source_path):
+            filepaths = [source_path]
+        else:
+            filepaths = []
+            for base, directories, filenames in os.walk(source_path):
+                directories.sort()
+                for filename in sorted(filenames):
+                    if filename.endswith(".json"):
+                        filepaths.append(os.path.join(base, filename))
+
+        files_stamp = []
+        for filepath in filepaths:
+            stat = os.stat(filepath)
+            files_stamp.append(
+                [filepath[len(source_path):], stat.st_mtime, stat.st_size]
+            )
+        stamp.append([source_path, files_stamp])
+    return stamp
+
+
+def _load_defaults_source(source_path):
+    if os.path.isdir(source_path):
+        return load_jsons_from_dir(source_path)
+    if os.path.exists(source_path):
+        return load_json_file(source_path)
+    return {}
+
+
+def load_default_settings_sources(source_paths, bundle_path=None):
+    """Load default settings from sources using precompiled bundle.
+
+    Data of all sources are stored to single bundle file with stamp
+    (modification time and size of json files) of the sources. Bundle is
+    used if the stamp did not change, otherwise sources are loaded and
+    bundle is rebuilt.
+
+    Args:
+        source_paths (Iterable[str]): Paths to directories with json
+            files or to json files.
+        bundle_path (Optional[str]): Path to bundle file. Path from
+            'get_default_settings_bundle_path' is used if not passed.
+
+    Returns:
+        Dict[str, Any]: Loaded data by source path.
+    """
+
+    source_paths = [os.path.normpath(path) for path in source_paths]
+    if bundle_path is None:
+        bundle_path = get_default_settings_bundle_path()
+
+    sources_stamp = _get_defaults_sources_stamp(source_paths)
+    try:
+        with open(bundle_path, "rb") as stream:
+            bundle_stamp, data = marshal.loads(stream.read())
+        if bundle_stamp == sources_stamp:
+            return data
+
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        pass
+
+    data = {
+        source_path: _load_defaults_source(source_path)
+        for source_path in source_paths
+    }
+    try:
+        bundle_dir = os.path.dirname(bundle_path)
+        if not os.path.exists(bundle_dir):
+            os.makedirs(bundle_dir)
+        tmp_path = "{}.{}.tmp".format(bundle_path, os.getpid())
+        with open(tmp_path, "wb") as stream:
+            stream.write(marshal.dumps((sources_stamp, data)))
+        if os.path.exists(bundle_path):
+            os.remove(bundle_path)
+        os.rename(tmp_path, bundle_path)
+
+    except (IOError, OSError):
+        log.debug(
+            "Failed to store default settings bundle \"{}\"".format(
+                bundle_path
+            ),
+            exc_info=True
+        )
+    return data
 
 
 def _get_default_settings():
-    from openpype.modules import get_module_settings_defs
+    from openpype.modules import (
+        get_module_settings_defs,
+        JsonFilesSettingsDef,
+    )
 
-    defaults = load_openpype_default_settings()
+    module_settings_defs = [
+        module_settings_def_cls()
+        for module_settings_def_cls in get_module_settings_defs()
+    ]
+
+    # Defaults of core and addons using json files are loaded from bundle
+    source_paths = [DEFAULTS_DIR]
+    for module_settings_def in module_settings_defs:
+        if isinstance(module_settings_def, JsonFilesSettingsDef):
+            source_paths.append(module_settings_def.system_defaults_filepath)
+            source_paths.append(
+                module_settings_def.project_defaults_filepath
+            )
+    sources_data = load_default_settings_sources(source_paths)
+
+    defaults = sources_data[os.path.normpath(DEFAULTS_DIR)]
+    for module_settings_def in module_settings_defs:
+        if isinstance(module_settings_def, JsonFilesSettingsDef):
+            system_defaults = sources_data[os.path.normpath(
+                module_settings_def.system_defaults_filepath
+            )]
+            project_defaults = sources_data[os.path.normpath(
+                module_settings_def.project_defaults_filepath
+            )]
+        else:
+            system_defaults = module_settings_def.get_defaults(
+                SYSTEM_SETTINGS_KEY
+            ) or {}
+            project_defaults = module_settings_def.get_defaults(
+                PROJECT_SETTINGS_KEY
+            ) or {}
 
-    module_settings_defs = get_module_settings_defs()
-    for module_settings_def_cls in module_settings_defs:
-        module_settings_def = module_settings_def_cls()
-        system_defaults = module_settings_def.get_defaults(
-            SYSTEM_SETTINGS_KEY
-        ) or {}
         for path, value in system_defaults.items():
             if not path:
                 continue
@@ -529,9 +795,6 @@ def _get_default_settings():
                 subdict = subdict[key]
             subdict[last_key] = value
 
-        project_defaults = module_settings_def.get_defaults(
-            PROJECT_SETTINGS_KEY
-        ) or {}
         for path, value in project_defaults.items():
             if not path:
                 continue
@@ -549,16 +812,40 @@ def _get_default_settings():
 def get_default_settings():
     """Get default settings.
 
-    Todo:
-        Cache loaded defaults.
+    Loaded defaults are cached in marshaled form which is faster to copy
+    than using 'copy.deepcopy'.
 
     Returns:
         dict: Loaded default settings.
     """
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
-        _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+        _DEFAULT_SETTINGS = marshal.dumps(_get_default_settings())
+    return marshal.loads(_DEFAULT_SETTINGS)
+
+
+def _get_default_settings_tree(clear_metadata):
+    """Read-only default settings shared by merged settings.
+
+    Defaults are loaded, frozen and cleared from metadata only once. Merged
+    settings are built over the tree so only values on path to overrides
+    are created.
+
+    Args:
+        clear_metadata (bool): Tree without overrides metadata.
+
+    Returns:
+        ReadOnlyDict: Default settings.
+    """
+
+    tree = _DEFAULT_SETTINGS_TREES.get(clear_metadata)
+    if tree is None:
+        defaults = get_default_settings()
+        if clear_metadata:
+            clear_metadata_from_settings(defaults)
+        tree = freeze_settings(defaults)
+        _DEFAULT_SETTINGS_TREES[clear_metadata] = tree
+    return tree
 
 
 def load_json_file(fpath):
@@ -678,11 +965,92 @@ def merge_overrides(source_dict, override_dict):
     return source_dict
 
 
+def _without_metadata(value):
+    """Copy of overridden value without metadata keys."""
+    if isinstance(value, dict):
+        return {
+            key: _without_metadata(item)
+            for key, item in value.items()
+            if key not in METADATA_KEYS
+        }
+    if isinstance(value, list):
+        return [_without_metadata(item) for item in value]
+    return value
+
+
+def _merge_overrides_shared(source_dict, override_dict, clear_metadata=False):
+    """Merge overrides to new dictionary sharing untouched source values.
+
+    Only dictionaries on path to overridden values are created, values which
+    are not overridden are shared with source. Source and overrides are not
+    modified.
+
+    Metadata of overrides are skipped if 'clear_metadata' is set, source
+    must be already without metadata in that case.
+    """
+
+    overridden_keys = override_dict.get(M_OVERRIDDEN_KEY) or ()
+    output = dict(source_dict)
+    for key, value in override_dict.items():
+        if key == M_OVERRIDDEN_KEY:
+            continue
+
+        if clear_metadata and key in METADATA_KEYS:
+            continue
+
+        if (
+            key not in overridden_keys
+            and isinstance(value, dict)
+            and isinstance(output.get(key), dict)
+        ):
+            value = _merge_overrides_shared(
+                output[key], value, clear_metadata
+            )
+        elif clear_metadata:
+            value = _without_metadata(value)
+        output[key] = value
+    return output
+
+
+def _copy_on_write(data, keys):
+    """Replace dictionaries on path of keys with shallow copies.
+
+    Merged settings share untouched values with cached defaults so nested
+    values must not be modified in place.
+
+    Args:
+        data (dict): Mutable dictionary where path starts.
+        keys (Iterable[str]): Keys of path.
+
+    Returns:
+        dict: Mutable dictionary under last key.
+    """
+
+    for key in keys:
+        value = dict(data[key])
+        data[key] = value
+        data = value
+    return data
+
+
 def apply_overrides(source_data, override_data):
+    """Apply overrides on source data.
+
+    Result shares values which are not overridden with source data and
+    overridden values with override data. Modification of result may
+    affect source data.
+
+    Args:
+        source_data (dict): Data on which overrides are applied.
+        override_data (dict): Overrides with metadata.
+
+    Returns:
+        dict: Data with applied overrides.
+    """
+
     if not override_data:
         return source_data
-    _source_data = copy.deepcopy(source_data)
-    return merge_overrides(_source_data, override_data)
+    return _merge_overrides_shared(source_data, override_data)
 
 
 def apply_local_settings_on_system_settings(system_settings, local_settings):
@@ -708,12 +1076,15 @@ def apply_local_settings_on_system_settings(system_settings, local_settings):
             continue
 
         if app_group_name in apps_settings:
-            variants = apps_settings[app_group_name]["variants"]
+            group_keys = ["applications", app_group_name]
 
         else:
-            variants = (
-                apps_settings["additional_apps"][app_group_name]["variants"]
-            )
+            group_keys = ["applications", "additional_apps", app_group_name]
+
+        group_settings = system_settings
+        for key in group_keys:
+            group_settings = group_settings[key]
+        variants = group_settings["variants"]
 
         for app_name, app_value in value.items():
             if (
@@ -734,7 +1105,10 @@ def apply_local_settings_on_system_settings(system_settings, local_settings):
             # - local settings store only executable
             new_executables = [executable]
             new_executables.extend(platform_executables)
-            variants[app_name]["executables"] = new_executables
+            variant_settings = _copy_on_write(
+                system_settings, group_keys + ["variants", app_name]
+            )
+            variant_settings["executables"] = new_executables
 
 
 def apply_local_settings_on_anatomy_settings(
@@ -807,9 +1181,8 @@ def apply_local_settings_on_anatomy_settings(
     for root_name, path in roots_locals.items():
         if root_name not in root_data:
             continue
-        anatomy_settings["roots"][root_name][current_platform] = (
-            path
-        )
+        root_settings = _copy_on_write(anatomy_settings, ["roots", root_name])
+        root_settings[current_platform] = path
 
 
 def get_site_local_overrides(project_name, site_name, local_settings=None):
@@ -880,7 +1253,12 @@ def apply_local_settings_on_project_settings(
         or default_locals.get("remote_site")
     )
 
-    sync_server_config = project_settings["global"]["sync_server"]["config"]
+    if not active_site and not remote_site:
+        return
+
+    sync_server_config = _copy_on_write(
+        project_settings, ["global", "sync_server", "config"]
+    )
     if active_site:
         sync_server_config["active_site"] = active_site
 
@@ -888,21 +1266,47 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
-def get_system_settings(clear_metadata=True, exclude_locals=None):
-    """System settings with applied studio overrides."""
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+def get_system_settings(
+    clear_metadata=True, exclude_locals=None, read_only=False
+):
+    """System settings with applied studio overrides.
 
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
+    Merged settings are cached until overrides are saved.
+
+    Args:
+        clear_metadata (bool): Remove overrides metadata.
+        exclude_locals (Optional[bool]): Don't apply local settings. Default
+            is based on 'clear_metadata'.
+        read_only (bool): Return cached read-only settings without copy.
+            Use 'copy' method on result to get mutable settings.
+
+    Returns:
+        dict: System settings.
+    """
 
-    # Apply local settings
-    # Default behavior is based on `clear_metadata` value
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    return _get_cached_settings(
+        SYSTEM_SETTINGS_KEY,
+        None,
+        clear_metadata,
+        exclude_locals,
+        read_only,
+        _get_system_settings
+    )
+
+
+def _get_system_settings(clear_metadata, exclude_locals):
+    default_values = _get_default_settings_tree(clear_metadata)[
+        SYSTEM_SETTINGS_KEY
+    ]
+    studio_values = get_studio_system_settings_overrides()
+    result = _merge_overrides_shared(
+        default_values, studio_values or {}, clear_metadata
+    )
+
+    # Apply local settings
     if not exclude_locals:
         # TODO local settings may be required to apply for environments
         local_settings = get_local_settings()
@@ -911,19 +1315,16 @@ def get_system_settings(clear_metadata=True, exclude_locals=None):
     return result
 
 
-def get_default_project_settings(clear_metadata=True, exclude_locals=None):
-    """Project settings with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
+def _get_default_project_settings(clear_metadata, exclude_locals):
+    default_values = _get_default_settings_tree(clear_metadata)[
+        PROJECT_SETTINGS_KEY
+    ]
     studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
+    result = _merge_overrides_shared(
+        default_values, studio_values or {}, clear_metadata
+    )
 
     # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
         local_settings = get_local_settings()
         apply_local_settings_on_project_settings(
@@ -932,20 +1333,26 @@ def get_default_project_settings(clear_metadata=True, exclude_locals=None):
     return result
 
 
-def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
-    """Project anatomy data with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
-    studio_values = get_studio_project_anatomy_overrides()
-
-    result = apply_overrides(default_values, studio_values)
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
-    # Apply local settings
+def get_default_project_settings(clear_metadata=True, exclude_locals=None):
+    """Project settings with applied studio's default project overrides."""
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    return unfreeze_settings(
+        _get_default_project_settings(clear_metadata, exclude_locals)
+    )
+
+
+def _get_default_anatomy_settings(clear_metadata, exclude_locals):
+    default_values = _get_default_settings_tree(clear_metadata)[
+        PROJECT_ANATOMY_KEY
+    ]
+    studio_values = get_studio_project_anatomy_overrides()
+    result = _merge_overrides_shared(
+        default_values, studio_values or {}, clear_metadata
+    )
+
+    # Apply local settings
     if not exclude_locals:
         local_settings = get_local_settings()
         apply_local_settings_on_anatomy_settings(
@@ -954,6 +1361,16 @@ def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
     return result
 
 
+def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
+    """Project anatomy data with applied studio's default project overrides."""
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    return unfreeze_settings(
+        _get_default_anatomy_settings(clear_metadata, exclude_locals)
+    )
+
+
 def get_anatomy_settings(
     project_name, site_name=None, clear_metadata=True, exclude_locals=None
 ):
@@ -964,19 +1381,20 @@ def get_anatomy_settings(
             "`get_default_anatomy_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_anatomy_settings(False)
+    studio_overrides = _get_default_anatomy_settings(clear_metadata, True)
     project_overrides = get_project_anatomy_overrides(
         project_name
     )
-    result = copy.deepcopy(studio_overrides)
+    # Project overrides replace whole first level values
+    result = dict(studio_overrides)
     if project_overrides:
         for key, value in project_overrides.items():
+            if clear_metadata:
+                if key in METADATA_KEYS:
+                    continue
+                value = _without_metadata(value)
             result[key] = value
 
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
     # Apply local settings
     if exclude_locals is None:
         exclude_locals = not clear_metadata
@@ -987,34 +1405,58 @@ def get_anatomy_settings(
             result, local_settings, project_name, site_name
         )
 
-    return result
+    return unfreeze_settings(result)
 
 
 def get_project_settings(
-    project_name, clear_metadata=True, exclude_locals=None
+    project_name, clear_metadata=True, exclude_locals=None, read_only=False
 ):
-    """Project settings with applied studio and project overrides."""
+    """Project settings with applied studio and project overrides.
+
+    Merged settings are cached until overrides are saved.
+
+    Args:
+        project_name (str): Project name.
+        clear_metadata (bool): Remove overrides metadata.
+        exclude_locals (Optional[bool]): Don't apply local settings. Default
+            is based on 'clear_metadata'.
+        read_only (bool): Return cached read-only settings without copy.
+            Use 'copy' method on result to get mutable settings.
+
+    Returns:
+        dict: Project settings.
+    """
+
     if not project_name:
         raise ValueError(
             "Must enter project name."
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    return _get_cached_settings(
+        PROJECT_SETTINGS_KEY,
+        project_name,
+        clear_metadata,
+        exclude_locals,
+        read_only,
+        functools.partial(_get_project_settings, project_name)
+    )
+
+
+def _get_project_settings(project_name, clear_metadata, exclude_locals):
+    studio_overrides = _get_default_project_settings(clear_metadata, True)
     project_overrides = get_project_settings_overrides(
         project_name
     )
 
-    result = apply_overrides(studio_overrides, project_overrides)
-
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
+    result = _merge_overrides_shared(
+        studio_overrides, project_overrides or {}, clear_metadata
+    )
 
     # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
         local_settings = get_local_settings()
         apply_local_settings_on_project_settings(
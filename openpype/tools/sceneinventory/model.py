@@ -8,12 +8,9 @@ import qtawesome
 
 from openpype.host import ILoadHost
 from openpype.client import (
-    get_asset_by_id,
-    get_subset_by_id,
-    get_version_by_id,
-    get_last_version_by_subset_id,
+    get_last_versions,
     get_approved_version_value,
-    get_representation_by_id,
+    get_representations_contexts,
 )
 from openpype.pipeline import (
     legacy_io,
@@ -318,47 +315,55 @@ class InventoryModel(TreeModel):
         for item in items:
             grouped[item["representation"]]["items"].append(item)
 
+        # Query representations with all parents at once
+        repre_contexts = get_representations_contexts(
+            project_name,
+            [repre_id for repre_id in grouped.keys() if repre_id],
+            archived=True
+        )
+        repre_contexts_by_str_id = {
+            str(repre_id): repre_context
+            for repre_id, repre_context in repre_contexts.items()
+        }
+
         # Add to model
         not_found = defaultdict(list)
         not_found_ids = []
+        subset_ids = set()
         for repre_id, group_dict in sorted(grouped.items()):
             group_items = group_dict["items"]
             # Get parenthood per group
-            representation = get_representation_by_id(
-                project_name, repre_id
-            )
-            if not representation:
+            repre_context = repre_contexts_by_str_id.get(str(repre_id))
+            if not repre_context:
                 not_found["representation"].append(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            version = get_version_by_id(
-                project_name, representation["parent"]
-            )
+            representation = repre_context["representation"]
+            version = repre_context["version"]
             if not version:
                 not_found["version"].append(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
             elif version["type"] == "hero_version":
-                _version = get_version_by_id(
-                    project_name, version["version_id"]
-                )
+                _version = repre_context["hero_source_version"]
                 version["name"] = HeroVersionType(_version["name"])
                 version["data"] = _version["data"]
 
-            subset = get_subset_by_id(project_name, version["parent"])
+            subset = repre_context["subset"]
             if not subset:
                 not_found["subset"].append(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            asset = get_asset_by_id(project_name, subset["parent"])
+            asset = repre_context["asset"]
             if not asset:
                 not_found["asset"].append(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
+            subset_ids.add(subset["_id"])
             grouped[repre_id].update({
                 "representation": representation,
                 "version": version,
@@ -366,6 +371,12 @@ class InventoryModel(TreeModel):
                 "asset": asset
             })
 
+        # Store the highest available version so the model can know
+        # whether current version is currently up-to-date.
+        last_versions_by_subset_id = get_last_versions(
+            project_name, subset_ids, fields=["_id", "name"]
+        )
+
         for id in not_found_ids:
             grouped.pop(id)
 
@@ -412,11 +423,7 @@ class InventoryModel(TreeModel):
             family = family_config.get("label", prim_family)
             family_icon = family_config.get("icon", None)
 
-            # Store the highest available version so the model can know
-            # whether current version is currently up-to-date.
-            highest_version = get_last_version_by_subset_id(
-                project_name, version["parent"]
-            )
+            highest_version = last_versions_by_subset_id[version["parent"]]
 
             if not subset:
                 approved_version = get_approved_version_value(
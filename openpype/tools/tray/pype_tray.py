@@ -25,6 +25,10 @@ from openpype.lib.openpype_version import (
     get_openpype_version,
 )
 from openpype.modules import TrayModulesManager
+from openpype.pipeline.entity_changes import (
+    start_entity_changes_listener,
+    stop_entity_changes_listener,
+)
 from openpype.settings import (
     get_system_settings,
     SystemSettings,
@@ -428,6 +432,9 @@ class TrayManager:
         # Tell each module which modules were imported
         self.modules_manager.start_modules()
 
+        # Invalidate caches of tray process on changes in database
+        start_entity_changes_listener()
+
         # Print time report
         self.modules_manager.print_report()
 
@@ -604,6 +611,7 @@ class TrayManager:
         self.tray_widget.exit()
 
     def on_exit(self):
+        stop_entity_changes_listener()
         self.modules_manager.on_exit()
 
     def _on_version_action(self):
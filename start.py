@@ -242,6 +242,11 @@ if "--debug" in sys.argv:
     sys.argv.remove("--debug")
     os.environ["OPENPYPE_DEBUG"] = "1"
 
+# Print time report of modules import and initialization
+if "--profile-startup" in sys.argv:
+    sys.argv.remove("--profile-startup")
+    os.environ["OPENPYPE_PROFILE_STARTUP"] = "1"
+
 
 import igniter  # noqa: E402
 from igniter import BootstrapRepos  # noqa: E402
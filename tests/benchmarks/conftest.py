@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Fixtures of benchmarks.
+
+Benchmarks require 'pytest-benchmark' and 'mongomock' which is used as local
+stand-in of mongo server so benchmarks can run without database.
+"""
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+mongomock = pytest.importorskip("mongomock")
+
+# Environments required on import of openpype modules
+#   - mongo is never connected
+for _key, _value in (
+    ("OPENPYPE_MONGO", "mongodb://localhost:27017"),
+    ("AVALON_DB", "avalon"),
+    ("OPENPYPE_DATABASE_NAME", "openpype"),
+    ("OPENPYPE_LOCAL_ID", "benchmark"),
+    ("OPENPYPE_REPOS_ROOT", os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )),
+):
+    os.environ.setdefault(_key, _value)
+
+from openpype.client import mongo  # noqa: E402
+from openpype.client.operations import OperationsSession  # noqa: E402
+
+from .lib import get_project_size, create_synthetic_project  # noqa: E402
+
+BENCHMARK_PROJECT_NAME = "benchmark_project"
+
+
+@pytest.fixture(scope="session")
+def mongo_stand_in():
+    """Replace mongo client with in-memory 'mongomock' client."""
+
+    client = mongomock.MongoClient()
+    orig_get_mongo_client = mongo.OpenPypeMongoConnection.__dict__[
+        "get_mongo_client"
+    ]
+    mongo.OpenPypeMongoConnection.get_mongo_client = classmethod(
+        lambda cls, mongo_url=None: client
+    )
+    yield client
+
+    mongo.OpenPypeMongoConnection.get_mongo_client = orig_get_mongo_client
+
+
+@pytest.fixture(scope="session")
+def project_root(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("project_root"))
+
+
+@pytest.fixture(scope="session")
+def synthetic_project(mongo_stand_in, project_root):
+    """Project filled with synthetic entities.
+
+    Size of project can be changed with 'OPENPYPE_BENCHMARK_SIZE' environment
+    variable ('small', 'medium' or 'large').
+
+    Returns:
+        Tuple[str, Dict[str, List[ObjectId]]]: Project name and ids of
+            created entities by entity type.
+    """
+
+    project_name = BENCHMARK_PROJECT_NAME
+    ids_by_type = create_synthetic_project(project_name, get_project_size())
+
+    # Use temp directory as root of project
+    project_doc = mongo_stand_in["avalon"][project_name].find_one(
+        {"type": "project"}
+    )
+    session = OperationsSession()
+    session.update_entity(
+        project_name,
+        "project",
+        project_doc["_id"],
+        {
+            "config.roots": {
+                root_name: {
+                    "windows": project_root,
+                    "linux": project_root,
+                    "darwin": project_root,
+                }
+                for root_name in project_doc["config"]["roots"].keys()
+            }
+        }
+    )
+    session.commit()
+    return project_name, ids_by_type
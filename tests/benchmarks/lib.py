@@ -0,0 +1,139 @@
+"""Helpers to seed synthetic projects for benchmarks."""
+import os
+import collections
+
+from openpype.client.operations import (
+    OperationsSession,
+    new_asset_document,
+    new_subset_document,
+    new_version_doc,
+    new_representation_doc,
+    create_project,
+)
+
+# Sizes of synthetic project by preset name
+#   - (assets, subsets per asset, versions per subset,
+#       representations per version, files per representation)
+PROJECT_SIZES = {
+    "small": (10, 5, 5, 2, 5),
+    "medium": (50, 10, 10, 3, 10),
+    "large": (200, 20, 20, 3, 50),
+}
+
+ProjectSize = collections.namedtuple(
+    "ProjectSize",
+    (
+        "assets",
+        "subsets_per_asset",
+        "versions_per_subset",
+        "representations_per_version",
+        "files_per_representation",
+    )
+)
+
+
+def get_project_size():
+    """Size of synthetic project defined by 'OPENPYPE_BENCHMARK_SIZE'.
+
+    Returns:
+        ProjectSize: Counts of entities in synthetic project.
+    """
+
+    size_name = os.environ.get("OPENPYPE_BENCHMARK_SIZE") or "small"
+    return ProjectSize(*PROJECT_SIZES[size_name])
+
+
+def _new_files(root_name, repre_path, count):
+    return [
+        {
+            "path": "{{root[{}]}}/{}.{:04d}.exr".format(
+                root_name, repre_path, frame
+            ),
+            "size": 1024,
+            "hash": "{}_{}".format(repre_path, frame),
+            "sites": [{"name": "studio", "created_dt": None}],
+        }
+        for frame in range(1001, 1001 + count)
+    ]
+
+
+def create_synthetic_project(project_name, size):
+    """Create project with assets, subsets, versions and representations.
+
+    Args:
+        project_name (str): Name of new project.
+        size (ProjectSize): Counts of entities.
+
+    Returns:
+        Dict[str, List[ObjectId]]: Ids of created entities by entity type.
+    """
+
+    project_doc = create_project(project_name, project_name)
+
+    ids_by_type = collections.defaultdict(list)
+    session = OperationsSession()
+    for asset_idx in range(size.assets):
+        asset_name = "sh{:04d}".format(asset_idx * 10)
+        asset_doc = new_asset_document(
+            asset_name,
+            project_doc["_id"],
+            None,
+            [],
+            {"tasks": {"comp": {"type": "Comp"}}}
+        )
+        session.create_entity(project_name, "asset", asset_doc)
+        ids_by_type["asset"].append(asset_doc["_id"])
+
+        for subset_idx in range(size.subsets_per_asset):
+            subset_doc = new_subset_document(
+                "renderComp{}".format(subset_idx),
+                "render",
+                asset_doc["_id"],
+                {"families": ["render"]}
+            )
+            session.create_entity(project_name, "subset", subset_doc)
+            ids_by_type["subset"].append(subset_doc["_id"])
+
+            for version in range(1, size.versions_per_subset + 1):
+                version_doc = new_version_doc(
+                    version, subset_doc["_id"], {"families": ["render"]}
+                )
+                session.create_entity(project_name, "version", version_doc)
+                ids_by_type["version"].append(version_doc["_id"])
+
+                for repre_idx in range(size.representations_per_version):
+                    repre_name = "exr{}".format(repre_idx)
+                    repre_path = "{}/{}/{}/v{:03d}/{}".format(
+                        project_name,
+                        asset_name,
+                        subset_doc["name"],
+                        version,
+                        repre_name
+                    )
+                    repre_doc = new_representation_doc(
+                        repre_name,
+                        version_doc["_id"],
+                        {
+                            "root": {"work": "{root[work]}"},
+                            "project": {
+                                "name": project_name,
+                                "code": project_name
+                            },
+                            "asset": asset_name,
+                            "subset": subset_doc["name"],
+                            "family": "render",
+                            "version": version,
+                            "representation": repre_name,
+                            "ext": "exr",
+                        }
+                    )
+                    repre_doc["files"] = _new_files(
+                        "work", repre_path, size.files_per_representation
+                    )
+                    session.create_entity(
+                        project_name, "representation", repre_doc
+                    )
+                    ids_by_type["representation"].append(repre_doc["_id"])
+
+    session.commit()
+    return ids_by_type
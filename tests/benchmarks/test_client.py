@@ -0,0 +1,40 @@
+from openpype.client import get_last_versions
+from openpype.client.entities import _get_last_versions_by_aggregation
+from openpype.pipeline.load.utils import filter_containers
+
+
+def test_get_last_versions(benchmark, synthetic_project):
+    project_name, ids_by_type = synthetic_project
+    subset_ids = ids_by_type["subset"]
+
+    result = benchmark(
+        get_last_versions, project_name, subset_ids, fields=["_id", "name"]
+    )
+    assert len(result) == len(subset_ids)
+
+
+def test_get_last_versions_by_aggregation(benchmark, synthetic_project):
+    project_name, ids_by_type = synthetic_project
+    subset_ids = ids_by_type["subset"]
+
+    result = benchmark(
+        _get_last_versions_by_aggregation,
+        project_name,
+        subset_ids,
+        ["_id", "name"]
+    )
+    assert len(result) == len(subset_ids)
+
+
+def test_filter_containers(benchmark, synthetic_project):
+    project_name, ids_by_type = synthetic_project
+    containers = [
+        {
+            "objectName": "container_{}".format(idx),
+            "representation": str(repre_id),
+        }
+        for idx, repre_id in enumerate(ids_by_type["representation"][:500])
+    ]
+
+    result = benchmark(filter_containers, containers, project_name)
+    assert len(result.latest) + len(result.outdated) == len(containers)
@@ -0,0 +1,162 @@
+import os
+import datetime
+import itertools
+
+import pyblish.api
+
+from openpype.client import get_project, get_asset_by_id
+from openpype.lib.file_transaction import FileTransaction
+from openpype.pipeline.anatomy import Anatomy
+from openpype.pipeline.template_data import get_template_data
+from openpype.plugins.publish.integrate import IntegrateAsset
+from openpype.plugins.publish.integrate_hero_version import (
+    IntegrateHeroVersion,
+)
+from openpype.settings import get_project_settings
+
+FRAMES_COUNT = 20
+HOST_NAME = "traypublisher"
+
+
+class SyncServerStandIn(object):
+    """Sync server module returning only studio site."""
+
+    def compute_resource_sync_sites(self, project_name):
+        return [{"name": "studio", "created_dt": datetime.datetime.now()}]
+
+
+def _create_staging_files(staging_dir):
+    os.makedirs(staging_dir)
+    filenames = []
+    for frame in range(1001, 1001 + FRAMES_COUNT):
+        filename = "render.{:04d}.exr".format(frame)
+        with open(os.path.join(staging_dir, filename), "wb") as stream:
+            stream.write(b"\0" * 1024)
+        filenames.append(filename)
+    return filenames
+
+
+def _get_register_setup(synthetic_project, tmp_path, subset_name):
+    project_name, ids_by_type = synthetic_project
+    project_doc = get_project(project_name)
+    asset_doc = get_asset_by_id(project_name, ids_by_type["asset"][0])
+
+    staging_dir = str(tmp_path / "staging")
+    filenames = _create_staging_files(staging_dir)
+
+    context = pyblish.api.Context()
+    context.data.update({
+        "projectName": project_name,
+        "projectEntity": project_doc,
+        "anatomy": Anatomy(project_name, "studio"),
+        "hostName": HOST_NAME,
+        "project_settings": get_project_settings(project_name),
+        "openPypeModules": {"sync_server": SyncServerStandIn()},
+        "time": datetime.datetime.now().strftime("%Y%m%dT%H%M%SZ"),
+        "user": "benchmark",
+    })
+
+    versions = itertools.count(1)
+
+    def setup():
+        anatomy_data = get_template_data(
+            project_doc, asset_doc, "comp", HOST_NAME
+        )
+        version = next(versions)
+        anatomy_data.update({
+            "family": "render",
+            "subset": subset_name,
+            "version": version,
+        })
+        instance = context.create_instance(subset_name)
+        instance.data.update({
+            "family": "render",
+            "families": [],
+            "subset": subset_name,
+            "version": version,
+            "anatomyData": anatomy_data,
+            "assetEntity": asset_doc,
+            "projectEntity": project_doc,
+            "stagingDir": staging_dir,
+            "source": staging_dir,
+            "comment": "",
+        })
+        representations = [{
+            "name": "exr",
+            "ext": "exr",
+            "files": list(filenames),
+            "stagingDir": staging_dir,
+        }]
+        return (instance, FileTransaction(), representations), {}
+
+    return setup
+
+
+def test_integrate_asset_register(benchmark, synthetic_project, tmp_path):
+    plugin = IntegrateAsset()
+    setup = _get_register_setup(
+        synthetic_project, tmp_path, "renderBenchmark"
+    )
+
+    benchmark.pedantic(plugin.register, setup=setup, rounds=10)
+
+
+def test_integrate_asset_register_dedup(
+    benchmark, synthetic_project, tmp_path
+):
+    plugin = IntegrateAsset()
+    plugin.content_dedup = {
+        "enabled": True,
+        "min_size": 0,
+        "hash_algorithm": "blake2b",
+    }
+    setup = _get_register_setup(
+        synthetic_project, tmp_path, "renderBenchmarkDedup"
+    )
+
+    # First publish stores content hashes of files
+    args, _ = setup()
+    plugin.register(*args)
+
+    instances = []
+
+    def register(instance, file_transactions, representations):
+        instances.append(instance)
+        plugin.register(instance, file_transactions, representations)
+
+    benchmark.pedantic(register, setup=setup, rounds=10)
+    for instance in instances:
+        assert instance.data["deduplicatedBytes"] == FRAMES_COUNT * 1024
+
+
+def test_integrate_hero_version(benchmark, synthetic_project, tmp_path):
+    plugin = IntegrateAsset()
+    plugin.content_dedup = {
+        "enabled": True,
+        "min_size": 0,
+        "hash_algorithm": "blake2b",
+    }
+    hero_plugin = IntegrateHeroVersion()
+    setup = _get_register_setup(
+        synthetic_project, tmp_path, "renderBenchmarkHero"
+    )
+
+    def register_setup():
+        args, kwargs = setup()
+        instance = args[0]
+        plugin.register(*args)
+        template_key = hero_plugin._get_template_key(
+            instance.context.data["projectName"], instance
+        )
+        anatomy = instance.context.data["anatomy"]
+        hero_template = anatomy.templates[template_key]["path"]
+        return (
+            instance,
+            instance.context.data["projectName"],
+            template_key,
+            hero_template
+        ), {}
+
+    benchmark.pedantic(
+        hero_plugin.integrate_instance, setup=register_setup, rounds=5
+    )
@@ -0,0 +1,33 @@
+import os
+
+import pyblish.api
+
+from openpype import PACKAGE_DIR
+from openpype.pipeline.publish import publish_plugins_discover
+from openpype.pipeline.publish import discover_cache
+
+PUBLISH_PLUGINS_DIR = os.path.join(PACKAGE_DIR, "plugins", "publish")
+
+
+def _plugin_names(result):
+    return sorted(
+        "{}.{}".format(plugin.__module__, plugin.__name__)
+        for plugin in result.plugins
+    )
+
+
+def test_publish_plugins_discover(benchmark, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        discover_cache._GlobalCache, "_cache",
+        discover_cache.PublishPluginsCache(str(tmp_path))
+    )
+    pyblish.api.register_host("traypublisher")
+    try:
+        paths = [PUBLISH_PLUGINS_DIR]
+        expected = publish_plugins_discover(paths, use_cache=False)
+
+        result = benchmark(publish_plugins_discover, paths)
+    finally:
+        pyblish.api.deregister_host("traypublisher")
+
+    assert _plugin_names(result) == _plugin_names(expected)
@@ -0,0 +1,94 @@
+from openpype.settings import get_project_settings
+from openpype.settings.lib import (
+    clear_settings_cache,
+    reset_default_settings,
+    get_default_settings,
+)
+from openpype.pipeline.anatomy import Anatomy
+
+
+def test_get_project_settings(benchmark, synthetic_project):
+    project_name, _ = synthetic_project
+
+    result = benchmark(get_project_settings, project_name)
+    assert "global" in result
+
+
+def test_get_project_settings_read_only(benchmark, synthetic_project):
+    project_name, _ = synthetic_project
+
+    result = benchmark(get_project_settings, project_name, read_only=True)
+    assert "global" in result
+
+
+def test_get_project_settings_uncached(benchmark, synthetic_project):
+    project_name, _ = synthetic_project
+
+    def get_settings():
+        clear_settings_cache()
+        return get_project_settings(project_name)
+
+    result = benchmark(get_settings)
+    assert "global" in result
+
+
+def test_get_default_settings_uncached(benchmark, mongo_stand_in):
+    def get_defaults():
+        reset_default_settings()
+        return get_default_settings()
+
+    result = benchmark(get_defaults)
+    assert "system_settings" in result
+
+
+def test_anatomy_construction(benchmark, synthetic_project):
+    project_name, _ = synthetic_project
+
+    anatomy = benchmark(Anatomy, project_name, "studio")
+    assert anatomy.project_name == project_name
+
+
+def test_anatomy_get_shared(benchmark, synthetic_project):
+    project_name, _ = synthetic_project
+
+    anatomy = benchmark(Anatomy.get_shared, project_name, "studio")
+    assert anatomy is Anatomy.get_shared(project_name, "studio")
+
+
+def test_anatomy_find_root_templates_from_paths(
+    benchmark, synthetic_project, project_root
+):
+    project_name, _ = synthetic_project
+    anatomy = Anatomy(project_name, "studio")
+    paths = [
+        "{}/{}/publish/render.{:04d}.exr".format(
+            project_root, project_name, frame
+        )
+        for frame in range(1001, 2001)
+    ]
+
+    result = benchmark(anatomy.find_root_templates_from_paths, paths)
+    assert all(success for success, _ in result)
+
+
+def test_anatomy_format(benchmark, synthetic_project):
+    project_name, _ = synthetic_project
+    anatomy = Anatomy(project_name, "studio")
+    data = {
+        "project": {"name": project_name, "code": project_name},
+        "hierarchy": "",
+        "asset": "sh0010",
+        "task": {"name": "comp", "type": "Comp", "short": "comp"},
+        "family": "render",
+        "subset": "renderCompMain",
+        "version": 1,
+        "representation": "exr",
+        "ext": "exr",
+        "frame": "1001",
+        "username": "benchmark",
+        "app": "nuke",
+        "user": "benchmark",
+    }
+
+    result = benchmark(anatomy.format, data)
+    assert result["publish"]["path"]
@@ -0,0 +1,54 @@
+from openpype.lib.path_templates import StringTemplate
+
+PUBLISH_TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{asset}/publish/{family}"
+    "/{subset}/v{version:0>3}/{project[code]}_{asset}_{subset}"
+    "_v{version:0>3}<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+)
+TEMPLATE_DATA = {
+    "root": {"work": "/mnt/projects"},
+    "project": {"name": "benchmark_project", "code": "bench"},
+    "hierarchy": "shots/sq01",
+    "asset": "sh0010",
+    "family": "render",
+    "subset": "renderCompMain",
+    "version": 12,
+    "output": "review",
+    "ext": "exr",
+}
+
+
+def test_string_template_parse(benchmark):
+    benchmark(StringTemplate, PUBLISH_TEMPLATE)
+
+
+def test_string_template_format(benchmark):
+    template = StringTemplate(PUBLISH_TEMPLATE)
+    data = dict(TEMPLATE_DATA, frame=1001)
+
+    result = benchmark(template.format, data)
+    assert result.solved
+
+
+def test_string_template_format_sequence(benchmark):
+    template = StringTemplate(PUBLISH_TEMPLATE)
+
+    def format_sequence():
+        data = dict(TEMPLATE_DATA)
+        output = []
+        for frame in range(1001, 1101):
+            data["frame"] = frame
+            output.append(template.format(data))
+        return output
+
+    result = benchmark(format_sequence)
+    assert len(result) == 100
+
+
+def test_string_template_format_many(benchmark):
+    template = StringTemplate(PUBLISH_TEMPLATE)
+
+    result = benchmark(
+        template.format_many, TEMPLATE_DATA, "frame", range(1001, 1101)
+    )
+    assert len(result) == 100
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Test suite for commit of operations session."""
+import pytest
+from pymongo.errors import AutoReconnect
+
+mongomock = pytest.importorskip("mongomock")
+
+from openpype.client import entities, operations  # noqa: E402
+from openpype.client.entity_cache import entity_cache  # noqa: E402
+from openpype.client.operations import OperationsSession  # noqa: E402
+
+PROJECT_NAME = "test_operations"
+
+
+class _FailingCollection(object):
+    """Collection which applies part of first bulk write and disconnects."""
+
+    def __init__(self, collection, applied_count):
+        self._collection = collection
+        self._applied_count = applied_count
+        self.bulk_writes = []
+
+    def __getattr__(self, attr_name):
+        return getattr(self._collection, attr_name)
+
+    def bulk_write(self, requests, ordered=True):
+        self.bulk_writes.append(list(requests))
+        if self._applied_count is not None:
+            requests = requests[:self._applied_count]
+            self._applied_count = None
+            self._collection.bulk_write(requests, ordered=ordered)
+            raise AutoReconnect("connection closed")
+        return self._collection.bulk_write(requests, ordered=ordered)
+
+
+def test_retry_does_not_send_applied_creates(monkeypatch):
+    collection = _FailingCollection(
+        mongomock.MongoClient()["avalon"][PROJECT_NAME], 3
+    )
+    monkeypatch.setattr(
+        operations, "get_project_connection", lambda name: collection
+    )
+    monkeypatch.setattr(operations, "OPERATIONS_RETRY_DELAY", 0)
+
+    session = OperationsSession()
+    asset_ids = [
+        session.create_entity(
+            PROJECT_NAME, "asset", {"type": "asset", "name": str(idx)}
+        ).entity_id
+        for idx in range(5)
+    ]
+    session.update_entity(
+        PROJECT_NAME, "asset", asset_ids[0], {"data.label": "First"}
+    )
+    session.delete_entity(PROJECT_NAME, "asset", asset_ids[4])
+
+    result = session.commit()
+
+    assert len(collection.bulk_writes) == 2
+    # 3 applied creates are not sent again
+    assert len(collection.bulk_writes[1]) == 4
+    assert result[0]["attempts"] == 2
+    assert result[0]["inserted"] == 5
+    assert result[0]["deleted"] == 1
+
+    docs = list(collection.find({}).sort("name", 1))
+    assert [doc["_id"] for doc in docs] == asset_ids[:4]
+    assert docs[0]["data"]["label"] == "First"
+
+
+def test_retry_attempts_exceeded(monkeypatch):
+    class _DisconnectedCollection(object):
+        def bulk_write(self, requests, ordered=True):
+            raise AutoReconnect("connection closed")
+
+        def find(self, *args, **kwargs):
+            raise AutoReconnect("connection closed")
+
+    monkeypatch.setattr(
+        operations,
+        "get_project_connection",
+        lambda name: _DisconnectedCollection()
+    )
+    monkeypatch.setattr(operations, "OPERATIONS_RETRY_DELAY", 0)
+
+    session = OperationsSession()
+    session.create_entity(PROJECT_NAME, "asset", {"type": "asset"})
+    with pytest.raises(AutoReconnect):
+        session.commit(retry_attempts=2)
+
+
+def test_update_last_version_pointers_invalidates_cache(monkeypatch):
+    collection = mongomock.MongoClient()["avalon"][PROJECT_NAME]
+    for module in (operations, entities):
+        monkeypatch.setattr(
+            module, "get_project_connection", lambda name: collection
+        )
+    subset_id = collection.insert_one(
+        {"type": "subset", "name": "modelMain"}
+    ).inserted_id
+
+    with entity_cache():
+        subset_doc = entities.get_subset_by_id(PROJECT_NAME, subset_id)
+        assert subset_doc.get(entities.LAST_VERSION_KEY) is None
+
+        version_id = collection.insert_one(
+            {"type": "version", "name": 1, "parent": subset_id}
+        ).inserted_id
+        assert operations.update_last_version_pointers(PROJECT_NAME) == 1
+
+        subset_doc = entities.get_subset_by_id(PROJECT_NAME, subset_id)
+        assert subset_doc[entities.LAST_VERSION_KEY] == {
+            "_id": version_id, "name": 1
+        }
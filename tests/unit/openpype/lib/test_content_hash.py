@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Test suite for content hashes of files."""
+import os
+import hashlib
+
+from openpype.lib import content_hash
+from openpype.lib.content_hash import get_content_hash, get_content_hashes
+
+
+def _write(path, data):
+    with open(path, "wb") as stream:
+        stream.write(data)
+    return path
+
+
+def test_content_hash_small_file(tmp_path):
+    data = os.urandom(1000)
+    path = _write(str(tmp_path / "small.bin"), data)
+    expected = "blake2b:" + hashlib.blake2b(data).hexdigest()
+    assert get_content_hash(path) == expected
+    assert get_content_hash(path, "sha256") == (
+        "sha256:" + hashlib.sha256(data).hexdigest()
+    )
+
+
+def test_content_hash_segments(tmp_path, monkeypatch):
+    monkeypatch.setattr(content_hash, "CONTENT_HASH_SEGMENT_SIZE", 1000)
+    monkeypatch.setattr(content_hash, "CONTENT_HASH_CHUNK_SIZE", 300)
+    data = os.urandom(4500)
+    path = _write(str(tmp_path / "big.bin"), data)
+
+    hasher = hashlib.blake2b()
+    for offset in range(0, len(data), 1000):
+        hasher.update(hashlib.blake2b(data[offset:offset + 1000]).digest())
+    expected = "blake2b:" + hasher.hexdigest()
+
+    assert get_content_hash(path, max_workers=1) == expected
+    assert get_content_hash(path, max_workers=4) == expected
+
+
+def test_content_hashes_identical_content(tmp_path):
+    data = os.urandom(2048)
+    paths = [
+        _write(str(tmp_path / "file_{}.bin".format(idx)), data)
+        for idx in range(4)
+    ]
+    other_path = _write(str(tmp_path / "other.bin"), os.urandom(2048))
+
+    hashes = get_content_hashes(paths + [other_path])
+    assert len({hashes[path] for path in paths}) == 1
+    assert hashes[other_path] != hashes[paths[0]]
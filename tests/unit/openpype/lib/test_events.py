@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Test suite for event system callbacks dispatch."""
+import gc
+import random
+
+from openpype.lib.events import EventSystem, EventCallback
+
+
+class CallsRecorder(object):
+    """Records which callbacks were called in which order."""
+
+    def __init__(self):
+        self.calls = []
+
+    def create_callback(self, name):
+        def callback(event):
+            self.calls.append((name, event.topic))
+        # Keep reference to function so weak reference stays valid
+        setattr(self, "callback_{}".format(name), callback)
+        return callback
+
+
+def _noop():
+    pass
+
+
+def test_dispatch_matches_topic_regex():
+    rand = random.Random(0)
+    topic_parts = ["workfile", "save", "open", "publish", "a", "ab", ""]
+    registered_topics = [
+        "*", "workfile.*", "workfile.save", "*.save", "publish.*.end",
+        "a*", "ab", "a.*", "workfile.save.*", "save",
+    ]
+    recorder = CallsRecorder()
+    event_system = EventSystem()
+    callbacks = []
+    for idx in range(40):
+        topic = rand.choice(registered_topics)
+        event_system.add_callback(topic, recorder.create_callback(idx))
+        callbacks.append((idx, EventCallback(topic, _noop)))
+
+    for _ in range(200):
+        topic = ".".join(
+            rand.choice(topic_parts) for _ in range(rand.randint(1, 3))
+        )
+        recorder.calls = []
+        event_system.emit(topic, {}, None)
+        expected = [
+            (idx, topic)
+            for idx, callback in callbacks
+            if callback.topic_matches(topic)
+        ]
+        assert recorder.calls == expected, "Not matching"
+
+
+def test_cache_invalidated_on_registration():
+    recorder = CallsRecorder()
+    event_system = EventSystem()
+    event_system.add_callback("workfile.save", recorder.create_callback(0))
+    event_system.emit("workfile.save", {}, None)
+
+    callback = event_system.add_callback(
+        "workfile.*", recorder.create_callback(1)
+    )
+    event_system.emit("workfile.save", {}, None)
+    assert recorder.calls == [
+        (0, "workfile.save"), (0, "workfile.save"), (1, "workfile.save")
+    ]
+
+    callback.deregister()
+    recorder.calls = []
+    event_system.emit("workfile.save", {}, None)
+    event_system.emit("workfile.save", {}, None)
+    assert recorder.calls == [(0, "workfile.save"), (0, "workfile.save")]
+
+
+def test_async_dispatch():
+    recorder = CallsRecorder()
+    event_system = EventSystem(async_dispatch=True)
+    event_system.add_callback("*", recorder.create_callback(0))
+    topics = ["topic.{}".format(idx % 3) for idx in range(30)]
+    for topic in topics:
+        event_system.emit(topic, {}, None)
+
+    event_system.wait_for_events()
+    assert recorder.calls == [(0, topic) for topic in topics]
+
+    metrics = event_system.get_metrics()
+    assert sorted(metrics.keys()) == ["topic.0", "topic.1", "topic.2"]
+    assert metrics["topic.0"]["count"] == 10
+
+    event_system.stop()
+    event_system.reset_metrics()
+    assert event_system.get_metrics() == {}
+
+
+def _is_registered(event_system, callback):
+    return (
+        callback in event_system._registered_callbacks
+        or callback in event_system._callbacks_order
+        or any(
+            callback in callbacks
+            for callbacks in event_system._callbacks_by_topic.values()
+        )
+        or any(
+            callback in callbacks
+            for callbacks in (
+                event_system._wildcard_callbacks_by_prefix.values()
+            )
+        )
+    )
+
+
+def test_invalid_callbacks_removed():
+    recorder = CallsRecorder()
+    event_system = EventSystem()
+    event_system.add_callback("workfile.save", recorder.create_callback(0))
+    deregistered = [
+        event_system.add_callback("publish.end", recorder.create_callback(1)),
+        event_system.add_callback("publish.*", recorder.create_callback(2)),
+    ]
+
+    # Deregistered callbacks are removed without any emit
+    for callback in deregistered:
+        callback.deregister()
+        assert not _is_registered(event_system, callback)
+    assert "publish.end" not in event_system._callbacks_by_topic
+    assert "publish." not in event_system._wildcard_callbacks_by_prefix
+
+    # Garbage collected callbacks are removed on emit of any topic
+    collected = event_system.add_callback(
+        "publish.*", recorder.create_callback(3)
+    )
+    del recorder.callback_3
+    gc.collect()
+    assert not collected.is_ref_valid
+
+    event_system.emit("workfile.save", {}, None)
+    assert not _is_registered(event_system, collected)
+    assert recorder.calls == [(0, "workfile.save")]
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""Test suite for parallel file transfers of FileTransaction."""
+import os
+import sys
+import subprocess
+
+import pytest
+
+from openpype.lib import (
+    get_files_stats,
+    source_hash,
+    source_hash_from_stat,
+)
+from openpype.lib.file_transaction import (
+    FileTransaction,
+    TransactionJournal,
+    fast_copyfile,
+    recover_file_transactions,
+)
+
+
+def _create_files(dirpath, count, size=1024):
+    os.makedirs(dirpath)
+    paths = []
+    for idx in range(count):
+        path = os.path.join(dirpath, "file.{:04d}.bin".format(idx))
+        with open(path, "wb") as stream:
+            stream.write(os.urandom(size + idx))
+        paths.append(path)
+    return paths
+
+
+def _read(path):
+    with open(path, "rb") as stream:
+        return stream.read()
+
+
+def test_fast_copyfile(tmp_path):
+    for size in (0, 1, 1024 * 1024 + 7):
+        src = str(tmp_path / "src_{}".format(size))
+        dst = str(tmp_path / "dst_{}".format(size))
+        with open(src, "wb") as stream:
+            stream.write(os.urandom(size))
+        copied = []
+        fast_copyfile(src, dst, copied.append)
+        assert _read(src) == _read(dst)
+        assert sum(copied) == size
+
+
+def test_parallel_transfer_progress(tmp_path):
+    sources = _create_files(str(tmp_path / "src"), 20)
+    progress_items = []
+    file_transaction = FileTransaction(
+        max_workers=4,
+        workers_by_root={str(tmp_path / "dst" / "slow"): 1},
+        progress_callback=progress_items.append
+    )
+    destinations = []
+    for idx, src in enumerate(sources):
+        subdir = "slow" if idx % 2 else "fast"
+        dst = str(
+            tmp_path / "dst" / subdir / os.path.basename(src)
+        )
+        file_transaction.add(src, dst)
+        destinations.append(dst)
+
+    file_transaction.process()
+    file_transaction.finalize()
+
+    assert sorted(file_transaction.transferred) == sorted(destinations)
+    for src, dst in zip(sources, destinations):
+        assert _read(src) == _read(dst)
+
+    total_bytes = sum(os.path.getsize(src) for src in sources)
+    last_progress = progress_items[-1]
+    assert last_progress.done_files == last_progress.total_files == 20
+    assert last_progress.done_bytes == last_progress.total_bytes
+    assert last_progress.total_bytes == total_bytes
+    finished = [item.dst for item in progress_items if item.file_finished]
+    assert sorted(finished) == sorted(destinations)
+
+
+def test_parallel_transfer_rollback(tmp_path):
+    sources = _create_files(str(tmp_path / "src"), 10)
+    dst_dir = tmp_path / "dst"
+    os.makedirs(str(dst_dir))
+    existing = str(dst_dir / os.path.basename(sources[0]))
+    with open(existing, "wb") as stream:
+        stream.write(b"original")
+
+    file_transaction = FileTransaction(max_workers=4)
+    for src in sources:
+        file_transaction.add(src, str(dst_dir / os.path.basename(src)))
+    # Directory as source makes the transfer fail
+    invalid_src = str(tmp_path / "src" / "invalid.bin")
+    os.makedirs(invalid_src)
+    file_transaction.add(invalid_src, str(dst_dir / "invalid.bin"))
+
+    with pytest.raises((IOError, OSError)):
+        file_transaction.process()
+    file_transaction.rollback()
+
+    assert os.listdir(str(dst_dir)) == [os.path.basename(existing)]
+    assert _read(existing) == b"original"
+
+
+def _create_journaled_transaction(tmp_path, count=5):
+    sources = _create_files(str(tmp_path / "src"), count)
+    dst_dir = tmp_path / "dst"
+    os.makedirs(str(dst_dir))
+    existing = str(dst_dir / os.path.basename(sources[0]))
+    with open(existing, "wb") as stream:
+        stream.write(b"original")
+
+    file_transaction = FileTransaction(
+        journal=True, journal_dir=str(tmp_path / "journal")
+    )
+    destinations = []
+    for src in sources:
+        dst = str(dst_dir / os.path.basename(src))
+        file_transaction.add(src, dst)
+        destinations.append(dst)
+    return file_transaction, sources, destinations
+
+
+def test_journaled_transaction(tmp_path):
+    file_transaction, sources, destinations = (
+        _create_journaled_transaction(tmp_path)
+    )
+    file_transaction.process()
+    assert len(os.listdir(str(tmp_path / "journal"))) == 1
+    assert len(file_transaction.backups) == 1
+
+    file_transaction.finalize()
+    assert os.listdir(str(tmp_path / "journal")) == []
+    assert sorted(os.listdir(str(tmp_path / "dst"))) == sorted(
+        os.path.basename(dst) for dst in destinations
+    )
+    for src, dst in zip(sources, destinations):
+        assert _read(src) == _read(dst)
+
+
+def test_journaled_transaction_rollback(tmp_path):
+    file_transaction, sources, destinations = (
+        _create_journaled_transaction(tmp_path)
+    )
+    file_transaction.process()
+    file_transaction.rollback()
+
+    assert os.listdir(str(tmp_path / "journal")) == []
+    assert os.listdir(str(tmp_path / "dst")) == [
+        os.path.basename(destinations[0])
+    ]
+    assert _read(destinations[0]) == b"original"
+
+
+def _get_finished_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def _interrupt_commit(journal, renamed_count):
+    """Simulate crash of process during commit."""
+    journal.state = TransactionJournal.STATE_COMMITTING
+    journal.pid = _get_finished_pid()
+    journal.save()
+    for entry in journal.entries[:renamed_count]:
+        if entry["backup"]:
+            os.rename(entry["dst"], entry["backup"])
+        os.rename(entry["tmp"], entry["dst"])
+
+
+def test_recover_interrupted_transfer(tmp_path):
+    file_transaction, sources, destinations = (
+        _create_journaled_transaction(tmp_path)
+    )
+    journal = TransactionJournal.create(
+        [(src, dst) for src, dst in zip(sources, destinations)],
+        str(tmp_path / "journal")
+    )
+    journal.pid = _get_finished_pid()
+    journal.save()
+    for entry in journal.entries[:2]:
+        fast_copyfile(entry["src"], entry["tmp"])
+
+    recovered = recover_file_transactions(str(tmp_path / "journal"))
+    assert recovered == [journal.path]
+    assert os.listdir(str(tmp_path / "dst")) == [
+        os.path.basename(destinations[0])
+    ]
+    assert _read(destinations[0]) == b"original"
+
+
+def test_recover_interrupted_commit(tmp_path):
+    for rollback in (False, True):
+        root = tmp_path / str(rollback)
+        file_transaction, sources, destinations = (
+            _create_journaled_transaction(root)
+        )
+        journal = TransactionJournal.create(
+            [(src, dst) for src, dst in zip(sources, destinations)],
+            str(root / "journal")
+        )
+        for entry in journal.entries:
+            fast_copyfile(entry["src"], entry["tmp"])
+        _interrupt_commit(journal, 3)
+
+        recover_file_transactions(str(root / "journal"), rollback=rollback)
+        assert os.listdir(str(root / "journal")) == []
+        if rollback:
+            assert os.listdir(str(root / "dst")) == [
+                os.path.basename(destinations[0])
+            ]
+            assert _read(destinations[0]) == b"original"
+            continue
+
+        assert sorted(os.listdir(str(root / "dst"))) == sorted(
+            os.path.basename(dst) for dst in destinations
+        )
+        for src, dst in zip(sources, destinations):
+            assert _read(src) == _read(dst)
+
+
+def test_recover_skips_running_process(tmp_path):
+    file_transaction, sources, destinations = (
+        _create_journaled_transaction(tmp_path)
+    )
+    journal = TransactionJournal.create(
+        [(src, dst) for src, dst in zip(sources, destinations)],
+        str(tmp_path / "journal")
+    )
+    journal.save()
+    assert recover_file_transactions(str(tmp_path / "journal")) == []
+    assert os.path.exists(journal.path)
+
+
+def test_transferred_stats(tmp_path):
+    for journal in (False, True):
+        root = tmp_path / str(journal)
+        sources = _create_files(str(root / "src"), 100)
+        file_transaction = FileTransaction(
+            journal=journal, journal_dir=str(root / "journal")
+        )
+        destinations = []
+        for src in sources:
+            dst = str(root / "dst" / os.path.basename(src))
+            file_transaction.add(src, dst)
+            destinations.append(dst)
+        file_transaction.process()
+        file_transaction.finalize()
+
+        transferred_stats = file_transaction.transferred_stats
+        collected_stats = get_files_stats(
+            destinations + [str(root / "dst" / "missing.bin")]
+        )
+        assert sorted(collected_stats) == sorted(destinations)
+        for dst in destinations:
+            stat = transferred_stats[dst]
+            assert stat.st_size == collected_stats[dst].st_size
+            assert source_hash_from_stat(dst, stat) == source_hash(dst)
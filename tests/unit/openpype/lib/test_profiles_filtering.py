@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Test suite for compiled profiles filtering.
+
+Compiled profiles must return the same profile as 'filter_profiles'.
+"""
+import random
+
+from openpype.lib.profiles_filtering import (
+    filter_profiles,
+    CompiledProfiles,
+    get_compiled_profiles,
+)
+from openpype.settings.cache import ReadOnlyList
+
+HOSTS = ["maya", "nuke", "houdini", "", None]
+FAMILIES = ["render", "review", "model", "renderLayer", "plate", ""]
+TASKS = ["comp", "Compositing", "animation", "lookdev", None]
+FILTER_VALUES = {
+    "hosts": [["maya"], ["nuke", "houdini"], ["*"], [], "maya"],
+    "families": [
+        ["render"], ["render.*"], ["re.*", "model"], ["plate"], ["*"], [],
+        ["render", "review"]
+    ],
+    "task_names": [["comp"], ["[Cc]omp.*"], ["anim.*"], [], None],
+    "task_types": [["Compositing"], [], ["Anim.*", "lookdev"]],
+}
+
+
+def _random_profiles(rand, count):
+    profiles = []
+    for idx in range(count):
+        profile = {"idx": idx}
+        for key, values in FILTER_VALUES.items():
+            if rand.random() < 0.3:
+                continue
+            profile[key] = rand.choice(values)
+        profiles.append(profile)
+    return profiles
+
+
+def _random_key_values(rand):
+    return {
+        "hosts": rand.choice(HOSTS),
+        "families": rand.choice(FAMILIES),
+        "task_names": rand.choice(TASKS),
+        "task_types": rand.choice(TASKS),
+    }
+
+
+def test_compiled_profiles_randomized():
+    rand = random.Random(0)
+    keys_orders = [
+        None,
+        ["task_types", "task_names"],
+        ["families", "hosts", "task_names", "task_types"],
+    ]
+    for _ in range(100):
+        profiles = _random_profiles(rand, rand.randint(0, 20))
+        compiled = CompiledProfiles(profiles)
+        for _ in range(30):
+            key_values = _random_key_values(rand)
+            keys_order = rand.choice(keys_orders)
+            expected = filter_profiles(profiles, key_values, keys_order)
+            result = compiled.filter(key_values, keys_order)
+            assert result is expected, "Not matching"
+            # Second call uses cached result
+            assert compiled.filter(key_values, keys_order) is expected
+
+
+def test_compiled_profiles_ties():
+    profiles = [
+        {"hosts": [], "families": ["render"]},
+        {"hosts": ["nuke"], "families": []},
+        {"hosts": ["nuke"], "families": ["render"], "id": 1},
+        {"hosts": ["nuke"], "families": ["ren.*"], "id": 2},
+    ]
+    compiled = CompiledProfiles(profiles)
+    key_values = {"hosts": "nuke", "families": "render"}
+    assert compiled.filter(key_values)["id"] == 1
+    assert compiled.filter(key_values) is filter_profiles(
+        profiles, key_values
+    )
+
+    key_values = {"hosts": "nuke", "families": "model"}
+    for keys_order in (["hosts", "families"], ["families", "hosts"]):
+        assert compiled.filter(key_values, keys_order) is profiles[1]
+        assert filter_profiles(compiled, key_values, keys_order) is (
+            filter_profiles(profiles, key_values, keys_order)
+        )
+
+
+def test_compiled_profiles_empty_value():
+    profiles = [
+        {"task_names": ["comp"]},
+        {"task_names": ["*"], "id": 1},
+    ]
+    compiled = CompiledProfiles(profiles)
+    for value in (None, ""):
+        key_values = {"task_names": value}
+        assert compiled.filter(key_values)["id"] == 1
+        assert compiled.filter(key_values) is filter_profiles(
+            profiles, key_values
+        )
+
+
+def test_compiled_profiles_empty():
+    assert CompiledProfiles([]).filter({"hosts": "nuke"}) is None
+    assert CompiledProfiles(None).filter({"hosts": "nuke"}) is None
+
+
+def test_get_compiled_profiles_shared():
+    profiles = ReadOnlyList([{"hosts": ["nuke"]}])
+    compiled = get_compiled_profiles(profiles)
+    assert isinstance(compiled, CompiledProfiles)
+    assert get_compiled_profiles(profiles) is compiled
+    assert get_compiled_profiles(compiled) is compiled
+    assert get_compiled_profiles(ReadOnlyList(profiles)) is not compiled
+
+
+def test_get_compiled_profiles_mutable():
+    profiles = [{"hosts": ["nuke"]}]
+    assert get_compiled_profiles(profiles) is profiles
+    assert filter_profiles(
+        get_compiled_profiles(profiles), {"hosts": "nuke"}
+    ) is profiles[0]
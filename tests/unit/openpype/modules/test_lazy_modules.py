@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Test suite for lazy loading of OpenPype modules."""
+import sys
+
+import pytest
+
+from openpype.modules import base
+
+
+@pytest.fixture
+def lazy_modules(monkeypatch):
+    """Load modules lazily and restore previously loaded modules after."""
+
+    # Addon paths from studio settings are not needed
+    monkeypatch.setattr(base, "get_dynamic_modules_dirs", lambda: [])
+
+    def _pop_modules():
+        return {
+            name: sys.modules.pop(name)
+            for name in tuple(sys.modules.keys())
+            if (
+                name == "openpype_modules"
+                or name.startswith("openpype_modules.")
+            )
+        }
+
+    # Modules imported by previous tests would be used without lazy loading
+    orig_modules = _pop_modules()
+    orig_meta_path = list(sys.meta_path)
+
+    base.load_modules(force=True, lazy=True)
+    yield sys.modules["openpype_modules"]
+
+    _pop_modules()
+    sys.modules.update(orig_modules)
+    sys.meta_path[:] = orig_meta_path
+    monkeypatch.setattr(base._LoadCache, "modules_loaded", False)
+
+
+def test_lazy_submodule_import(lazy_modules):
+    assert "deadline" in lazy_modules.get_lazy_names()
+    assert lazy_modules.__spec__ is None
+
+    from openpype_modules.deadline.abstract_submit_deadline import (
+        requests_get,
+    )
+    import openpype_modules.clockify.constants  # noqa: F401
+
+    assert "deadline" not in lazy_modules.get_lazy_names()
+    assert requests_get.__module__ == (
+        "openpype_modules.deadline.abstract_submit_deadline"
+    )
+    assert lazy_modules.clockify.constants is (
+        sys.modules["openpype_modules.clockify.constants"]
+    )
+
+
+class _ManagerStandIn(object):
+    def __init__(self, modules):
+        self.requested = []
+        self._modules = modules
+        self.modules_by_name = base._ModulesByName(self)
+
+    def get(self, module_name, default=None):
+        self.requested.append(module_name)
+        module = self._modules.get(module_name)
+        if module is None:
+            return default
+        self.modules_by_name[module_name] = module
+        return module
+
+
+def test_modules_by_name_initializes_on_access():
+    module = object()
+    manager = _ManagerStandIn({"ftrack": module})
+    modules_by_name = manager.modules_by_name
+
+    assert "ftrack" not in modules_by_name
+    assert modules_by_name["ftrack"] is module
+    assert modules_by_name.get("ftrack") is module
+    assert manager.requested == ["ftrack"]
+
+    assert modules_by_name.get("missing") is None
+    with pytest.raises(KeyError):
+        modules_by_name["missing"]
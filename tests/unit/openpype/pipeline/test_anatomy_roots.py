@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Test suite for indexed lookup of anatomy roots."""
+import pytest
+
+from openpype.pipeline.anatomy import Roots, RootsIndex
+
+ROOTS_DATA = {
+    "work": {
+        "windows": "P:/Projects/Work",
+        "linux": "/mnt/a",
+        "darwin": "/Volumes/a"
+    },
+    "publish": {
+        "windows": "p:\\PROJECTS\\publish\\",
+        "linux": "/mnt/ab",
+        "darwin": "/Volumes/ab"
+    },
+    "studio": {
+        "cache": {
+            "windows": "C:/Cache",
+            "linux": "/mnt/cache",
+            "darwin": ""
+        },
+        "backup": {
+            "windows": "C:/Cache",
+            "linux": "/mnt/cache",
+            "darwin": "/Volumes/cache"
+        }
+    }
+}
+PATHS = [
+    "/mnt/a/project/file.ext",
+    "/mnt/ab/project/file.ext",
+    "/mnt/abc/project/file.ext",
+    "/mnt/cache/project/file.ext",
+    "/mnt/other/project/file.ext",
+    "P:/Projects/Work/project/file.ext",
+    "p:/projects/work/project/file.ext",
+    "P:\\PROJECTS\\PUBLISH\\project\\file.ext",
+    "c:\\cache\\project\\file.ext",
+    "/Volumes/ab/project/file.ext",
+    "/Volumes/cache/project/file.ext",
+    "/volumes/a/project/file.ext",
+]
+
+
+class _Anatomy(dict):
+    project_name = "test_project"
+
+
+def _create_roots(roots_data):
+    return Roots(_Anatomy(roots=roots_data))
+
+
+def _looped_roots(roots):
+    # Roots which are not the instance roots are found by iteration
+    return dict(roots.roots)
+
+
+@pytest.fixture(params=[False, True], ids=["ordered", "reversed"])
+def roots(request):
+    roots_data = ROOTS_DATA
+    if request.param:
+        # Order of roots decides which of prefixed roots is used
+        roots_data = dict(reversed(list(ROOTS_DATA.items())))
+    return _create_roots(roots_data)
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_find_root_template_matches_loop(roots, path):
+    expected = roots.find_root_template_from_path(
+        path, _looped_roots(roots)
+    )
+    assert roots.find_root_template_from_path(path) == expected
+    assert RootsIndex(roots.roots).find_root_template_from_path(
+        path
+    ) == expected
+
+
+def test_find_root_templates_from_paths_matches_loop(roots):
+    looped_roots = _looped_roots(roots)
+    expected = [
+        roots.find_root_template_from_path(path, looped_roots)
+        for path in PATHS
+    ]
+    assert roots.find_root_templates_from_paths(PATHS) == expected
+
+
+def test_prefixed_roots_follow_roots_order():
+    roots = _create_roots(ROOTS_DATA)
+    assert roots.find_root_template_from_path("/mnt/ab/file.ext") == (
+        True, "{root[work]}b/file.ext"
+    )
+
+    reversed_data = dict(reversed(list(ROOTS_DATA.items())))
+    roots = _create_roots(reversed_data)
+    assert roots.find_root_template_from_path("/mnt/ab/file.ext") == (
+        True, "{root[publish]}/file.ext"
+    )
+
+
+def test_windows_values_case_insensitive(roots):
+    assert roots.find_root_template_from_path(
+        "p:/PROJECTS/work/file.ext"
+    ) == (True, "{root[work]}/file.ext")
+    # Other platform values are case sensitive
+    assert roots.find_root_template_from_path(
+        "/MNT/a/file.ext"
+    ) == (False, "/MNT/a/file.ext")
+
+
+@pytest.mark.parametrize("dst_platform", [None, "windows", "linux", "darwin"])
+@pytest.mark.parametrize("path", PATHS)
+def test_path_remapper_matches_loop(roots, path, dst_platform):
+    expected = roots.path_remapper(
+        path, dst_platform, roots=_looped_roots(roots)
+    )
+    assert roots.path_remapper(path, dst_platform) == expected
+
+
+def test_path_remapper_falls_back_to_next_root():
+    roots = _create_roots(ROOTS_DATA)
+    path = "/mnt/cache/project/file.ext"
+    # First matching root "cache" does not have darwin value
+    assert roots.path_remapper(path, "darwin") == (
+        "/Volumes/cache/project/file.ext"
+    )
+    assert roots.path_remapper(path, "darwin") == roots.path_remapper(
+        path, "darwin", roots=_looped_roots(roots)
+    )
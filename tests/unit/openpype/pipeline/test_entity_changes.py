@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Test suite for listener of database changes."""
+import threading
+
+import pytest
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
+
+mongomock = pytest.importorskip("mongomock")
+
+from openpype.client import mongo  # noqa: E402
+from openpype.lib import register_event_callback  # noqa: E402
+from openpype.pipeline.anatomy import Anatomy  # noqa: E402
+from openpype.pipeline.entity_changes import (  # noqa: E402
+    EntityChangesListener,
+)
+from openpype.settings.handlers import CacheValues  # noqa: E402
+
+PROJECT_NAME = "test_entity_changes"
+
+
+class _ChangeStream(object):
+    def __init__(self, changes, opened):
+        self._changes = changes
+        self._opened = opened
+
+    def __enter__(self):
+        self._opened.set()
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def try_next(self):
+        if self._changes:
+            return self._changes.pop(0)
+        return None
+
+
+class _ClientStandIn(object):
+    """Mongo client with change streams on top of 'mongomock' client.
+
+    Change streams are not available if 'changes' are not passed.
+    """
+
+    def __init__(self, changes=None):
+        self._client = mongomock.MongoClient()
+        self._changes = changes
+        self.stream_opened = threading.Event()
+
+    def __getitem__(self, name):
+        return self._client[name]
+
+    def watch(self, *args, **kwargs):
+        if self._changes is None:
+            raise OperationFailure(
+                "The $changeStream stage is only supported on replica sets"
+            )
+        return _ChangeStream(self._changes, self.stream_opened)
+
+
+@pytest.fixture
+def client_stand_in(monkeypatch):
+    def _create(changes=None):
+        client = _ClientStandIn(changes)
+        monkeypatch.setattr(
+            mongo.OpenPypeMongoConnection,
+            "get_mongo_client",
+            classmethod(lambda cls, mongo_url=None: client)
+        )
+        monkeypatch.setenv("AVALON_DB", "avalon")
+        monkeypatch.setenv("OPENPYPE_DATABASE_NAME", "openpype")
+        return client
+    return _create
+
+
+class EventsRecorder(object):
+    def __init__(self, topic):
+        self.events = []
+        self.received = threading.Event()
+        # Keep reference to callback so weak reference stays valid
+        self._callback = register_event_callback(topic, self._on_event)
+
+    def _on_event(self, event):
+        self.events.append(event)
+        self.received.set()
+
+    def deregister(self):
+        self._callback.deregister()
+
+
+def test_change_stream_events_and_lifetimes(client_stand_in):
+    version_id = ObjectId()
+    changes = [{
+        "operationType": "insert",
+        "ns": {"db": "avalon", "coll": PROJECT_NAME},
+        "documentKey": {"_id": version_id},
+        "fullDocument": {"_id": version_id, "type": "version"},
+    }]
+    client = client_stand_in(changes)
+    orig_lifetimes = (Anatomy.cache_lifetime, CacheValues.cache_lifetime)
+    recorder = EventsRecorder("entity.version.created")
+
+    listener = EntityChangesListener(cache_lifetime=321)
+    listener.start()
+    try:
+        assert client.stream_opened.wait(5)
+        assert recorder.received.wait(5)
+        assert listener.mode == "change_stream"
+        assert Anatomy.cache_lifetime == 321
+        assert CacheValues.cache_lifetime == 321
+    finally:
+        listener.stop()
+        recorder.deregister()
+
+    assert recorder.events[0]["entity_id"] == version_id
+    assert recorder.events[0]["project_name"] == PROJECT_NAME
+    assert (
+        (Anatomy.cache_lifetime, CacheValues.cache_lifetime)
+        == orig_lifetimes
+    )
+
+
+def test_polling_does_not_extend_lifetimes(client_stand_in):
+    client = client_stand_in()
+    collection = client["avalon"][PROJECT_NAME]
+    collection.insert_one({"type": "project", "name": PROJECT_NAME})
+    orig_lifetimes = (Anatomy.cache_lifetime, CacheValues.cache_lifetime)
+    recorder = EventsRecorder("entity.version.created")
+
+    listener = EntityChangesListener(poll_interval=0.05, cache_lifetime=321)
+    listener.start()
+    try:
+        # Versions created before first poll are not reported
+        version_ids = []
+        while not recorder.received.wait(0.2) and len(version_ids) < 25:
+            version_ids.append(
+                collection.insert_one({"type": "version"}).inserted_id
+            )
+        assert recorder.received.is_set()
+        assert listener.mode == "polling"
+        assert (
+            (Anatomy.cache_lifetime, CacheValues.cache_lifetime)
+            == orig_lifetimes
+        )
+    finally:
+        listener.stop()
+        recorder.deregister()
+
+    received_ids = [event["entity_id"] for event in recorder.events]
+    assert set(received_ids).issubset(version_ids)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cache of publish plugins discovery."""
+import os
+import sys
+
+import pyblish.api
+import pytest
+
+from openpype.pipeline.publish import discover_cache
+from openpype.pipeline.publish.discover_cache import PublishPluginsCache
+from openpype.pipeline.publish.lib import publish_plugins_discover
+
+PLUGIN_TEMPLATE = """import pyblish.api
+
+
+class {name}(pyblish.api.InstancePlugin):
+    order = pyblish.api.CollectorOrder
+    label = "{label}"
+    hosts = {hosts}
+    families = {families}
+
+    def process(self, instance):
+        pass
+"""
+HOST_NAME = "test_discover_host"
+
+
+def _write_plugin(dirpath, filename, name, hosts, families, label="A"):
+    filepath = os.path.join(dirpath, filename)
+    with open(filepath, "w") as stream:
+        stream.write(PLUGIN_TEMPLATE.format(
+            name=name, label=label, hosts=hosts, families=families
+        ))
+    return filepath
+
+
+@pytest.fixture
+def plugins_dir(tmp_path, monkeypatch):
+    """Directory with publish plugins and isolated discovery cache."""
+
+    dirpath = tmp_path / "plugins"
+    dirpath.mkdir()
+    dirpath = str(dirpath)
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setattr(
+        discover_cache._GlobalCache, "_cache",
+        PublishPluginsCache(cache_dir)
+    )
+    _write_plugin(dirpath, "collect_any.py", "CollectAny", ["*"], ["*"])
+    _write_plugin(
+        dirpath, "collect_other_host.py", "CollectOtherHost",
+        ["other_host"], ["*"]
+    )
+    _write_plugin(
+        dirpath, "collect_render.py", "CollectRender", ["*"], ["render"]
+    )
+    with open(os.path.join(dirpath, "broken.py"), "w") as stream:
+        stream.write("raise RuntimeError('Broken plugin')\n")
+
+    pyblish.api.register_host(HOST_NAME)
+    modules_before = set(sys.modules.keys())
+    yield dirpath
+
+    pyblish.api.deregister_host(HOST_NAME)
+    for name in set(sys.modules.keys()) - modules_before:
+        if name.startswith(dirpath):
+            sys.modules.pop(name)
+
+
+def _discover(dirpath, families=None, new_cache=False):
+    if new_cache:
+        # Records are loaded from cache directory
+        cache = discover_cache.get_publish_plugins_cache()
+        discover_cache._GlobalCache._cache = PublishPluginsCache(
+            cache.cache_dir
+        )
+    return publish_plugins_discover([dirpath], families=families)
+
+
+def _plugin_names(result):
+    return sorted(plugin.__name__ for plugin in result.plugins)
+
+
+def test_host_incompatible_file_skipped(plugins_dir):
+    result = _discover(plugins_dir)
+    # Files without manifest are executed
+    assert result.skipped_file_paths == []
+    assert _plugin_names(result) == ["CollectAny", "CollectRender"]
+
+    result = _discover(plugins_dir, new_cache=True)
+    assert result.skipped_file_paths == [
+        os.path.join(plugins_dir, "collect_other_host.py")
+    ]
+    assert _plugin_names(result) == ["CollectAny", "CollectRender"]
+
+
+def test_edited_file_recompiled(plugins_dir):
+    _discover(plugins_dir)
+
+    filepath = _write_plugin(
+        plugins_dir, "collect_other_host.py", "CollectOtherHost",
+        [HOST_NAME], ["*"], label="Edited"
+    )
+    # Make sure modification time changed
+    stat = os.stat(filepath)
+    os.utime(filepath, (stat.st_atime, stat.st_mtime + 10))
+
+    result = _discover(plugins_dir, new_cache=True)
+    assert result.skipped_file_paths == []
+    plugins_by_name = {plugin.__name__: plugin for plugin in result.plugins}
+    assert plugins_by_name["CollectOtherHost"].label == "Edited"
+
+
+def test_file_skipped_by_families(plugins_dir):
+    _discover(plugins_dir)
+
+    result = _discover(plugins_dir, families=["model"])
+    assert sorted(result.skipped_file_paths) == [
+        os.path.join(plugins_dir, "collect_other_host.py"),
+        os.path.join(plugins_dir, "collect_render.py"),
+    ]
+    assert _plugin_names(result) == ["CollectAny"]
+
+    result = _discover(plugins_dir, families=["render"])
+    assert _plugin_names(result) == ["CollectAny", "CollectRender"]
+
+
+def test_crashed_file_not_in_manifest(plugins_dir):
+    broken_path = os.path.join(plugins_dir, "broken.py")
+    result = _discover(plugins_dir)
+    assert list(result.crashed_file_paths) == [broken_path]
+
+    cache = discover_cache.get_publish_plugins_cache()
+    assert cache.get_record(broken_path).manifest is None
+
+    # Crashed file is executed again and is not skipped
+    result = _discover(plugins_dir, new_cache=True)
+    assert list(result.crashed_file_paths) == [broken_path]
+    assert broken_path not in result.skipped_file_paths
+
+
+def test_cache_dir_by_openpype_version(monkeypatch):
+    monkeypatch.setattr(
+        discover_cache.openpype.version, "__version__", "1.2.3"
+    )
+    cache_dir = discover_cache.get_publish_plugins_cache_dir()
+    assert os.path.basename(os.path.dirname(cache_dir)) == "1.2.3"
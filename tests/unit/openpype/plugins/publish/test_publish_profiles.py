@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Test suite for compiled profiles used by publish plugins."""
+import pyblish.api
+import pytest
+
+from openpype.lib.profiles_filtering import CompiledProfiles
+from openpype.modules import base as modules_base
+from openpype.pipeline.publish import lib as publish_lib
+from openpype.plugins.publish import extract_burnin
+from openpype.plugins.publish.extract_burnin import ExtractBurnin
+from openpype.plugins.publish.integrate import IntegrateAsset
+from openpype.settings import lib as settings_lib
+from openpype.settings.cache import ReadOnlyList, freeze_settings
+from openpype.settings.constants import PROJECT_SETTINGS_KEY
+
+PROJECT_NAME = "test_publish_profiles"
+
+
+class _FilterProfilesSpy(object):
+    def __init__(self):
+        self.profiles = []
+
+    def __call__(self, profiles, *args, **kwargs):
+        self.profiles.append(profiles)
+        return None
+
+
+@pytest.fixture
+def project_settings(monkeypatch):
+    # Addon paths from studio settings are not needed
+    monkeypatch.setattr(modules_base, "get_dynamic_modules_dirs", lambda: [])
+    defaults = settings_lib.get_default_settings()[PROJECT_SETTINGS_KEY]
+    settings_lib.clear_metadata_from_settings(defaults)
+    defaults["global"]["tools"]["publish"]["template_name_profiles"] = [
+        {"families": ["render"], "template_name": "render"}
+    ]
+    settings = freeze_settings(defaults)
+
+    def get_project_settings(project_name, read_only=False):
+        if read_only:
+            return settings
+        return settings.copy()
+
+    monkeypatch.setattr(
+        publish_lib, "get_project_settings", get_project_settings
+    )
+    monkeypatch.setenv("AVALON_PROJECT", PROJECT_NAME)
+    return settings
+
+
+def _create_instance(host_name):
+    context = pyblish.api.Context()
+    context.data["projectName"] = PROJECT_NAME
+    context.data["hostName"] = host_name
+    instance = context.create_instance("renderMain")
+    instance.data.update({
+        "family": "render",
+        "subset": "renderMain",
+        "anatomyData": {
+            "family": "render",
+            "task": {"name": "comp", "type": "Compositing"},
+        },
+    })
+    return instance
+
+
+def test_extract_burnin_filters_compiled_profiles(
+    project_settings, monkeypatch
+):
+    # Restore attributes of plugin changed by settings
+    burnin_settings = project_settings["global"]["publish"]["ExtractBurnin"]
+    for option in burnin_settings.keys():
+        monkeypatch.setattr(
+            ExtractBurnin, option, getattr(ExtractBurnin, option, None),
+            raising=False
+        )
+    monkeypatch.setattr(
+        pyblish.api, "current_host", lambda: "traypublisher"
+    )
+    filter_spy = _FilterProfilesSpy()
+    monkeypatch.setattr(extract_burnin, "filter_profiles", filter_spy)
+
+    plugins = [ExtractBurnin]
+    publish_lib.filter_pyblish_plugins(plugins)
+    assert plugins == [ExtractBurnin]
+    assert isinstance(ExtractBurnin.profiles, ReadOnlyList)
+    # Other values are mutable copies
+    assert type(ExtractBurnin.options) is dict
+
+    plugin = ExtractBurnin()
+    for _ in range(2):
+        plugin.main_process(_create_instance("traypublisher"))
+
+    first, second = filter_spy.profiles
+    assert isinstance(first, CompiledProfiles)
+    assert second is first
+
+
+def test_integrate_template_name_uses_compiled_profiles(
+    project_settings, monkeypatch
+):
+    filter_spy = _FilterProfilesSpy()
+    monkeypatch.setattr(publish_lib, "filter_profiles", filter_spy)
+
+    plugin = IntegrateAsset()
+    for _ in range(2):
+        template_name = plugin.get_template_name(
+            _create_instance("traypublisher")
+        )
+        assert template_name == publish_lib.DEFAULT_PUBLISH_TEMPLATE
+
+    first, second = filter_spy.profiles
+    assert isinstance(first, CompiledProfiles)
+    assert second is first
+    assert first.profiles_data is (
+        project_settings["global"]["tools"]["publish"]
+        ["template_name_profiles"]
+    )
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Test suite for bundle of default settings."""
+import os
+import json
+
+from openpype.settings import lib
+from openpype.settings.lib import load_default_settings_sources
+
+
+def _write_json(filepath, data):
+    with open(filepath, "w") as stream:
+        json.dump(data, stream)
+
+
+def test_bundle_reused_until_sources_change(tmpdir, monkeypatch):
+    defaults_dir = tmpdir.mkdir("defaults")
+    filepath = str(defaults_dir.join("general.json"))
+    _write_json(filepath, {"value": 1})
+    bundle_path = str(tmpdir.join("bundle", "defaults.bin"))
+    source_paths = [str(defaults_dir)]
+
+    data = load_default_settings_sources(source_paths, bundle_path)
+    assert data[source_paths[0]] == {"general": {"value": 1}}
+    assert os.path.exists(bundle_path)
+
+    # Bundle is used without loading the sources
+    def _load_source(source_path):
+        raise AssertionError("Source should not be loaded")
+
+    with monkeypatch.context() as context:
+        context.setattr(lib, "_load_defaults_source", _load_source)
+        assert load_default_settings_sources(
+            source_paths, bundle_path
+        ) == data
+
+    # Changed file invalidates the bundle
+    _write_json(filepath, {"value": 12})
+    stat = os.stat(filepath)
+    os.utime(filepath, (stat.st_atime, stat.st_mtime + 10))
+    data = load_default_settings_sources(source_paths, bundle_path)
+    assert data[source_paths[0]] == {"general": {"value": 12}}
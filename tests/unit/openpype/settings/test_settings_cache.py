@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cache of merged settings."""
+from openpype.settings import cache
+from openpype.settings.cache import MergedSettingsCache
+
+
+def test_stamp_lifetime(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+
+    settings_cache = MergedSettingsCache()
+    assert settings_cache.get_stamp("project", "prj", 10) is None
+
+    settings_cache.set_stamp("project", "prj", ("stamp", 1))
+    now[0] += 10
+    assert settings_cache.get_stamp("project", "prj", 10) == ("stamp", 1)
+    assert settings_cache.get_stamp("project", "prj", 10, True) is None
+
+    now[0] += 1
+    assert settings_cache.get_stamp("project", "prj", 10) is None
+
+
+def test_clear_stamps():
+    settings_cache = MergedSettingsCache()
+    settings_cache.set_stamp("project", "prj", 1)
+    settings_cache.set_stamp("project", "other", 2)
+    settings_cache.set_stamp("system", None, 3)
+
+    settings_cache.clear("prj")
+    assert settings_cache.get_stamp("project", "prj", 10) is None
+    assert settings_cache.get_stamp("project", "other", 10) == 2
+
+    settings_cache.clear_stamps()
+    assert settings_cache.get_stamp("project", "other", 10) is None
+    assert settings_cache.get_stamp("system", None, 10) is None
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Test suite for merging of settings overrides over shared defaults."""
+import copy
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.cache import ReadOnlyDict
+from openpype.settings.constants import (
+    M_OVERRIDDEN_KEY,
+    M_DYNAMIC_KEY_LABEL,
+    SYSTEM_SETTINGS_KEY,
+    PROJECT_SETTINGS_KEY,
+    DEFAULT_PROJECT_KEY,
+)
+
+STUDIO_SYSTEM_OVERRIDES = {
+    "applications": {
+        "maya": {
+            "enabled": False,
+            "variants": {
+                M_OVERRIDDEN_KEY: ["2023"],
+                "2023": {
+                    "use_python_2": False,
+                    "executables": {
+                        "windows": [],
+                        "darwin": [],
+                        "linux": ["/opt/maya2023/bin/maya"]
+                    },
+                    "arguments": {
+                        "windows": [],
+                        "darwin": [],
+                        "linux": []
+                    },
+                    "environment": {}
+                },
+                M_DYNAMIC_KEY_LABEL: {"2023": "2023"}
+            }
+        }
+    }
+}
+STUDIO_PROJECT_OVERRIDES = {
+    "global": {
+        "publish": {
+            "ExtractBurnin": {"enabled": False}
+        },
+        M_OVERRIDDEN_KEY: ["project_environments"],
+        "project_environments": {"STUDIO": "1"}
+    }
+}
+PROJECT_OVERRIDES = {
+    "global": {
+        "publish": {
+            "ExtractBurnin": {
+                M_OVERRIDDEN_KEY: ["profiles"],
+                "profiles": [{
+                    "families": [],
+                    "hosts": ["nuke"],
+                    "burins": {M_DYNAMIC_KEY_LABEL: {}}
+                }]
+            }
+        }
+    }
+}
+LOCAL_SETTINGS = {
+    "applications": {
+        "maya": {"2023": {"executable": "/local/maya"}}
+    },
+    "projects": {
+        DEFAULT_PROJECT_KEY: {"active_site": "local"}
+    }
+}
+
+
+def _merge_with_copies(source, overrides, clear_metadata):
+    """Merge implementation which copies whole tree."""
+    result = lib.merge_overrides(
+        copy.deepcopy(source), copy.deepcopy(overrides)
+    )
+    if clear_metadata:
+        lib.clear_metadata_from_settings(result)
+    return result
+
+
+@pytest.fixture
+def overrides(monkeypatch):
+    monkeypatch.setattr(
+        lib, "get_studio_system_settings_overrides",
+        lambda: copy.deepcopy(STUDIO_SYSTEM_OVERRIDES)
+    )
+    monkeypatch.setattr(
+        lib, "get_studio_project_settings_overrides",
+        lambda: copy.deepcopy(STUDIO_PROJECT_OVERRIDES)
+    )
+    monkeypatch.setattr(
+        lib, "get_project_settings_overrides",
+        lambda project_name: copy.deepcopy(PROJECT_OVERRIDES)
+    )
+    monkeypatch.setattr(
+        lib, "get_local_settings", lambda: copy.deepcopy(LOCAL_SETTINGS)
+    )
+    monkeypatch.setattr(lib.platform, "system", lambda: "Linux")
+
+
+@pytest.mark.parametrize("clear_metadata", [True, False])
+@pytest.mark.parametrize("exclude_locals", [True, False])
+def test_project_settings_match_copied_merge(
+    overrides, clear_metadata, exclude_locals
+):
+    defaults = lib.get_default_settings()[PROJECT_SETTINGS_KEY]
+    expected = _merge_with_copies(
+        lib.merge_overrides(
+            copy.deepcopy(defaults), copy.deepcopy(STUDIO_PROJECT_OVERRIDES)
+        ),
+        PROJECT_OVERRIDES,
+        clear_metadata
+    )
+    if not exclude_locals:
+        lib.apply_local_settings_on_project_settings(
+            expected, LOCAL_SETTINGS, "test_project"
+        )
+
+    result = lib._get_project_settings(
+        "test_project", clear_metadata, exclude_locals
+    )
+    assert lib.unfreeze_settings(result) == expected
+
+
+@pytest.mark.parametrize("clear_metadata", [True, False])
+@pytest.mark.parametrize("exclude_locals", [True, False])
+def test_system_settings_match_copied_merge(
+    overrides, clear_metadata, exclude_locals
+):
+    defaults = lib.get_default_settings()[SYSTEM_SETTINGS_KEY]
+    expected = _merge_with_copies(
+        defaults, STUDIO_SYSTEM_OVERRIDES, clear_metadata
+    )
+    if not exclude_locals:
+        lib.apply_local_settings_on_system_settings(expected, LOCAL_SETTINGS)
+        assert (
+            expected["applications"]["maya"]["variants"]["2023"]
+            ["executables"][0] == "/local/maya"
+        )
+
+    result = lib._get_system_settings(clear_metadata, exclude_locals)
+    assert lib.unfreeze_settings(result) == expected
+
+
+def test_untouched_values_are_shared(overrides):
+    defaults_tree = lib._get_default_settings_tree(True)
+    assert isinstance(defaults_tree, ReadOnlyDict)
+    assert lib._get_default_settings_tree(True) is defaults_tree
+
+    result = lib._get_project_settings("test_project", True, False)
+    default_global = defaults_tree[PROJECT_SETTINGS_KEY]["global"]
+    assert result["global"] is not default_global
+    assert result["global"]["tools"] is default_global["tools"]
+    assert (
+        result["global"]["publish"]["ExtractReview"]
+        is default_global["publish"]["ExtractReview"]
+    )
+    # Local settings are applied without modification of shared defaults
+    assert result["global"]["sync_server"]["config"]["active_site"] == (
+        "local"
+    )
+    assert default_global["sync_server"]["config"]["active_site"] == (
+        "studio"
+    )